@@ -0,0 +1,95 @@
+"""
+Compare the throughput of the sync and async views under concurrent clients.
+
+Both apps are served by a threaded WSGI server on the same database, and every client
+thread requests the project list and the tasks of a project in a loop. In-memory SQLite
+cannot be shared with the async engine, so a temporary file is used unless
+``BENCH_DATABASE_URL`` points to a file or a server.
+
+Usage: ``python -m benchmarks.bench_async --clients 16 --requests 50``
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+
+import requests
+
+from benchmarks.common import (
+    BENCH_DATABASE_URL, as_admin, create_bench_app, create_project, db, latency_stats, report, serving
+)
+from main import create_app
+from repositories.task_repository import TaskRepository
+
+
+def seed(database_url: str, tasks: int) -> int:
+    app = create_bench_app(database_url)
+    with as_admin(app):
+        project = create_project()
+        TaskRepository(db_session=db.session).create_many([
+            {"name": f"Task {index}", "description": "Benchmark task", "project_id": project.id, "created_by": 1}
+            for index in range(tasks)
+        ])
+        return project.id
+
+
+def run_clients(base_url: str, paths: list[str], clients: int, requests_per_client: int) -> dict[str, float]:
+    latencies, errors = [], []
+
+    def client():
+        with requests.Session() as session:
+            for index in range(requests_per_client):
+                start = time.perf_counter()
+                response = session.get(base_url + paths[index % len(paths)])
+                latencies.append(time.perf_counter() - start)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {**latency_stats(latencies, elapsed), "errors": len(errors)}
+
+
+def serve(database_url: str, async_views: bool, paths: list[str], clients: int, requests_per_client: int):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "RESPONSE_CACHE_ENABLED": False,
+        "ASYNC_VIEWS": async_views,
+    })
+    with serving(app) as base_url:
+        return run_clients(base_url, paths, clients, requests_per_client)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=50, help="requests per client")
+    parser.add_argument("--tasks", type=int, default=100)
+    args = parser.parse_args()
+
+    database_url = BENCH_DATABASE_URL
+    if database_url in ("sqlite://", "sqlite:///:memory:"):
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+    project_id = seed(database_url, args.tasks)
+    paths = ["/projects/", f"/projects/{project_id}/tasks"]
+    sync = serve(database_url, False, paths, args.clients, args.requests)
+    async_ = serve(database_url, True, paths, args.clients, args.requests)
+
+    report("async", {
+        "clients": args.clients,
+        "requests_per_client": args.requests,
+        "sync": sync,
+        "async": async_,
+        "speedup": async_["requests_per_second"] / sync["requests_per_second"],
+    })
+
+
+if __name__ == '__main__':
+    main()
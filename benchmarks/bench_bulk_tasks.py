@@ -0,0 +1,57 @@
+"""
+Compare task creation throughput of the per-item path against the bulk endpoint path.
+
+Usage: ``python -m benchmarks.bench_bulk_tasks --tasks 500``
+"""
+import argparse
+
+from benchmarks.common import as_admin, create_bench_app, create_project, db, measure, report
+from repositories.task_repository import TaskRepository
+from resources.request.task_request import TaskRequest
+from services.task.task_service import TaskService
+
+
+def make_items(count: int) -> list[dict[str, str]]:
+    return [
+        {
+            "name": f"Task {index}",
+            "description": "Benchmark task",
+            "start_date": "2025-10-29 14:22:11.949",
+            "due_date": "2026-10-29 14:22:11.949",
+        }
+        for index in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    items = make_items(args.tasks)
+    with as_admin(app):
+        project = create_project()
+        service = TaskService(repository=TaskRepository(db_session=db.session))
+
+        per_item = measure(
+            lambda: [
+                service.create_task(project_id=project.id, body=TaskRequest.model_validate(item)) for item in items
+            ],
+            repeat=args.repeat
+        )
+        bulk = measure(lambda: service.create_tasks(project_id=project.id, items=items), repeat=args.repeat)
+
+    report("bulk_tasks", {
+        "tasks": args.tasks,
+        "per_item_seconds": per_item,
+        "bulk_seconds": bulk,
+        "per_item_tasks_per_second": args.tasks / per_item["median"],
+        "bulk_tasks_per_second": args.tasks / bulk["median"],
+        "speedup": per_item["median"] / bulk["median"],
+    })
+
+
+if __name__ == '__main__':
+    main()
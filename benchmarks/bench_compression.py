@@ -0,0 +1,70 @@
+"""
+Measure the CPU cost and the size reduction of each response encoding at a few levels.
+
+The payloads are the ones of ``bench_json``, encoded by the JSON provider of the app. Each
+body is compressed whole, as the complete responses are, and the task list is also
+compressed as the chunks of ``stream_json``, flushed one by one as the streamed responses are.
+
+Usage: ``python -m benchmarks.bench_compression --rows 10000``
+"""
+import argparse
+
+from flask import Flask
+
+from benchmarks.bench_json import payloads
+from benchmarks.common import measure, report
+from helpers.json_provider import create_json_provider
+from helpers.streaming import stream_json
+from settings.compression import COMPRESSORS, compress, compress_chunks
+from settings.config import Config
+
+LEVELS = {"gzip": (1, 6, 9), "br": (1, 4, 7, 9), "zstd": (1, 3, 9, 15)}
+
+
+def measure_encoding(encode, size: int, repeat: int) -> dict[str, float]:
+    compressed = len(encode())
+    seconds = measure(encode, repeat=repeat)["median"]
+    return {
+        "bytes": compressed,
+        "ratio": size / compressed,
+        "milliseconds": seconds * 1000,
+        "megabytes_per_second": size / seconds / 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    app.json = create_json_provider(app)
+    encodings = {encoding: levels for encoding, levels in LEVELS.items() if COMPRESSORS[encoding] is not None}
+
+    results = {}
+    with app.app_context():
+        data = payloads(args.rows)
+        bodies = {name: app.json.response(payload).get_data() for name, payload in data.items()}
+        bodies["tasks_streamed"] = [chunk.encode() for chunk in stream_json(data["tasks"], dict)]
+
+        for name, body in bodies.items():
+            streamed = isinstance(body, list)
+            size = sum(map(len, body)) if streamed else len(body)
+            results[name] = {"bytes": size, "encodings": {}}
+            for encoding, levels in encodings.items():
+                for level in levels:
+                    if streamed:
+                        def encode(encoding=encoding, level=level):
+                            return b"".join(compress_chunks(encoding, body, level))
+                    else:
+                        def encode(encoding=encoding, level=level):
+                            return compress(encoding, body, level)
+                    results[name]["encodings"][f"{encoding}_{level}"] = measure_encoding(encode, size, args.repeat)
+
+    report("compression", {"rows": args.rows, "json_provider": type(app.json).__name__, "payloads": results})
+
+
+if __name__ == "__main__":
+    main()
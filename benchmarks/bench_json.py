@@ -0,0 +1,84 @@
+"""
+Compare the encode throughput of the JSON providers on payloads shaped like the list responses.
+
+Each provider encodes a list of tasks, a page of projects and a list of users with their
+nested type, as built by the services, in the date formats it supports. The Flask default
+provider is the baseline.
+
+Usage: ``python -m benchmarks.bench_json --rows 10000``
+"""
+import argparse
+from datetime import datetime, timedelta
+
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+from benchmarks.common import measure, report
+from helpers.json_provider import OrjsonJSONProvider, PydanticJSONProvider, StdlibJSONProvider
+
+
+def payloads(rows: int) -> dict[str, object]:
+    start = datetime(2025, 1, 1, 9, 30)
+    tasks = [
+        {
+            "id": index, "name": f"Task {index}", "description": "Benchmark task", "created_by": 1,
+            "start_date": start + timedelta(hours=index), "due_date": start + timedelta(days=index % 30),
+        }
+        for index in range(rows)
+    ]
+    projects = {
+        "items": [
+            {
+                "id": index, "name": f"Project {index}", "subject": "Benchmark", "created_by": 1, "updated_by": None,
+                "start_date": start, "due_date": None,
+            }
+            for index in range(100)
+        ],
+        "next_cursor": "MTAw",
+    }
+    users = [
+        {
+            "id": index, "email": f"user{index}@bench.com", "username": f"user{index}", "name": f"User {index}",
+            "created_by": 1, "updated_by": None, "type": {"id": 2, "user_type": "employee"},
+        }
+        for index in range(rows // 10)
+    ]
+    return {"tasks": tasks, "projects_page": projects, "users": users}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    providers = {
+        "flask_default": DefaultJSONProvider(app),
+        "stdlib_http": StdlibJSONProvider(app),
+        "stdlib_iso": StdlibJSONProvider(app, datetime_format="iso"),
+        "orjson_http": OrjsonJSONProvider(app),
+        "orjson_iso": OrjsonJSONProvider(app, datetime_format="iso"),
+        "pydantic_iso": PydanticJSONProvider(app),
+    }
+
+    results = {}
+    for name, payload in payloads(args.rows).items():
+        size = len(providers["flask_default"].response(payload).get_data())
+        timings = {
+            provider_name: measure(lambda: provider.response(payload), repeat=args.repeat)["median"]
+            for provider_name, provider in providers.items()
+        }
+        results[name] = {
+            "bytes": size,
+            "megabytes_per_second": {provider: size / seconds / 1e6 for provider, seconds in timings.items()},
+            "speedup_over_default": {
+                provider: timings["flask_default"] / seconds for provider, seconds in timings.items()
+            },
+        }
+
+    report("json", {"rows": args.rows, "payloads": results})
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""
+Compare rows/sec of loading full ORM entities against the column-projection fast path.
+
+Usage: ``python -m benchmarks.bench_projection --tasks 20000``
+"""
+import argparse
+
+from benchmarks.common import as_admin, create_bench_app, create_project, db, measure, report
+from models.task import Task
+from repositories.task_repository import TaskRepository
+from resources.response.task_response import TaskResponse
+
+
+def seed_tasks(project_id: int, count: int) -> None:
+    TaskRepository(db_session=db.session).create_many([
+        {"name": f"Task {index}", "description": "Benchmark task", "project_id": project_id, "created_by": 1}
+        for index in range(count)
+    ])
+
+
+def load_entities(project_id: int) -> list[dict]:
+    db.session.expunge_all()
+    tasks = db.session.query(Task).filter(Task.project_id == project_id).all()
+    return [TaskResponse.model_validate(task).model_dump() for task in tasks]
+
+
+def load_rows(project_id: int) -> list[dict]:
+    db.session.expunge_all()
+    tasks = TaskRepository(db_session=db.session).get_all_tasks_by_project(project_id=project_id)
+    return [TaskResponse.model_validate(task).model_dump() for task in tasks]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with as_admin(app):
+        project = create_project()
+        seed_tasks(project.id, args.tasks)
+
+        entities = measure(lambda: load_entities(project.id), repeat=args.repeat)
+        rows = measure(lambda: load_rows(project.id), repeat=args.repeat)
+
+    report("projection", {
+        "tasks": args.tasks,
+        "orm_entities_seconds": entities,
+        "projected_rows_seconds": rows,
+        "orm_entities_rows_per_second": args.tasks / entities["median"],
+        "projected_rows_per_second": args.tasks / rows["median"],
+        "speedup": entities["median"] / rows["median"],
+    })
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,195 @@
+"""
+Measure the latency percentiles and throughput of the routes on a seeded dataset.
+
+The dataset holds ``--size`` projects and tasks, with the tasks assigned ``TASKS_PER_PROJECT``
+to a project, and one user for every hundred projects. Each route is requested through the
+Flask test client, one request at a time, and through a threaded WSGI server by ``--clients``
+concurrent clients. A database on ``BENCH_DATABASE_URL`` that already holds a dataset of the
+same size is reused, so runs on different commits can be compared without seeding it again.
+
+Usage: ``python -m benchmarks.bench_routes --size 100k --requests 50 --output routes.json``
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+import requests
+from flask import Flask
+from sqlalchemy import func, insert, select
+from werkzeug.security import generate_password_hash
+
+from benchmarks.common import BENCH_DATABASE_URL, db, git_revision, latency_stats, report, serving
+from main import create_app
+from models.project import Project
+from models.task import Task
+from models.user import User
+from models.user_type import UserType
+from settings.seed import seed_data
+
+SIZES = {"1k": 1_000, "100k": 100_000, "1M": 1_000_000}
+TASKS_PER_PROJECT = 100
+USERS_PER_PROJECT = 0.01
+CHUNK_SIZE = 10_000
+LOGIN = {"email": "admin@admin.com", "password": "admin"}
+
+
+def routes(project_id: int) -> dict[str, tuple[str, str, dict | None]]:
+    return {
+        "projects": ("GET", "/projects/", None),
+        "projects_page": ("GET", "/projects/?limit=100", None),
+        "project_tasks": ("GET", f"/projects/{project_id}/tasks", None),
+        "projects_fields": ("GET", "/projects/?fields=name,due_date", None),
+        "project_tasks_fields": ("GET", f"/projects/{project_id}/tasks?fields=name,due_date", None),
+        "users": ("GET", "/users/", None),
+        "users_page": ("GET", "/users/?limit=100", None),
+        "login": ("POST", "/auth/login", LOGIN),
+    }
+
+
+def parse_size(value: str) -> int:
+    return SIZES[value] if value in SIZES else int(value)
+
+
+def insert_chunks(model: type[db.Model], rows) -> None:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == CHUNK_SIZE:
+            db.session.execute(insert(model), chunk)
+            chunk = []
+    if chunk:
+        db.session.execute(insert(model), chunk)
+    db.session.commit()
+
+
+def seed(size: int) -> None:
+    now = datetime.now(timezone.utc)
+    employee_type = db.session.scalar(select(UserType.id).where(UserType.user_type == "employee"))
+    password = generate_password_hash("bench")
+    insert_chunks(User, (
+        {
+            "email": f"user{index}@bench.com", "password": password, "username": f"user{index}",
+            "name": f"User {index}", "user_type": employee_type, "created_at": now, "created_by": 1,
+        }
+        for index in range(max(int(size * USERS_PER_PROJECT), 1))
+    ))
+    insert_chunks(Project, (
+        {"name": f"Project {index}", "subject": "Benchmark", "created_at": now, "created_by": 1}
+        for index in range(size)
+    ))
+    first_project = db.session.scalar(select(func.min(Project.id)))
+    insert_chunks(Task, (
+        {
+            "name": f"Task {index}", "description": "Benchmark task", "created_at": now, "created_by": 1,
+            "project_id": first_project + index // TASKS_PER_PROJECT,
+        }
+        for index in range(size)
+    ))
+
+
+def create_dataset_app(database_url: str, size: int) -> Flask:
+    """
+    Build the application on ``database_url`` and seed it, unless it already holds a dataset of ``size``.
+    """
+    app = create_app({
+        "SECRET_KEY": "bench-secret-key",
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "RESPONSE_CACHE_ENABLED": False,
+    })
+    with app.app_context():
+        db.create_all()
+        counts = (db.session.scalar(select(func.count(Project.id))), db.session.scalar(select(func.count(Task.id))))
+        if counts != (size, size):
+            db.drop_all()
+            db.create_all()
+            seed_data(db.session)
+            seed(size)
+    return app
+
+
+def run_test_client(app: Flask, method: str, path: str, body: dict | None, count: int) -> dict[str, float]:
+    latencies, errors = [], 0
+    with app.test_client() as client:
+        response_bytes = len(client.open(path, method=method, json=body).get_data())
+        start = time.perf_counter()
+        for _ in range(count):
+            request_start = time.perf_counter()
+            response = client.open(path, method=method, json=body)
+            latencies.append(time.perf_counter() - request_start)
+            errors += response.status_code != 200
+        elapsed = time.perf_counter() - start
+    return {**latency_stats(latencies, elapsed), "errors": errors, "response_bytes": response_bytes}
+
+
+def run_server(base_url: str, method: str, path: str, body: dict | None, clients: int, count: int) -> dict[str, float]:
+    latencies, errors = [], []
+
+    def client():
+        with requests.Session() as session:
+            for _ in range(count):
+                request_start = time.perf_counter()
+                response = session.request(method, base_url + path, json=body)
+                latencies.append(time.perf_counter() - request_start)
+                if response.status_code != 200:
+                    errors.append(response.status_code)
+
+    requests.request(method, base_url + path, json=body)
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return {**latency_stats(latencies, elapsed), "errors": len(errors)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=parse_size, default="1k", help="1k, 100k, 1M or a number of rows")
+    parser.add_argument("--requests", type=int, default=50, help="requests per route, and per client on the server")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--routes", nargs="+", help="names of the routes to measure, all of them by default")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    args = parser.parse_args()
+
+    database_url = BENCH_DATABASE_URL
+    if database_url in ("sqlite://", "sqlite:///:memory:"):
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+    start = time.perf_counter()
+    app = create_dataset_app(database_url, args.size)
+    setup_seconds = time.perf_counter() - start
+    with app.app_context():
+        project_id = db.session.scalar(select(func.min(Project.id)))
+
+    selected = {
+        name: route for name, route in routes(project_id).items() if not args.routes or name in args.routes
+    }
+    test_client = {
+        name: run_test_client(app, method, path, body, args.requests)
+        for name, (method, path, body) in selected.items()
+    }
+    with serving(app) as base_url:
+        server = {
+            name: run_server(base_url, method, path, body, args.clients, args.requests)
+            for name, (method, path, body) in selected.items()
+        }
+
+    report("routes", {
+        "revision": git_revision(),
+        "size": args.size,
+        "tasks_per_project": TASKS_PER_PROJECT,
+        "setup_seconds": setup_seconds,
+        "requests": args.requests,
+        "clients": args.clients,
+        "test_client": test_client,
+        "wsgi_server": server,
+    }, output=args.output)
+
+
+if __name__ == '__main__':
+    main()
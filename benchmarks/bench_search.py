@@ -0,0 +1,106 @@
+"""
+Measure the latency of ``/search`` against a budget, and of the ``ILIKE`` scan it replaces.
+
+The dataset is the one of ``bench_routes``, built by the migrations rather than ``create_all``
+so the full text search columns, indexes or FTS5 tables exist. Every task name holds the word
+``task`` and a number, so ``q=task`` matches every task and is the worst case, bounded by
+``SEARCH_MAX_CANDIDATES``, while a full number matches a single task. A database on
+``BENCH_DATABASE_URL`` that already holds a dataset of the same size is reused.
+
+Usage: ``python -m benchmarks.bench_search --size 1M --budget-ms 100``
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from flask import Flask
+from flask_migrate import upgrade
+from sqlalchemy import func, or_, select
+
+from benchmarks.bench_routes import parse_size, run_test_client, seed
+from benchmarks.common import BENCH_DATABASE_URL, db, git_revision, measure, report
+from helpers.search import SEARCH_MAX_CANDIDATES
+from main import create_app
+from models.project import Project
+from models.task import Task
+from settings.seed import seed_data
+
+
+def queries(size: int) -> dict[str, str]:
+    number = size // 2
+    return {
+        "every_task": "/search?q=task",
+        "single_task": f"/search?q={number}",
+        "prefix": f"/search?q=task%20{str(number)[:-1]}",
+        "deep_page": "/search?q=task&limit=100",
+    }
+
+
+def create_search_app(database_url: str, size: int) -> Flask:
+    """
+    Build the application on ``database_url`` migrated to the latest revision, and seed it when it is empty.
+    """
+    app = create_app({
+        "SECRET_KEY": "bench-secret-key",
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "RESPONSE_CACHE_ENABLED": False,
+    })
+    with app.app_context():
+        upgrade()
+        counts = (db.session.scalar(select(func.count(Project.id))), db.session.scalar(select(func.count(Task.id))))
+        if counts == (0, 0):
+            seed_data(db.session)
+            seed(size)
+        elif counts != (size, size):
+            raise SystemExit(f"{database_url} holds {counts[1]} tasks, not {size}.")
+    return app
+
+
+def ilike_scan(term: str, limit: int) -> None:
+    pattern = f"%{term}%"
+    db.session.execute(
+        select(Task.id, Task.name).where(or_(Task.name.ilike(pattern), Task.description.ilike(pattern))).limit(limit)
+    ).all()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--size", type=parse_size, default="100k", help="1k, 100k, 1M or a number of rows")
+    parser.add_argument("--requests", type=int, default=50, help="requests per query")
+    parser.add_argument("--budget-ms", type=float, default=100, help="p95 latency budget of a search request")
+    parser.add_argument("--output", help="file the JSON results are written to")
+    args = parser.parse_args()
+
+    database_url = BENCH_DATABASE_URL
+    if database_url in ("sqlite://", "sqlite:///:memory:"):
+        database_url = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+    start = time.perf_counter()
+    app = create_search_app(database_url, args.size)
+    setup_seconds = time.perf_counter() - start
+
+    search = {}
+    for name, path in queries(args.size).items():
+        stats = run_test_client(app, "GET", path, None, args.requests)
+        search[name] = {**stats, "within_budget": stats["p95_seconds"] * 1000 <= args.budget_ms}
+    with app.app_context():
+        # A word in no row makes the scan read the whole table, as every keystroke of a rare word does.
+        naive = {
+            "every_task": measure(lambda: ilike_scan("task", 50), repeat=5),
+            "no_match": measure(lambda: ilike_scan("missing", 50), repeat=5),
+        }
+
+    report("search", {
+        "revision": git_revision(),
+        "size": args.size,
+        "setup_seconds": setup_seconds,
+        "max_candidates": SEARCH_MAX_CANDIDATES,
+        "budget_ms": args.budget_ms,
+        "search": search,
+        "ilike_scan": naive,
+    }, output=args.output)
+
+
+if __name__ == '__main__':
+    main()
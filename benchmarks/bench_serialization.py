@@ -0,0 +1,59 @@
+"""
+Compare rows/sec of serializing a list response row by row against the batched ``TypeAdapter`` path.
+
+The rows are fetched once with the column projection used by the routes, then each path
+turns them into the dicts returned by the services. Encoding straight to JSON bytes with
+``dump_json`` is measured for reference only: it renders dates as ISO 8601 instead of the
+HTTP dates and sorted keys of the app JSON provider, so the routes do not use it.
+
+Usage: ``python -m benchmarks.bench_serialization --rows 10000``
+"""
+import argparse
+from datetime import datetime
+
+from benchmarks.common import as_admin, create_bench_app, create_project, db, measure, report
+from helpers.serialization import dump_all, list_adapter
+from repositories.task_repository import TaskRepository
+from resources.response.task_response import TaskResponse
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with as_admin(app):
+        project = create_project()
+        repository = TaskRepository(db_session=db.session)
+        repository.create_many([
+            {
+                "name": f"Task {index}", "description": "Benchmark task", "project_id": project.id,
+                "start_date": datetime(2025, 1, 1), "created_by": 1,
+            }
+            for index in range(args.rows)
+        ])
+        rows = repository.get_all_tasks_by_project(project_id=project.id)
+        adapter = list_adapter(TaskResponse)
+
+        per_row = measure(lambda: [TaskResponse.model_validate(row).model_dump() for row in rows], args.repeat)
+        batched = measure(lambda: dump_all(TaskResponse, rows), args.repeat)
+        to_json = measure(
+            lambda: adapter.dump_json(adapter.validate_python([row._mapping for row in rows])), args.repeat
+        )
+
+    report("serialization", {
+        "rows": args.rows,
+        "per_row_seconds": per_row,
+        "batched_seconds": batched,
+        "dump_json_seconds": to_json,
+        "per_row_rows_per_second": args.rows / per_row["median"],
+        "batched_rows_per_second": args.rows / batched["median"],
+        "dump_json_rows_per_second": args.rows / to_json["median"],
+        "speedup": per_row["median"] / batched["median"],
+    })
+
+
+if __name__ == '__main__':
+    main()
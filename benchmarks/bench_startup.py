@@ -0,0 +1,58 @@
+"""
+Measure how long a fresh worker process takes to boot the application.
+
+``factory`` only builds the app, as a worker does now. ``factory_with_schema_and_seed`` also
+runs the database existence check, ``create_all`` and the seed that used to run when
+``main.py`` was imported.
+
+Usage: ``python -m benchmarks.bench_startup --repeat 10``
+"""
+import argparse
+import os
+import subprocess
+import sys
+
+from benchmarks.common import BENCH_DATABASE_URL, measure, report
+
+FACTORY = """
+from main import create_app
+app = create_app({"SQLALCHEMY_DATABASE_URI": %(url)r})
+"""
+
+FACTORY_WITH_SCHEMA_AND_SEED = FACTORY + """
+from sqlalchemy_utils import create_database, database_exists
+from settings.database import db
+from settings.seed import seed_data
+with app.app_context():
+    if not database_exists(db.engine.url):
+        create_database(db.engine.url)
+    db.create_all()
+    seed_data(db.session)
+"""
+
+
+def boot(source: str, database_url: str) -> None:
+    subprocess.run(
+        [sys.executable, "-c", source % {"url": database_url}],
+        check=True,
+        cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    factory = measure(lambda: boot(FACTORY, BENCH_DATABASE_URL), repeat=args.repeat)
+    legacy = measure(lambda: boot(FACTORY_WITH_SCHEMA_AND_SEED, BENCH_DATABASE_URL), repeat=args.repeat)
+
+    report("startup", {
+        "factory_seconds": factory,
+        "factory_with_schema_and_seed_seconds": legacy,
+        "saved_per_worker_seconds": legacy["median"] - factory["median"],
+    })
+
+
+if __name__ == '__main__':
+    main()
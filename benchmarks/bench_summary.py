@@ -0,0 +1,97 @@
+"""
+Compare the project dashboard built from ``/projects/summary`` against the fan-out it replaces.
+
+The fan-out requests ``/projects/`` and then the tasks of every project, counting the overdue
+tasks and finding the next due date on the client, while the summary pages through
+``/projects/summary``. Both go through the Flask test client, and the queries they run are
+counted. The due dates of the tasks are spread over the month around the time of the run.
+
+Usage: ``python -m benchmarks.bench_summary --projects 1000 --tasks-per-project 20``
+"""
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from flask import Flask
+from sqlalchemy import insert
+from werkzeug.http import parse_date
+
+from benchmarks.common import create_bench_app, db, measure, report
+from helpers.pagination import MAX_PAGE_SIZE
+from helpers.query_counter import count_queries
+from models.project import Project
+from models.task import Task
+
+
+def seed(projects: int, tasks_per_project: int) -> None:
+    now = datetime.now(timezone.utc)
+    db.session.execute(insert(Project), [
+        {"name": f"Project {index}", "subject": "Benchmark", "created_at": now, "created_by": 1}
+        for index in range(projects)
+    ])
+    db.session.execute(insert(Task), [
+        {
+            "name": f"Task {index}", "description": "Benchmark task", "created_at": now, "created_by": 1,
+            "project_id": project_id, "due_date": now + timedelta(hours=(project_id * 7 + index * 13) % 720 - 360),
+        }
+        for project_id in range(1, projects + 1) for index in range(tasks_per_project)
+    ])
+    db.session.commit()
+
+
+def fan_out(app: Flask) -> dict[str, int]:
+    now = datetime.now(timezone.utc)
+    dashboard, requests = {}, 1
+    with app.test_client() as client:
+        for project in client.get("/projects/").json:
+            tasks = client.get(f"/projects/{project['id']}/tasks").json
+            requests += 1
+            due_dates = [parse_date(task["due_date"]) for task in tasks if task["due_date"]]
+            dashboard[project["id"]] = (
+                len(tasks),
+                sum(due_date < now for due_date in due_dates),
+                min((due_date for due_date in due_dates if due_date >= now), default=None),
+            )
+    return {"projects": len(dashboard), "requests": requests}
+
+
+def summary(app: Flask) -> dict[str, int]:
+    dashboard, requests, cursor = {}, 0, ""
+    with app.test_client() as client:
+        while True:
+            page = client.get(f"/projects/summary?limit={MAX_PAGE_SIZE}{cursor}").json
+            requests += 1
+            for item in page["items"]:
+                dashboard[item["id"]] = (item["task_count"], item["overdue_count"], item["next_due_date"])
+            if page["next_cursor"] is None:
+                break
+            cursor = f"&cursor={page['next_cursor']}"
+    return {"projects": len(dashboard), "requests": requests}
+
+
+def measure_dashboard(app: Flask, build, repeat: int) -> dict[str, float]:
+    with count_queries() as counter:
+        counts = build(app)
+    return {**counts, "queries": len(counter), **measure(lambda: build(app), repeat=repeat)}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=1000)
+    parser.add_argument("--tasks-per-project", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    app = create_bench_app()
+    with app.app_context():
+        seed(args.projects, args.tasks_per_project)
+
+    report("summary", {
+        "projects": args.projects,
+        "tasks_per_project": args.tasks_per_project,
+        "fan_out": measure_dashboard(app, fan_out, args.repeat),
+        "summary": measure_dashboard(app, summary, args.repeat),
+    })
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+import gc
+import json
+import os
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator
+
+from flask import Flask
+from flask_login import login_user
+from werkzeug.serving import WSGIRequestHandler, make_server
+
+from main import create_app
+from models.project import Project
+from models.user import User
+from settings.database import db
+from settings.seed import seed_data
+
+BENCH_DATABASE_URL = os.getenv("BENCH_DATABASE_URL", "sqlite://")
+
+
+def create_bench_app(database_url: str = BENCH_DATABASE_URL) -> Flask:
+    """
+    Build the application bound to the benchmark database, with the schema and seed data in place
+    and the response cache disabled so every request reaches the database.
+    """
+    app = create_app({
+        "SECRET_KEY": "bench-secret-key",
+        "SQLALCHEMY_DATABASE_URI": database_url,
+        "RESPONSE_CACHE_ENABLED": False,
+    })
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        seed_data(db.session)
+    return app
+
+
+@contextmanager
+def as_admin(app: Flask) -> Iterator[User]:
+    with app.test_request_context():
+        admin = User.query.filter_by(email="admin@admin.com").one()
+        login_user(admin)
+        yield admin
+
+
+def create_project(name: str = "Bench Project") -> Project:
+    project = Project(name=name, subject="Benchmark", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    return project
+
+
+class QuietRequestHandler(WSGIRequestHandler):
+    def log_request(self, *args, **kwargs):
+        pass
+
+
+@contextmanager
+def serving(app: Flask) -> Iterator[str]:
+    """
+    Serve ``app`` with a threaded WSGI server on a free local port and yield its base URL.
+    """
+    server = make_server("127.0.0.1", 0, app, threaded=True, request_handler=QuietRequestHandler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.port}"
+    finally:
+        server.shutdown()
+        thread.join()
+
+
+def measure(fn: Callable[[], Any], repeat: int = 5) -> dict[str, float]:
+    """
+    Run ``fn`` ``repeat`` times and return the best, median and worst wall time in seconds.
+
+    Garbage is collected before every run, so no run pays for the allocations of the previous one.
+    """
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    timings.sort()
+    return {"best": timings[0], "median": timings[len(timings) // 2], "worst": timings[-1]}
+
+
+def latency_stats(latencies: list[float], elapsed: float) -> dict[str, float]:
+    """
+    Throughput and latency percentiles in seconds of requests that took ``elapsed`` seconds in total.
+    """
+    latencies = sorted(latencies)
+    return {
+        "requests": len(latencies),
+        "requests_per_second": len(latencies) / elapsed,
+        "p50_seconds": latencies[int(len(latencies) * 0.50)],
+        "p90_seconds": latencies[int(len(latencies) * 0.90)],
+        "p95_seconds": latencies[int(len(latencies) * 0.95)],
+        "p99_seconds": latencies[int(len(latencies) * 0.99)],
+        "max_seconds": latencies[-1],
+    }
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def report(name: str, results: dict[str, Any], output: str | None = None) -> None:
+    """
+    Print the results as JSON, and also write them to ``output`` when it is given.
+    """
+    content = json.dumps({"benchmark": name, "database": BENCH_DATABASE_URL.split("://")[0], **results}, indent=2)
+    print(content)
+    if output:
+        with open(output, "w") as file:
+            file.write(content + "\n")
+
@@ -1,8 +1,16 @@
 from functools import wraps
+from typing import Any, Awaitable, Callable
 
+from flask import Response, current_app, make_response, request
 from flask_login import current_user, login_required
 from werkzeug.exceptions import Forbidden
 
+from helpers.etag import make_etag
+from helpers.query_counter import check_query_budget, count_queries, query_budget_mode
+from helpers.response_cache import response_cache
+from helpers.streaming import wants_ndjson
+from settings.compression import matching_etag
+
 
 def manager_required(f):
     @wraps(f)
@@ -10,6 +18,132 @@ def manager_required(f):
     def decorated_function(*args, **kwargs):
         if getattr(current_user, "user_type", None) != 1:
             raise Forbidden()
-        return f(*args, **kwargs)
+        return current_app.ensure_sync(f)(*args, **kwargs)
 
     return decorated_function
+
+
+def version_etag(version: Any) -> str:
+    return make_etag(tuple(version), request.full_path, wants_ndjson())
+
+
+def not_modified(etag: str) -> Response:
+    response = Response(status=304)
+    response.set_etag(etag)
+    return response
+
+
+def conditional(get_version: Callable[..., Any | None]):
+    """
+    Answer GET requests with a strong ETag and ``304 Not Modified`` when it matches ``If-None-Match``.
+
+    ``get_version`` receives the view arguments and returns a cheap version of the resource,
+    such as its ``updated_at``, or ``None`` if it does not exist. The view only runs when the
+    client copy is stale. A tag of a compressed representation of the resource matches too.
+    Async views use ``conditional_async`` instead, so the version is read on their session.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            version = current_app.ensure_sync(get_version)(**kwargs)
+            if version is None:
+                return current_app.ensure_sync(f)(*args, **kwargs)
+
+            etag = version_etag(version)
+            matched = matching_etag(etag, request.if_none_match)
+            if matched:
+                return not_modified(matched)
+
+            response = make_response(current_app.ensure_sync(f)(*args, **kwargs))
+            if response.status_code == 200:
+                response.set_etag(etag)
+            return response
+
+        return decorated_function
+
+    return decorator
+
+
+async def conditional_async(version: Any | None, view: Callable[[], Awaitable[Any]]) -> Any:
+    """
+    ``conditional`` for an async view that read the ``version`` of its resource on its own
+    session, so the check and the view share one connection. ``view`` builds the response
+    when the client copy is stale.
+    """
+    if version is None:
+        return await view()
+
+    etag = version_etag(version)
+    matched = matching_etag(etag, request.if_none_match)
+    if matched:
+        return not_modified(matched)
+
+    response = make_response(await view())
+    if response.status_code == 200:
+        response.set_etag(etag)
+    return response
+
+
+def cached(*namespaces: str):
+    """
+    Serve GET responses from ``response_cache`` until a write invalidates one of ``namespaces``.
+
+    Entries are keyed by route, query string, caller role and the ``Accept`` header. Only
+    complete ``200`` responses are stored; streamed ones always reach the view. Applied on
+    top of ``conditional`` so a hit still answers ``If-None-Match`` with ``304``.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            if not response_cache.is_enabled():
+                return current_app.ensure_sync(f)(*args, **kwargs)
+
+            key = response_cache.make_key(
+                namespaces,
+                request.path,
+                request.query_string.decode(),
+                getattr(current_user, "user_type", None),
+                wants_ndjson(),
+            )
+            response = response_cache.get(key)
+            if response is not None:
+                etag = response.get_etag()[0]
+                matched = etag and matching_etag(etag, request.if_none_match)
+                if matched:
+                    return not_modified(matched)
+                return response
+
+            response = make_response(current_app.ensure_sync(f)(*args, **kwargs))
+            if response.status_code == 200 and not response.is_streamed:
+                response_cache.set(key, response)
+            return response
+
+        return decorated_function
+
+    return decorator
+
+
+def query_budget(max_queries: int):
+    """
+    Declare the most queries a request to the view may run, so an N+1 pattern does not go unnoticed.
+
+    Applied above the other decorators so their queries count too. Depending on
+    ``query_budget_mode()``, a request over the budget raises ``QueryBudgetExceeded``, as it
+    does under tests, or logs the statements it repeated, as it does in debug mode.
+    """
+    def decorator(f):
+        @wraps(f)
+        def decorated_function(*args, **kwargs):
+            mode = query_budget_mode()
+            if mode == "off":
+                return current_app.ensure_sync(f)(*args, **kwargs)
+
+            with count_queries() as counter:
+                response = current_app.ensure_sync(f)(*args, **kwargs)
+            check_query_budget(counter, max_queries, f"{request.method} {request.path}", raise_error=mode == "raise")
+            return response
+
+        decorated_function.query_budget = max_queries
+        return decorated_function
+
+    return decorator
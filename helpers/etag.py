@@ -0,0 +1,6 @@
+import hashlib
+from typing import Any
+
+
+def make_etag(*parts: Any) -> str:
+    return hashlib.sha1(repr(parts).encode()).hexdigest()
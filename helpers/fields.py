@@ -0,0 +1,51 @@
+from functools import lru_cache
+from typing import Any
+
+from pydantic import BaseModel, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm.util import AliasedClass
+from werkzeug.exceptions import BadRequest
+
+
+def parse_fields(fields: str | None, model: type[BaseModel]) -> tuple[str, ...] | None:
+    """
+    Fields of ``model`` named by a comma separated ``fields`` query parameter, in the order of
+    the model, or ``None`` for all of them. ``id`` is always included, as the rows and the
+    pagination cursors are identified by it.
+
+    :raises BadRequest: if a name is not a field of ``model``
+    """
+    names = {name.strip() for name in (fields or "").split(",") if name.strip()}
+    if not names:
+        return None
+    unknown = names - model.model_fields.keys()
+    if unknown:
+        raise BadRequest(f"Unknown fields: {', '.join(sorted(unknown))}.")
+    return tuple(name for name in model.model_fields if name == "id" or name in names)
+
+
+@lru_cache(maxsize=None)
+def response_model(model: type[BaseModel], fields: tuple[str, ...] | None) -> type[BaseModel]:
+    """
+    ``model`` restricted to ``fields``, built once per combination of fields.
+    """
+    if fields is None:
+        return model
+    return create_model(
+        f"{model.__name__}Fields",
+        __config__=model.model_config,
+        **{name: (model.model_fields[name].annotation, model.model_fields[name]) for name in fields},
+    )
+
+
+def column_name(column: Any) -> str:
+    return inspect(column).name if isinstance(column, AliasedClass) else column.key
+
+
+def select_fields(columns: tuple[Any, ...], fields: tuple[str, ...] | None) -> tuple[Any, ...]:
+    """
+    The ``columns`` of a response named in ``fields``, or all of them when ``fields`` is ``None``.
+    """
+    if fields is None:
+        return columns
+    return tuple(column for column in columns if column_name(column) in fields)
@@ -0,0 +1,151 @@
+import dataclasses
+import decimal
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any
+
+import pydantic_core
+from flask import Flask, Response
+from flask.json.provider import DefaultJSONProvider, JSONProvider
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+DATETIME_FORMATS = ("http", "iso")
+WEEKDAYS = ("Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun")
+MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def format_http_date(value: date) -> str:
+    """
+    Same output as ``werkzeug.http.http_date``, which goes through ``email.utils`` and is
+    several times slower. Naive datetimes and plain dates are taken as UTC.
+    """
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        hour, minute, second = value.hour, value.minute, value.second
+    else:
+        hour = minute = second = 0
+    return (
+        f"{WEEKDAYS[value.weekday()]}, {value.day:02d} {MONTHS[value.month - 1]} {value.year:04d} "
+        f"{hour:02d}:{minute:02d}:{second:02d} GMT"
+    )
+
+
+def http_default(o: Any) -> Any:
+    """
+    Same conversions as the default Flask provider, which renders dates in the HTTP date format.
+    """
+    if isinstance(o, date):
+        return format_http_date(o)
+    if isinstance(o, (decimal.Decimal, uuid.UUID)):
+        return str(o)
+    if dataclasses.is_dataclass(o):
+        return dataclasses.asdict(o)
+    if hasattr(o, "__html__"):
+        return str(o.__html__())
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
+def iso_default(o: Any) -> Any:
+    if isinstance(o, date):
+        return o.isoformat()
+    return http_default(o)
+
+
+class StdlibJSONProvider(DefaultJSONProvider):
+    """
+    Flask provider on the standard ``json`` module, rendering dates in either format.
+    """
+
+    def __init__(self, app: Flask, datetime_format: str = "http"):
+        super().__init__(app)
+        self.default = iso_default if datetime_format == "iso" else http_default
+
+
+class OrjsonJSONProvider(JSONProvider):
+    """
+    Provider on ``orjson``, with keys sorted as the default provider does.
+
+    Dates are encoded natively in ISO 8601 by ``orjson``; in the HTTP date format they are
+    passed to ``http_default`` instead. Non-ASCII characters are written as UTF-8 rather than
+    escaped.
+    """
+
+    mimetype = "application/json"
+    compact: bool | None = None
+
+    def __init__(self, app: Flask, datetime_format: str = "http"):
+        super().__init__(app)
+        self.options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS
+        if datetime_format == "http":
+            self.options |= orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _dumps(self, obj: Any, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, default=http_default, option=self.options | (orjson.OPT_INDENT_2 if indent else 0))
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return self._dumps(obj, indent=bool(kwargs.get("indent"))).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self._app.debug) or self.compact is False
+        return self._app.response_class(self._dumps(obj, indent=indent) + b"\n", mimetype=self.mimetype)
+
+
+class PydanticJSONProvider(JSONProvider):
+    """
+    Provider on the ``pydantic_core`` encoder, which only renders dates in ISO 8601 and keeps
+    the keys in insertion order, that is the field order of the response models.
+    """
+
+    mimetype = "application/json"
+    compact: bool | None = None
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return pydantic_core.to_json(obj, indent=kwargs.get("indent"), fallback=http_default).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return pydantic_core.from_json(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = 2 if (self.compact is None and self._app.debug) or self.compact is False else None
+        return self._app.response_class(
+            pydantic_core.to_json(obj, indent=indent, fallback=http_default) + b"\n", mimetype=self.mimetype
+        )
+
+
+def create_json_provider(app: Flask) -> JSONProvider:
+    """
+    JSON provider named by ``JSON_PROVIDER``: ``orjson``, ``pydantic``, ``stdlib``, or ``auto``
+    for ``orjson`` when it is installed and ``stdlib`` otherwise. ``JSON_DATETIME_FORMAT`` is
+    ``http`` for the HTTP date format of the default provider or ``iso`` for ISO 8601.
+
+    :raises ValueError: if the provider or the format is unknown, ``orjson`` is missing, or the
+        ``pydantic`` provider is combined with HTTP dates
+    """
+    name = app.config.get("JSON_PROVIDER", "auto")
+    datetime_format = app.config.get("JSON_DATETIME_FORMAT", "http")
+    if datetime_format not in DATETIME_FORMATS:
+        raise ValueError(f"Unknown JSON_DATETIME_FORMAT {datetime_format!r}.")
+    if name == "auto":
+        name = "orjson" if orjson is not None else "stdlib"
+
+    if name == "orjson":
+        if orjson is None:
+            raise ValueError("JSON_PROVIDER 'orjson' requires the orjson package.")
+        return OrjsonJSONProvider(app, datetime_format=datetime_format)
+    if name == "pydantic":
+        if datetime_format != "iso":
+            raise ValueError("JSON_PROVIDER 'pydantic' only supports JSON_DATETIME_FORMAT 'iso'.")
+        return PydanticJSONProvider(app)
+    if name == "stdlib":
+        return StdlibJSONProvider(app, datetime_format=datetime_format)
+    raise ValueError(f"Unknown JSON_PROVIDER {name!r}.")
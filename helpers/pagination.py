@@ -0,0 +1,162 @@
+import base64
+import binascii
+import json
+import os
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Query
+from werkzeug.exceptions import BadRequest
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", 50))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", 500))
+SORT_KEY = "sort_key"
+
+
+def get_page_size(limit: int | None) -> int:
+    return min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE)
+
+
+def encode_cursor(last_id: int, sort: str | None = None, value: datetime | None = None) -> str:
+    """
+    Cursor of the page after the row ``last_id``. A page sorted by another column than the id
+    also records the ``sort`` and the ``value`` of that column on the row.
+    """
+    payload: dict[str, Any] = {"id": last_id}
+    if sort is not None:
+        payload.update(sort=sort, value=value.isoformat() if value is not None else None)
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if not cursor:
+        return None
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode()))["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise BadRequest('Invalid pagination cursor.')
+
+
+def decode_sort_cursor(cursor: str | None, sort: str) -> tuple[int | None, datetime | None]:
+    """
+    Id and sort column value of the row a page sorted by ``sort`` starts after.
+
+    Pages sorted by id use the plain cursors of ``decode_cursor``, and have no value.
+
+    :raises BadRequest: if the cursor is invalid or was made for another sort
+    """
+    if not cursor or is_id_sort(sort):
+        return decode_cursor(cursor), None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if payload["sort"] != sort:
+            raise ValueError(f"Cursor of sort={payload['sort']}.")
+        value = payload["value"]
+        return int(payload["id"]), datetime.fromisoformat(value) if value is not None else None
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise BadRequest('Invalid pagination cursor.')
+
+
+def is_id_sort(sort: str) -> bool:
+    return sort in ("id", "-id")
+
+
+def seek(id_column: Any, after_id: int | None, order_by: str) -> tuple[Any | None, Any]:
+    """
+    Build the keyset (seek) condition and the ordering of a page ordered by primary key.
+
+    The condition is ``None`` on the first page.
+    """
+    if order_by not in ("id", "-id"):
+        raise ValueError(f"Unsupported order_by={order_by}.")
+
+    descending = order_by.startswith("-")
+    condition = None
+    if after_id is not None:
+        condition = id_column < after_id if descending else id_column > after_id
+    return condition, id_column.desc() if descending else id_column.asc()
+
+
+def seek_sorted(
+        column: Any, id_column: Any, after_id: int | None, after_value: datetime | None, descending: bool
+) -> tuple[Any | None, list[Any]]:
+    """
+    Build the keyset condition and the ordering of a page ordered by a nullable ``column``,
+    with the primary key breaking the ties.
+
+    Nulls come last in ascending order and first in descending order, as PostgreSQL orders
+    them by default, so both databases can walk an index on ``(column, id)``.
+    """
+    if descending:
+        ordering = [column.desc().nulls_first(), id_column.desc()]
+    else:
+        ordering = [column.asc().nulls_last(), id_column.asc()]
+    if after_id is None:
+        return None, ordering
+
+    if descending and after_value is None:
+        condition = or_(and_(column.is_(None), id_column < after_id), column.is_not(None))
+    elif descending:
+        condition = or_(column < after_value, and_(column == after_value, id_column < after_id))
+    elif after_value is None:
+        condition = and_(column.is_(None), id_column > after_id)
+    else:
+        condition = or_(
+            column > after_value, and_(column == after_value, id_column > after_id), column.is_(None)
+        )
+    return condition, ordering
+
+
+def keyset(query: Query, id_column: Any, after_id: int | None, limit: int, order_by: str) -> Query:
+    """
+    Apply a keyset (seek) condition to a query ordered by its primary key.
+
+    The page starts right after ``after_id`` instead of skipping rows with an offset,
+    so the cost of a page does not depend on how deep it is.
+    """
+    condition, ordering = seek(id_column, after_id, order_by)
+    if condition is not None:
+        query = query.filter(condition)
+    return query.order_by(ordering).limit(limit)
+
+
+def make_page(rows: Sequence[Any], limit: int, sort: str = "id") -> tuple[Sequence[Any], str | None]:
+    """
+    Split rows fetched with ``limit + 1`` into the page and the cursor of the next one.
+
+    Rows sorted by another column than the id carry its value as ``SORT_KEY``.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if is_id_sort(sort):
+            return rows, encode_cursor(rows[-1].id)
+        return rows, encode_cursor(rows[-1].id, sort=sort, value=getattr(rows[-1], SORT_KEY))
+    return rows, None
+
+
+def encode_rank_cursor(rank: float, kind: str, last_id: int) -> str:
+    """
+    Cursor of the page of ranked results after the result ``last_id`` of type ``kind``.
+    """
+    return base64.urlsafe_b64encode(json.dumps({"rank": rank, "type": kind, "id": last_id}).encode()).decode()
+
+
+def decode_rank_cursor(cursor: str | None) -> tuple[float, str, int] | None:
+    if not cursor:
+        return None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return float(payload["rank"]), str(payload["type"]), int(payload["id"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise BadRequest('Invalid pagination cursor.')
+
+
+def make_ranked_page(rows: Sequence[Any], limit: int) -> tuple[Sequence[Any], str | None]:
+    """
+    Split ranked rows fetched with ``limit + 1`` into the page and the cursor of the next one.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_rank_cursor(rows[-1].rank, rows[-1].type, rows[-1].id)
+    return rows, None
@@ -0,0 +1,84 @@
+import re
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from flask import current_app
+from sqlalchemy import Engine, event
+
+_active_counters: ContextVar[tuple["QueryCounter", ...]] = ContextVar("active_query_counters", default=())
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+class QueryCounter:
+    """
+    Statements sent to any engine by the current context while the counter is active.
+    """
+
+    def __init__(self):
+        self.statements: list[str] = []
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def groups(self) -> list[tuple[str, int]]:
+        """
+        Distinct statements, whitespace normalized, with how many times each ran, most repeated first.
+
+        An N+1 pattern shows up as one statement repeated once per row of a previous one.
+        """
+        return Counter(re.sub(r"\s+", " ", statement).strip() for statement in self.statements).most_common()
+
+    def report(self, limit: int = 5) -> str:
+        return "\n".join(f"  {count} x {statement}" for statement, count in self.groups()[:limit])
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    for counter in _active_counters.get():
+        counter.statements.append(statement)
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryCounter]:
+    counter = QueryCounter()
+    token = _active_counters.set((*_active_counters.get(), counter))
+    try:
+        yield counter
+    finally:
+        _active_counters.reset(token)
+
+
+def check_query_budget(counter: QueryCounter, max_queries: int, name: str, raise_error: bool = True) -> None:
+    """
+    Raise ``QueryBudgetExceeded``, or log a warning, when ``counter`` holds more than ``max_queries`` statements.
+    """
+    if len(counter) <= max_queries:
+        return
+    message = f"{name} ran {len(counter)} queries, over its budget of {max_queries}:\n{counter.report()}"
+    if raise_error:
+        raise QueryBudgetExceeded(message)
+    current_app.logger.warning(message)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int, name: str = "Block") -> Iterator[QueryCounter]:
+    with count_queries() as counter:
+        yield counter
+    check_query_budget(counter, max_queries, name)
+
+
+def query_budget_mode() -> str:
+    """
+    ``QUERY_BUDGET_MODE`` of the app, or by default ``raise`` under tests, ``warn`` in debug mode and ``off`` otherwise.
+    """
+    mode = current_app.config.get("QUERY_BUDGET_MODE")
+    if mode:
+        return mode
+    if current_app.testing:
+        return "raise"
+    return "warn" if current_app.debug else "off"
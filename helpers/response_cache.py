@@ -0,0 +1,140 @@
+import json
+import os
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import Any
+
+from flask import Response, current_app
+
+from helpers.cache import TTLCache
+
+
+def enabled_by_default() -> bool:
+    """
+    Whether the cache is on when the app config does not say. The memory backend is private to
+    a process, so once a worker writes, the others keep serving what it made stale until it
+    expires; it has to be turned on with ``RESPONSE_CACHE_ENABLED``, while a shared backend on
+    ``RESPONSE_CACHE_URL`` is on unless turned off.
+    """
+    default = "true" if os.getenv("RESPONSE_CACHE_URL") else "false"
+    return os.getenv("RESPONSE_CACHE_ENABLED", default).lower() == "true"
+
+
+RESPONSE_CACHE_ENABLED = enabled_by_default()
+
+
+class CacheBackend(ABC):
+    """
+    Storage for cached responses and namespace generations.
+
+    Any Redis-compatible client satisfies it through ``RedisCacheBackend``.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    def set(self, key: str, value: bytes) -> None:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        raise NotImplementedError("Method not implemented.")
+
+
+class MemoryCacheBackend(CacheBackend):
+    def __init__(self, maxsize: int, ttl: float):
+        self.entries = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.counters: dict[str, int] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> bytes | None:
+        # Generations never expire: letting one lapse would make the stale entries it hid reachable again.
+        if key in self.counters:
+            return str(self.counters[key]).encode()
+        return self.entries.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.entries.set(key, value)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + 1
+            return self.counters[key]
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(self, client: Any, ttl: float):
+        self.client = client
+        self.ttl = ttl
+
+    def get(self, key: str) -> bytes | None:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self.client.set(key, value, ex=int(self.ttl))
+
+    def incr(self, key: str) -> int:
+        return self.client.incr(key)
+
+
+class ResponseCache:
+    """
+    Cache of whole GET responses, invalidated by bumping the generation of a namespace.
+
+    Keys embed the current generation of every namespace the response depends on, so a
+    write makes all the related entries unreachable at once and they simply age out.
+    """
+
+    def __init__(self, backend: CacheBackend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+
+    def is_enabled(self) -> bool:
+        return current_app.config.get("RESPONSE_CACHE_ENABLED", RESPONSE_CACHE_ENABLED)
+
+    def make_key(self, namespaces: tuple[str, ...], *parts: Any) -> str:
+        generations = [(self.backend.get(f"generation:{namespace}") or b"0").decode() for namespace in namespaces]
+        return "response:" + ":".join(
+            [f"{namespace}.{generation}" for namespace, generation in zip(namespaces, generations)]
+            + [str(part) for part in parts]
+        )
+
+    def get(self, key: str) -> Response | None:
+        value = self.backend.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        cached = json.loads(value)
+        return Response(cached["body"].encode("latin-1"), status=cached["status"], headers=cached["headers"])
+
+    def set(self, key: str, response: Response) -> None:
+        self.backend.set(key, json.dumps({
+            "status": response.status_code,
+            "headers": [[name, value] for name, value in response.headers.items() if name != "Content-Length"],
+            "body": response.get_data().decode("latin-1"),
+        }).encode())
+
+    def invalidate(self, *namespaces: str) -> None:
+        for namespace in namespaces:
+            self.backend.incr(f"generation:{namespace}")
+
+    def stats(self) -> dict[str, float]:
+        requests = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_ratio": self.hits / requests if requests else 0.0}
+
+
+def create_backend() -> CacheBackend:
+    ttl = float(os.getenv("RESPONSE_CACHE_TTL", 30))
+    url = os.getenv("RESPONSE_CACHE_URL")
+    if url:
+        import redis
+
+        return RedisCacheBackend(client=redis.Redis.from_url(url), ttl=ttl)
+    return MemoryCacheBackend(maxsize=int(os.getenv("RESPONSE_CACHE_SIZE", 1024)), ttl=ttl)
+
+
+response_cache = ResponseCache(backend=create_backend())
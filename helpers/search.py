@@ -0,0 +1,46 @@
+import os
+import re
+
+from werkzeug.exceptions import BadRequest
+
+SEARCH_MAX_CANDIDATES = int(os.getenv("SEARCH_MAX_CANDIDATES", 1000))
+MAX_SEARCH_TERMS = 8
+MIN_PREFIX_LENGTH = 2
+WORD = re.compile(r"[^\W_]+")
+
+
+def search_terms(q: str) -> list[str]:
+    """
+    Lowercase words of a search query, at most ``MAX_SEARCH_TERMS`` of them. Punctuation is
+    dropped, so the words can be quoted in any full text query syntax.
+
+    :raises BadRequest: if the query has no word
+    """
+    terms = [word.lower() for word in WORD.findall(q)][:MAX_SEARCH_TERMS]
+    if not terms:
+        raise BadRequest("The search query has no words.")
+    return terms
+
+
+def is_prefix(term: str) -> bool:
+    """
+    Whether the last term of a query is matched as a prefix, as it may still be typed. A single
+    letter is matched as a word, as the words it starts are too many to rank as they are typed.
+    """
+    return len(term) >= MIN_PREFIX_LENGTH
+
+
+def tsquery(terms: list[str]) -> str:
+    """
+    Postgres ``to_tsquery`` text matching all ``terms``, the last one as a prefix.
+    """
+    last = f"{terms[-1]}:*" if is_prefix(terms[-1]) else terms[-1]
+    return " & ".join([*terms[:-1], last])
+
+
+def fts5_query(terms: list[str]) -> str:
+    """
+    SQLite FTS5 query matching all ``terms``, the last one as a prefix.
+    """
+    last = f'"{terms[-1]}"*' if is_prefix(terms[-1]) else f'"{terms[-1]}"'
+    return " ".join([*(f'"{term}"' for term in terms[:-1]), last])
@@ -0,0 +1,48 @@
+import os
+from typing import Any, Callable, Iterable, Iterator
+
+from flask import Response, current_app, request, stream_with_context
+
+JSON_MIMETYPE = "application/json"
+NDJSON_MIMETYPE = "application/x-ndjson"
+STREAM_CHUNK_SIZE = int(os.getenv("STREAM_CHUNK_SIZE", 500))
+
+
+def wants_ndjson() -> bool:
+    return request.accept_mimetypes.best_match([JSON_MIMETYPE, NDJSON_MIMETYPE]) == NDJSON_MIMETYPE
+
+
+def stream_json(
+        rows: Iterable[Any],
+        serialize: Callable[[Any], dict[str, Any]],
+        ndjson: bool = False,
+        chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """
+    Encode rows one by one and yield them in chunks of ``chunk_size`` rows.
+
+    Produces a JSON array, or one JSON document per line when ``ndjson`` is set, so
+    only a single chunk is ever held in memory.
+    """
+    dumps = current_app.json.dumps
+    buffer = []
+
+    if not ndjson:
+        yield "["
+    for index, row in enumerate(rows):
+        document = dumps(serialize(row))
+        if ndjson:
+            buffer.append(f"{document}\n")
+        else:
+            buffer.append(f",{document}" if index else document)
+        if len(buffer) == chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
+    if not ndjson:
+        yield "]"
+
+
+def stream_response(chunks: Iterator[str], ndjson: bool = False) -> Response:
+    return Response(stream_with_context(chunks), mimetype=NDJSON_MIMETYPE if ndjson else JSON_MIMETYPE)
@@ -1,52 +1,97 @@
 import os
+from typing import Any, Mapping
 
 from flask import Flask
 from flask_login import LoginManager
 from flask_migrate import Migrate
 
 from exceptions.exception_handler import add_exception_handler
+from helpers.json_provider import create_json_provider
 from models.user import User
 from models.user_type import UserType
 from models.project import Project
 from models.task import Task
+from repositories.user_repository import UserRepository
+from resources.routers.async_project_routes import async_project_apis
+from resources.routers.async_search_routes import async_search_apis
+from resources.routers.async_user_routes import async_user_apis
 from resources.routers.auth_routes import auth_apis
 from resources.routers.project_routes import project_apis
+from resources.routers.search_routes import search_apis
 from resources.routers.user_routes import user_apis
-from settings.database import db
-from settings.database import get_database_url
-from settings.seed import seed_data
-from sqlalchemy_utils import database_exists, create_database
-
-app = Flask(__name__)
-app.secret_key = os.getenv("SECRET_KEY", "dev-secret-key")
+from settings.async_database import async_db
+from settings.commands import add_commands
+from settings.compression import add_response_compression
+from settings.config import Config
+from settings.database import db, get_engine_options
+from settings.metrics import add_request_metrics
+from settings.replica import REPLICA_BIND_KEY, add_replica_routing
+from settings.slow_queries import add_slow_query_log
+from services.user.user_service import UserService
 
 login_manager = LoginManager()
-login_manager.init_app(app)
+migrate = Migrate(directory=os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations'))
 
 
 @login_manager.user_loader
 def load_user(user_id):
-    return db.session.get(User, int(user_id))
+    return UserService(repository=UserRepository(db_session=db.session)).load_session_user(user_id=int(user_id))
+
 
+def create_app(config: Mapping[str, Any] | object | None = None) -> Flask:
+    """
+    Build the application without touching the database.
 
-migrate = Migrate()
+    ``config`` is a mapping or an object whose uppercase attributes override the defaults of
+    ``Config``. The schema and the seed data are created by the ``init-db`` and ``seed-db``
+    commands instead.
+    When ``DATABASE_REPLICA_URI`` is set, it is added as the ``replica`` bind used by the
+    read-only requests. ``ASYNC_VIEWS`` serves projects, tasks, users and search with the asyncio
+    views and services instead of the synchronous ones. ``METRICS_ENABLED`` adds the
+    ``Server-Timing`` header and the ``/metrics`` endpoint. Statements slower than
+    ``SLOW_QUERY_THRESHOLD_MS`` are logged. Responses are encoded by the ``JSON_PROVIDER``, and
+    compressed as the client accepts when ``COMPRESSION_ENABLED`` is set.
+    """
+    app = Flask(__name__)
+    app.config.from_object(Config)
+    if isinstance(config, Mapping):
+        app.config.from_mapping(config)
+    elif config is not None:
+        app.config.from_object(config)
+    app.json = create_json_provider(app)
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", get_engine_options(app.config["SQLALCHEMY_DATABASE_URI"]))
+    if app.config.get("DATABASE_REPLICA_URI"):
+        replica_uri = app.config["DATABASE_REPLICA_URI"]
+        app.config["SQLALCHEMY_BINDS"] = {
+            **app.config.get("SQLALCHEMY_BINDS", {}),
+            REPLICA_BIND_KEY: {"url": replica_uri, **get_engine_options(replica_uri)},
+        }
 
-app.config['SQLALCHEMY_DATABASE_URI'] = get_database_url()
-app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
+    login_manager.init_app(app)
+    db.init_app(app)
+    migrate.init_app(app, db)
+    add_replica_routing(app, db)
+    if app.config["METRICS_ENABLED"]:
+        add_request_metrics(app, db)
+    # Registered after the metrics, so it runs before them and the response size counts compressed bytes.
+    add_response_compression(app)
+    add_slow_query_log(app, db)
 
-db.init_app(app)
-with app.app_context():
-    if not database_exists(get_database_url()):
-        create_database(get_database_url())
-    db.create_all()
-    seed_data(db.session)
-migrate.init_app(app, db)
+    if app.config["ASYNC_VIEWS"]:
+        async_db.init_app(app)
+        app.register_blueprint(async_user_apis, url_prefix='/users')
+        app.register_blueprint(async_project_apis, url_prefix='/projects')
+        app.register_blueprint(async_search_apis, url_prefix='/search')
+    else:
+        app.register_blueprint(user_apis, url_prefix='/users')
+        app.register_blueprint(project_apis, url_prefix='/projects')
+        app.register_blueprint(search_apis, url_prefix='/search')
+    app.register_blueprint(auth_apis, url_prefix="/auth")
 
-app.register_blueprint(user_apis, url_prefix='/users')
-app.register_blueprint(project_apis, url_prefix='/projects')
-app.register_blueprint(auth_apis, url_prefix="/auth")
+    add_exception_handler(app)
+    add_commands(app)
+    return app
 
-add_exception_handler(app)
 
 if __name__ == '__main__':
-    app.run(debug=True)
+    create_app().run(debug=True)
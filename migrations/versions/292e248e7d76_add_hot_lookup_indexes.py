@@ -0,0 +1,40 @@
+"""add hot lookup indexes
+
+Revision ID: 292e248e7d76
+Revises: a82cb6569e50
+Create Date: 2026-10-18 10:28:30.125563
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '292e248e7d76'
+down_revision = 'a82cb6569e50'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_project_created_by', 'project', ['created_by']),
+    ('ix_project_updated_by', 'project', ['updated_by']),
+    ('ix_task_created_by', 'task', ['created_by']),
+    ('ix_task_project_id_id', 'task', ['project_id', 'id']),
+    ('ix_task_project_id_due_date', 'task', ['project_id', 'due_date']),
+    ('ix_user_created_by', 'user', ['created_by']),
+    ('ix_user_updated_by', 'user', ['updated_by']),
+    ('ix_user_user_type', 'user', ['user_type']),
+)
+
+
+def upgrade():
+    # Built concurrently on Postgres so the task table stays writable while the indexes are created.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, unique=False, postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
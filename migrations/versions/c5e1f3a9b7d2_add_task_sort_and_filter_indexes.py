@@ -0,0 +1,41 @@
+"""add task sort and filter indexes
+
+Revision ID: c5e1f3a9b7d2
+Revises: 41d8760fed15
+Create Date: 2026-10-18 14:05:41.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5e1f3a9b7d2'
+down_revision = '41d8760fed15'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_task_project_id_due_date_id', ['project_id', 'due_date', 'id'], {}),
+    ('ix_task_project_id_created_at_id', ['project_id', 'created_at', 'id'], {}),
+    # text_pattern_ops lets Postgres serve the LIKE 'prefix%' of name_prefix from the index whatever the collation.
+    ('ix_task_project_id_name', ['project_id', 'name'], {'postgresql_ops': {'name': 'text_pattern_ops'}}),
+)
+
+
+def upgrade():
+    # The id makes the keyset pages of the sorted task lists a single range of the index.
+    with op.get_context().autocommit_block():
+        for name, columns, options in INDEXES:
+            op.create_index(name, 'task', columns, unique=False, postgresql_concurrently=True, **options)
+        op.drop_index('ix_task_project_id_due_date', table_name='task', postgresql_concurrently=True)
+
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_task_project_id_due_date', 'task', ['project_id', 'due_date'], unique=False,
+            postgresql_concurrently=True
+        )
+        for name, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name='task', postgresql_concurrently=True)
@@ -0,0 +1,103 @@
+"""add full text search
+
+Revision ID: d7a2b4c6e8f1
+Revises: c5e1f3a9b7d2
+Create Date: 2026-10-18 16:42:09.127354
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'd7a2b4c6e8f1'
+down_revision = 'c5e1f3a9b7d2'
+branch_labels = None
+depends_on = None
+
+# Searched columns of each table, the first one weighted above the second.
+SEARCHED = {
+    'project': ('name', 'subject'),
+    'task': ('name', 'description'),
+}
+# Rows of the existing tables given their search vector per transaction.
+BACKFILL_BATCH_SIZE = 10000
+
+
+def search_vector(columns, row=''):
+    # The 'simple' configuration does not stem, so the prefix of a word being typed still matches it.
+    first, second = columns
+    return (
+        f"setweight(to_tsvector('simple', coalesce({row}{first}, '')), 'A') || "
+        f"setweight(to_tsvector('simple', coalesce({row}{second}, '')), 'B')"
+    )
+
+
+def upgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        # A generated column would rewrite the whole table under an exclusive lock, so the vectors
+        # are set by a trigger on the new and updated rows, and by batches of their own on the
+        # existing ones while the table stays writable.
+        for table, columns in SEARCHED.items():
+            first, second = columns
+            op.add_column(table, sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+            op.execute(
+                f"CREATE FUNCTION {table}_search_vector() RETURNS trigger LANGUAGE plpgsql AS $$ "
+                f"BEGIN NEW.search_vector := {search_vector(columns, 'NEW.')}; RETURN NEW; END $$"
+            )
+            op.execute(
+                f"CREATE TRIGGER {table}_search_vector BEFORE INSERT OR UPDATE OF {first}, {second} ON {table} "
+                f"FOR EACH ROW EXECUTE FUNCTION {table}_search_vector()"
+            )
+        with op.get_context().autocommit_block():
+            for table, columns in SEARCHED.items():
+                last_id = op.get_bind().scalar(sa.text(f"SELECT max(id) FROM {table}")) or 0
+                for start in range(0, last_id, BACKFILL_BATCH_SIZE):
+                    op.execute(
+                        f"UPDATE {table} SET search_vector = {search_vector(columns)} "
+                        f"WHERE id > {start} AND id <= {start + BACKFILL_BATCH_SIZE} AND search_vector IS NULL"
+                    )
+            for table in SEARCHED:
+                op.create_index(
+                    f'ix_{table}_search_vector', table, ['search_vector'], unique=False,
+                    postgresql_using='gin', postgresql_concurrently=True
+                )
+    elif op.get_bind().dialect.name == 'sqlite':
+        # External content FTS5 tables hold the index only, and triggers keep it in step with the rows.
+        # The prefix indexes serve the short prefixes of the word being typed, which match the most rows.
+        for table, (first, second) in SEARCHED.items():
+            search = f'{table}_search'
+            op.execute(
+                f"CREATE VIRTUAL TABLE {search} USING fts5("
+                f"{first}, {second}, content='{table}', content_rowid='id', prefix='2 3 4')"
+            )
+            insert = f"INSERT INTO {search}(rowid, {first}, {second}) VALUES (new.id, new.{first}, new.{second});"
+            delete = (
+                f"INSERT INTO {search}({search}, rowid, {first}, {second}) "
+                f"VALUES ('delete', old.id, old.{first}, old.{second});"
+            )
+            op.execute(f"CREATE TRIGGER {search}_insert AFTER INSERT ON {table} BEGIN {insert} END")
+            op.execute(f"CREATE TRIGGER {search}_delete AFTER DELETE ON {table} BEGIN {delete} END")
+            op.execute(
+                f"CREATE TRIGGER {search}_update AFTER UPDATE OF {first}, {second} ON {table} "
+                f"BEGIN {delete} {insert} END"
+            )
+            op.execute(f"INSERT INTO {search}({search}) VALUES ('rebuild')")
+
+
+def downgrade():
+    if op.get_bind().dialect.name == 'postgresql':
+        with op.get_context().autocommit_block():
+            for table in SEARCHED:
+                op.drop_index(f'ix_{table}_search_vector', table_name=table, postgresql_concurrently=True)
+        for table in SEARCHED:
+            op.execute(f"DROP TRIGGER {table}_search_vector ON {table}")
+            op.execute(f"DROP FUNCTION {table}_search_vector()")
+            op.drop_column(table, 'search_vector')
+    elif op.get_bind().dialect.name == 'sqlite':
+        for table in SEARCHED:
+            search = f'{table}_search'
+            for trigger in ('insert', 'delete', 'update'):
+                op.execute(f"DROP TRIGGER {search}_{trigger}")
+            op.execute(f"DROP TABLE {search}")
@@ -0,0 +1,28 @@
+"""add project task_count
+
+Revision ID: e9b3c5d7f2a4
+Revises: d7a2b4c6e8f1
+Create Date: 2026-10-18 18:21:47.503918
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e9b3c5d7f2a4'
+down_revision = 'd7a2b4c6e8f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Altered in place rather than in batch mode, as rebuilding the table on SQLite would drop its search triggers.
+    op.add_column('project', sa.Column('task_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE project SET task_count = (SELECT count(task.id) FROM task WHERE task.project_id = project.id)"
+    )
+
+
+def downgrade():
+    op.drop_column('project', 'task_count')
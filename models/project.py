@@ -14,8 +14,10 @@ class Project(db.Model):
     due_date = db.Column(db.DateTime)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime)
-    created_by = db.Column(db.Integer, ForeignKey("user.id"))
-    updated_by = db.Column(db.Integer, ForeignKey("user.id"))
+    created_by = db.Column(db.Integer, ForeignKey("user.id"), index=True)
+    updated_by = db.Column(db.Integer, ForeignKey("user.id"), index=True)
+    # Kept up to date by the task repositories as tasks are created, and repaired by ``reconcile-task-counts``.
+    task_count = db.Column(db.Integer, nullable=False, default=0, server_default="0")
 
     def update(self, data: dict[str, str]):
         for key, value in data.items():
@@ -6,6 +6,12 @@ from settings.database import db
 
 class Task(db.Model):
     __tablename__ = 'task'
+    __table_args__ = (
+        db.Index('ix_task_project_id_id', 'project_id', 'id'),
+        db.Index('ix_task_project_id_due_date_id', 'project_id', 'due_date', 'id'),
+        db.Index('ix_task_project_id_created_at_id', 'project_id', 'created_at', 'id'),
+        db.Index('ix_task_project_id_name', 'project_id', 'name', postgresql_ops={'name': 'text_pattern_ops'}),
+    )
 
     id = db.Column(db.Integer, primary_key=True, autoincrement=True)
     name = db.Column(db.String(255), nullable=False)
@@ -14,7 +20,8 @@ class Task(db.Model):
     due_date = db.Column(db.DateTime)
     project_id = db.Column(db.Integer, ForeignKey("project.id"))
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
-    created_by = db.Column(db.Integer, ForeignKey("user.id"))
+    updated_at = db.Column(db.DateTime)
+    created_by = db.Column(db.Integer, ForeignKey("user.id"), index=True)
 
     project = db.relationship("Project", backref="tasks", lazy="joined")
 
@@ -14,11 +14,11 @@ class User(UserMixin, db.Model):
     password = db.Column(db.String(255), nullable=False)
     username = db.Column(db.String(255), nullable=False)
     name = db.Column(db.String(255), nullable=True)
-    user_type = db.Column(db.Integer, ForeignKey("user_type.id"))
+    user_type = db.Column(db.Integer, ForeignKey("user_type.id"), index=True)
     created_at = db.Column(db.DateTime, default=lambda: datetime.now(timezone.utc))
     updated_at = db.Column(db.DateTime)
-    created_by = db.Column(db.Integer, ForeignKey("user.id"))
-    updated_by = db.Column(db.Integer, ForeignKey("user.id"))
+    created_by = db.Column(db.Integer, ForeignKey("user.id"), index=True)
+    updated_by = db.Column(db.Integer, ForeignKey("user.id"), index=True)
 
     type = db.relationship("UserType", backref="users", lazy="joined")
 
@@ -0,0 +1,67 @@
+from datetime import datetime
+
+from sqlalchemy import Row, exists, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import override
+
+from helpers.pagination import keyset
+from models.project import Project
+from repositories.i_async_repository import IAsyncRepository
+from repositories.project_repository import select_project_rows, select_project_summaries
+
+
+class AsyncProjectRepository(IAsyncRepository[Project, int]):
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    @override
+    async def create(self, data: Project) -> Project:
+        self.db_session.add(data)
+        await self.db_session.commit()
+        await self.db_session.refresh(data)
+        return data
+
+    @override
+    async def get_all(self) -> list[Project]:
+        return list((await self.db_session.scalars(select(Project))).all())
+
+    async def get_all_rows(self, fields: tuple[str, ...] | None = None) -> list[Row]:
+        return list((await self.db_session.execute(select_project_rows(fields))).all())
+
+    @override
+    async def get_page(
+            self, after_id: int | None, limit: int, order_by: str = "id", fields: tuple[str, ...] | None = None
+    ) -> list[Row]:
+        statement = keyset(select_project_rows(fields), Project.id, after_id, limit, order_by)
+        return list((await self.db_session.execute(statement)).all())
+
+    async def get_summary_page(self, after_id: int | None, limit: int, now: datetime) -> list[Row]:
+        return list((await self.db_session.execute(select_project_summaries(after_id, limit, now))).all())
+
+    @override
+    async def get_by_id(self, id: int) -> Project | None:
+        return await self.db_session.get(Project, id)
+
+    async def get_version(self, id: int) -> Row | None:
+        version = func.coalesce(Project.updated_at, Project.created_at)
+        statement = select(Project.id, version, Project.task_count).where(Project.id == id)
+        return (await self.db_session.execute(statement)).first()
+
+    async def get_collection_version(self) -> Row:
+        version = func.coalesce(Project.updated_at, Project.created_at)
+        return (await self.db_session.execute(
+            select(func.count(Project.id), func.max(Project.id), func.max(version), func.sum(Project.task_count))
+        )).one()
+
+    async def exists(self, id: int) -> bool:
+        return await self.db_session.scalar(select(exists().where(Project.id == id)))
+
+    @override
+    async def update(self, data: Project) -> Project | None:
+        await self.db_session.commit()
+        return data
+
+    @override
+    async def delete(self, data: Project) -> None:
+        await self.db_session.delete(data)
+        await self.db_session.commit()
@@ -0,0 +1,17 @@
+from typing import Any
+
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from repositories.search_repository import select_search_results
+
+
+class AsyncSearchRepository:
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def search(
+            self, terms: list[str], after: tuple[float, str, int] | None, limit: int, max_candidates: int
+    ) -> list[Row[Any]]:
+        statement = select_search_results(self.db_session.bind.dialect.name, terms, after, limit, max_candidates)
+        return list((await self.db_session.execute(statement)).all())
@@ -0,0 +1,101 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import Row, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing_extensions import override
+
+from helpers.pagination import keyset
+from models.task import Task
+from repositories.i_async_repository import IAsyncRepository
+from repositories.task_repository import (
+    TASK_RESPONSE_COLUMNS,
+    count_new_tasks,
+    select_task_page_by_project,
+    select_task_version_by_project,
+    select_tasks_by_project,
+    tasks_of_project,
+)
+
+
+class AsyncTaskRepository(IAsyncRepository[Task, int]):
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_all_tasks_by_project(
+            self,
+            project_id: int,
+            fields: tuple[str, ...] | None = None,
+            filters: dict[str, Any] | None = None,
+            order_by: str = "id",
+    ) -> list[Row] | None:
+        """
+        Fetch the tasks of a project matching ``filters`` in ``order_by`` order, or ``None`` if
+        the project does not exist.
+        """
+        statement = select_tasks_by_project(project_id=project_id, fields=fields, filters=filters, order_by=order_by)
+        return tasks_of_project((await self.db_session.execute(statement)).all())
+
+    async def get_collection_version_by_project(self, project_id: int) -> Row | None:
+        return (await self.db_session.execute(select_task_version_by_project(project_id=project_id))).first()
+
+    async def get_page_by_project(
+            self,
+            project_id: int,
+            after_id: int | None,
+            limit: int,
+            order_by: str = "id",
+            fields: tuple[str, ...] | None = None,
+            filters: dict[str, Any] | None = None,
+            after_value: datetime | None = None,
+    ) -> list[Row] | None:
+        """
+        Fetch a page of the tasks of a project, or ``None`` if the project does not exist.
+        """
+        statement = select_task_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            limit=limit,
+            order_by=order_by,
+            fields=fields,
+            filters=filters,
+            after_value=after_value,
+        )
+        return tasks_of_project((await self.db_session.execute(statement)).all())
+
+    @override
+    async def create(self, data: Task) -> Task:
+        self.db_session.add(data)
+        for statement in count_new_tasks([data.project_id]):
+            await self.db_session.execute(statement)
+        await self.db_session.commit()
+        await self.db_session.refresh(data)
+        return data
+
+    async def create_many(self, data: list[dict[str, Any]]) -> list[Row]:
+        tasks = (await self.db_session.execute(insert(Task).returning(*TASK_RESPONSE_COLUMNS), data)).all()
+        for statement in count_new_tasks(row.get("project_id") for row in data):
+            await self.db_session.execute(statement)
+        await self.db_session.commit()
+        return list(tasks)
+
+    @override
+    async def get_all(self) -> list[Task]:
+        raise NotImplementedError("Method not implemented.")
+
+    @override
+    async def get_page(self, after_id: int | None, limit: int, order_by: str = "id") -> list[Row]:
+        statement = keyset(select(*TASK_RESPONSE_COLUMNS), Task.id, after_id, limit, order_by)
+        return list((await self.db_session.execute(statement)).all())
+
+    @override
+    async def get_by_id(self, id: int) -> Task | None:
+        raise NotImplementedError("Method not implemented.")
+
+    @override
+    async def update(self, data: Task) -> Task | None:
+        raise NotImplementedError("Method not implemented.")
+
+    @override
+    async def delete(self, data: Task) -> None:
+        raise NotImplementedError("Method not implemented.")
@@ -0,0 +1,67 @@
+from sqlalchemy import Row, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from typing_extensions import override
+
+from helpers.pagination import keyset
+from models.user import User
+from repositories.i_async_repository import IAsyncRepository
+from repositories.user_repository import select_user_rows
+
+
+class AsyncUserRepository(IAsyncRepository[User, int]):
+    """
+    Users are always loaded with their type, since lazy loading is not available on ``AsyncSession``.
+    """
+
+    def __init__(self, db_session: AsyncSession):
+        self.db_session = db_session
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self.db_session.scalar(select(User).options(selectinload(User.type)).where(User.email == email))
+
+    async def get_version(self, id: int) -> Row | None:
+        version = func.coalesce(User.updated_at, User.created_at)
+        return (await self.db_session.execute(select(User.id, version).where(User.id == id))).first()
+
+    async def get_collection_version(self) -> Row:
+        version = func.coalesce(User.updated_at, User.created_at)
+        return (await self.db_session.execute(
+            select(func.count(User.id), func.max(User.id), func.max(version))
+        )).one()
+
+    @override
+    async def create(self, data: User) -> User:
+        self.db_session.add(data)
+        await self.db_session.commit()
+        await self.db_session.refresh(data, ["type"])
+        return data
+
+    @override
+    async def get_all(self) -> list[User]:
+        return list((await self.db_session.scalars(select(User).options(selectinload(User.type)))).all())
+
+    async def get_all_rows(self, fields: tuple[str, ...] | None = None) -> list[Row]:
+        return list((await self.db_session.execute(select_user_rows(fields))).all())
+
+    @override
+    async def get_page(
+            self, after_id: int | None, limit: int, order_by: str = "id", fields: tuple[str, ...] | None = None
+    ) -> list[Row]:
+        statement = keyset(select_user_rows(fields), User.id, after_id, limit, order_by)
+        return list((await self.db_session.execute(statement)).all())
+
+    @override
+    async def get_by_id(self, id: int) -> User | None:
+        return await self.db_session.get(User, id, options=[selectinload(User.type)])
+
+    @override
+    async def update(self, data: User) -> User | None:
+        await self.db_session.commit()
+        await self.db_session.refresh(data, ["type"])
+        return data
+
+    @override
+    async def delete(self, data: User) -> None:
+        await self.db_session.delete(data)
+        await self.db_session.commit()
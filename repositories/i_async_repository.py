@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Generic, TypeVar
+
+from sqlalchemy import Row
+
+T = TypeVar('T', bound='IAsyncRepository')
+I = TypeVar('I', bound='IAsyncRepository')
+
+
+class IAsyncRepository(Generic[T, I], ABC):
+
+    @abstractmethod
+    async def get_all(self) -> list[T]:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    async def get_page(self, after_id: I | None, limit: int, order_by: str = "id") -> list[Row]:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    async def get_by_id(self, id: I) -> T | None:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    async def create(self, data: T) -> T:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    async def update(self, data: T) -> T:
+        raise NotImplementedError("Method not implemented.")
+
+    @abstractmethod
+    async def delete(self, data: T) -> None:
+        raise NotImplementedError("Method not implemented.")
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
+from sqlalchemy import Row
+
 T = TypeVar('T', bound='IRepository')
 I = TypeVar('I', bound='IRepository')
 
@@ -11,6 +13,10 @@ class IRepository(Generic[T, I], ABC):
     def get_all(self) -> list[T]:
         raise NotImplementedError("Method not implemented.")
 
+    @abstractmethod
+    def get_page(self, after_id: I | None, limit: int, order_by: str = "id") -> list[Row]:
+        raise NotImplementedError("Method not implemented.")
+
     @abstractmethod
     def get_by_id(self, id: I) -> T | None:
         raise NotImplementedError("Method not implemented.")
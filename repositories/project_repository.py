@@ -1,8 +1,56 @@
+from datetime import datetime
+from typing import Iterator
+
+from sqlalchemy import Row, Select, exists, func, select, update
 from sqlalchemy.orm import Session
 from typing_extensions import override
 
+from helpers.fields import select_fields
+from helpers.pagination import keyset
 from models.project import Project
+from models.task import Task
 from repositories.i_repository import IRepository
+from settings.replica import on_replica
+
+PROJECT_RESPONSE_COLUMNS = (
+    Project.id,
+    Project.name,
+    Project.subject,
+    Project.start_date,
+    Project.due_date,
+    Project.created_by,
+    Project.updated_by,
+    Project.task_count,
+)
+
+
+def select_project_rows(fields: tuple[str, ...] | None = None) -> Select:
+    """
+    Columns of the project responses, only the ones in ``fields`` when it is given.
+    """
+    return select(*select_fields(PROJECT_RESPONSE_COLUMNS, fields))
+
+
+def select_project_summaries(after_id: int | None, limit: int, now: datetime) -> Select:
+    """
+    Number of tasks, number of overdue tasks and next due date of a page of projects ordered by id.
+
+    The page of projects is picked first, so only the tasks of those projects are grouped, and
+    their due dates are read from the ``(project_id, due_date, id)`` index.
+    """
+    projects = keyset(select(Project.id, Project.name), Project.id, after_id, limit, "id").subquery()
+    return (
+        select(
+            projects.c.id,
+            projects.c.name,
+            func.count(Task.id).label("task_count"),
+            func.count(Task.id).filter(Task.due_date < now).label("overdue_count"),
+            func.min(Task.due_date).filter(Task.due_date >= now).label("next_due_date"),
+        )
+        .join_from(projects, Task, Task.project_id == projects.c.id, isouter=True)
+        .group_by(projects.c.id, projects.c.name)
+        .order_by(projects.c.id)
+    )
 
 
 class ProjectRepository(IRepository[Project, int]):
@@ -18,11 +66,67 @@ class ProjectRepository(IRepository[Project, int]):
 
     @override
     def get_all(self) -> list[Project]:
-        return self.db_session.query(Project).all()
+        return on_replica(self.db_session.query(Project)).all()
+
+    def get_all_rows(self, fields: tuple[str, ...] | None = None) -> list[Row]:
+        return list(self.db_session.execute(on_replica(select_project_rows(fields))).all())
+
+    def iter_all(self, chunk_size: int, fields: tuple[str, ...] | None = None) -> Iterator[Row]:
+        return iter(self.db_session.execute(
+            on_replica(select_project_rows(fields)).order_by(Project.id).execution_options(yield_per=chunk_size)
+        ))
+
+    @override
+    def get_page(
+            self, after_id: int | None, limit: int, order_by: str = "id", fields: tuple[str, ...] | None = None
+    ) -> list[Row]:
+        statement = keyset(on_replica(select_project_rows(fields)), Project.id, after_id, limit, order_by)
+        return list(self.db_session.execute(statement).all())
+
+    def get_summary_page(self, after_id: int | None, limit: int, now: datetime) -> list[Row]:
+        return list(self.db_session.execute(on_replica(select_project_summaries(after_id, limit, now))).all())
 
     @override
     def get_by_id(self, id: int) -> Project | None:
-        return self.db_session.query(Project).filter(Project.id == id).first()
+        return on_replica(self.db_session.query(Project)).filter(Project.id == id).first()
+
+    def get_version(self, id: int) -> Row | None:
+        version = func.coalesce(Project.updated_at, Project.created_at)
+        statement = select(Project.id, version, Project.task_count).where(Project.id == id)
+        return self.db_session.execute(on_replica(statement)).first()
+
+    def get_collection_version(self) -> Row:
+        version = func.coalesce(Project.updated_at, Project.created_at)
+        return self.db_session.execute(
+            on_replica(select(
+                func.count(Project.id), func.max(Project.id), func.max(version), func.sum(Project.task_count)
+            ))
+        ).one()
+
+    def exists(self, id: int) -> bool:
+        return self.db_session.scalar(select(exists().where(Project.id == id)))
+
+    def reconcile_task_counts(self, batch_size: int) -> int:
+        """
+        Recompute the ``task_count`` of every project from its tasks, committing a batch of
+        projects at a time so no transaction locks them all, and return how many had drifted.
+        """
+        counted = select(func.count(Task.id)).where(Task.project_id == Project.id).scalar_subquery()
+        repaired, after_id = 0, 0
+        while True:
+            batch = select(Project.id).where(Project.id > after_id).order_by(Project.id).limit(batch_size).subquery()
+            last_id = self.db_session.scalar(select(func.max(batch.c.id)))
+            if last_id is None:
+                return repaired
+            result = self.db_session.execute(
+                update(Project)
+                .where(Project.id > after_id, Project.id <= last_id, Project.task_count != counted)
+                .values(task_count=counted)
+                .execution_options(synchronize_session=False)
+            )
+            self.db_session.commit()
+            repaired += result.rowcount
+            after_id = last_id
 
     @override
     def update(self, data: Project) -> Project | None:
@@ -0,0 +1,96 @@
+from typing import Any
+
+from sqlalchemy import Double, Integer, Row, Select, and_, cast, func, literal, literal_column, null, or_, select, table
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Session
+
+from helpers.search import fts5_query, tsquery
+from models.project import Project
+from models.task import Task
+from settings.replica import on_replica
+
+# Searched models, with the project of their results. The columns they are searched on are set by the migration.
+SEARCHED_MODELS = {
+    "project": (Project, cast(null(), Integer)),
+    "task": (Task, Task.project_id),
+}
+# Weight of the name against the subject or description, the ratio of the A and B weights of ``ts_rank``.
+NAME_WEIGHT = 2.5
+
+
+def select_ranked_postgresql(kind: str, terms: list[str], max_candidates: int) -> Select:
+    model, project_id = SEARCHED_MODELS[kind]
+    query = func.to_tsquery("simple", tsquery(terms))
+    vector = literal_column(f"{model.__tablename__}.search_vector", type_=TSVECTOR)
+    # The newest matches come from a backward scan of the primary key, stopped after max_candidates
+    # for a query matching most rows, or from the GIN index for a query matching few of them.
+    candidates = (
+        select(model.id)
+        .where(vector.op("@@")(query))
+        .order_by(model.id.desc())
+        .limit(max_candidates)
+        .subquery()
+    )
+    return select(
+        literal(kind).label("type"), model.id, model.name, project_id.label("project_id"),
+        cast(func.ts_rank(vector, query), Double).label("rank"),
+    ).join_from(candidates, model, model.id == candidates.c.id)
+
+
+def select_ranked_sqlite(kind: str, terms: list[str], max_candidates: int) -> Select:
+    model, project_id = SEARCHED_MODELS[kind]
+    name = f"{model.__tablename__}_search"
+    index, rowid = literal_column(name), literal_column(f"{name}.rowid")
+    # FTS5 returns the matches in rowid order, so the newest are read first and only those are scored.
+    # bm25 scores the best matches lowest, so it is negated to rank them first as ts_rank does.
+    candidates = (
+        select(rowid.label("id"), (-func.bm25(index, NAME_WEIGHT, 1.0)).label("rank"))
+        .select_from(table(name))
+        .where(index.op("MATCH")(fts5_query(terms)))
+        .order_by(rowid.desc())
+        .limit(max_candidates)
+        .subquery()
+    )
+    return select(
+        literal(kind).label("type"), model.id, model.name, project_id.label("project_id"), candidates.c.rank
+    ).join_from(candidates, model, model.id == candidates.c.id)
+
+
+def select_search_results(
+        dialect: str, terms: list[str], after: tuple[float, str, int] | None, limit: int, max_candidates: int
+) -> Select:
+    """
+    Projects and tasks matching all ``terms``, best ranked first, from the result ``after``.
+
+    Postgres matches the ``search_vector`` columns through their GIN indexes and SQLite the
+    FTS5 tables. Only the ``max_candidates`` newest matches of each model are ranked, which
+    bounds the cost of a query matching most of the rows, so past them the ranking is
+    approximate: an older match ranked higher is left out.
+    """
+    select_ranked = select_ranked_postgresql if dialect == "postgresql" else select_ranked_sqlite
+    results = select_ranked("project", terms, max_candidates).union_all(
+        select_ranked("task", terms, max_candidates)
+    ).subquery()
+    statement = select(results)
+    if after is not None:
+        rank, kind, after_id = after
+        statement = statement.where(or_(
+            results.c.rank < rank,
+            and_(results.c.rank == rank, or_(
+                results.c.type > kind, and_(results.c.type == kind, results.c.id > after_id)
+            )),
+        ))
+    return statement.order_by(results.c.rank.desc(), results.c.type, results.c.id).limit(limit)
+
+
+class SearchRepository:
+    def __init__(self, db_session: Session):
+        self.db_session = db_session
+
+    def search(
+            self, terms: list[str], after: tuple[float, str, int] | None, limit: int, max_candidates: int
+    ) -> list[Row[Any]]:
+        statement = select_search_results(
+            self.db_session.get_bind().dialect.name, terms, after, limit, max_candidates
+        )
+        return list(self.db_session.execute(on_replica(statement)).all())
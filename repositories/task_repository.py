@@ -1,28 +1,247 @@
+from collections import Counter
+from datetime import datetime
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import Row, Select, Update, and_, func, insert, select, update
 from sqlalchemy.orm import Session
 from typing_extensions import override
 
+from helpers.fields import select_fields
+from helpers.pagination import SORT_KEY, keyset, seek, seek_sorted
+from models.project import Project
 from models.task import Task
 from repositories.i_repository import IRepository
+from settings.replica import on_replica
+
+TASK_RESPONSE_COLUMNS = (
+    Task.id,
+    Task.name,
+    Task.description,
+    Task.start_date,
+    Task.due_date,
+    Task.created_by,
+)
+TASK_SORT_COLUMNS = {"id": Task.id, "due_date": Task.due_date, "created_at": Task.created_at}
+TASK_SORTS = tuple(f"{prefix}{name}" for name in TASK_SORT_COLUMNS for prefix in ("", "-"))
+TASK_FILTERS = {
+    "due_before": lambda value: Task.due_date < value,
+    "due_after": lambda value: Task.due_date > value,
+    "start_after": lambda value: Task.start_date > value,
+    "name_prefix": lambda value: Task.name.startswith(value, autoescape=True),
+    "created_by": lambda value: Task.created_by == value,
+}
+
+
+def count_new_tasks(project_ids: Iterable[int | None]) -> list[Update]:
+    """
+    Statements adding new tasks to the ``task_count`` of their projects, run in the transaction
+    inserting them. The count is incremented in SQL, so concurrent inserts do not lose any.
+    """
+    return [
+        update(Project).where(Project.id == project_id).values(task_count=Project.task_count + count)
+        for project_id, count in Counter(project_ids).items()
+        if project_id is not None
+    ]
+
+
+def filter_tasks(filters: dict[str, Any] | None) -> list[Any]:
+    """
+    Conditions of the task ``filters``, keyed by the names of ``TASK_FILTERS``.
+    """
+    return [TASK_FILTERS[name](value) for name, value in (filters or {}).items()]
+
+
+def sort_tasks(
+        order_by: str, after_id: int | None = None, after_value: datetime | None = None
+) -> tuple[Any | None, list[Any], list[Any]]:
+    """
+    Keyset condition, ordering and extra columns of the tasks sorted by ``order_by``, one of
+    ``TASK_SORTS``. Sorting by another column than the id selects its value as ``SORT_KEY``,
+    which the cursor of the next page is made from.
+    """
+    name = order_by.removeprefix("-")
+    if name not in TASK_SORT_COLUMNS:
+        raise ValueError(f"Unsupported order_by={order_by}.")
+    if name == "id":
+        condition, ordering = seek(Task.id, after_id, order_by)
+        return condition, [ordering], []
+    column = TASK_SORT_COLUMNS[name]
+    condition, ordering = seek_sorted(column, Task.id, after_id, after_value, descending=order_by.startswith("-"))
+    return condition, ordering, [column.label(SORT_KEY)]
+
+
+def select_tasks_by_project(
+        project_id: int,
+        fields: tuple[str, ...] | None = None,
+        filters: dict[str, Any] | None = None,
+        order_by: str = "id",
+) -> Select:
+    """
+    Tasks of a project outer joined from the project, so its existence is confirmed by the same query.
+
+    Only the columns in ``fields`` are selected when it is given. The ``filters`` are part of
+    the join condition, so a project whose tasks are all filtered out is still found.
+    """
+    _, ordering, extra_columns = sort_tasks(order_by)
+    return _select_with_project(
+        project_id=project_id,
+        join_condition=and_(Task.project_id == Project.id, *filter_tasks(filters)),
+        fields=fields,
+        extra_columns=extra_columns,
+    ).order_by(*ordering)
+
+
+def select_task_page_by_project(
+        project_id: int,
+        after_id: int | None,
+        limit: int,
+        order_by: str = "id",
+        fields: tuple[str, ...] | None = None,
+        filters: dict[str, Any] | None = None,
+        after_value: datetime | None = None,
+) -> Select:
+    condition, ordering, extra_columns = sort_tasks(order_by, after_id, after_value)
+    conditions = filter_tasks(filters) + ([condition] if condition is not None else [])
+    return (
+        _select_with_project(
+            project_id=project_id,
+            join_condition=and_(Task.project_id == Project.id, *conditions),
+            fields=fields,
+            extra_columns=extra_columns,
+        )
+        .order_by(*ordering)
+        .limit(limit)
+    )
+
+
+def select_task_version_by_project(project_id: int) -> Select:
+    version = func.coalesce(Task.updated_at, Task.created_at)
+    return (
+        on_replica(select(func.count(Task.id), func.max(Task.id), func.max(version)))
+        .select_from(Project)
+        .outerjoin(Task, Task.project_id == Project.id)
+        .where(Project.id == project_id)
+        .group_by(Project.id)
+    )
+
+
+def tasks_of_project(rows: list[Row]) -> list[Row] | None:
+    """
+    Drop the row of a project without tasks, or return ``None`` if the project was not found.
+    """
+    if not rows:
+        return None
+    return [row for row in rows if row.id is not None]
+
+
+def _select_with_project(
+        project_id: int, join_condition: Any, fields: tuple[str, ...] | None, extra_columns: list[Any]
+) -> Select:
+    return (
+        on_replica(select(
+            Project.id.label("parent_id"), *select_fields(TASK_RESPONSE_COLUMNS, fields), *extra_columns
+        ))
+        .select_from(Project)
+        .outerjoin(Task, join_condition)
+        .where(Project.id == project_id)
+    )
 
 
 class TaskRepository(IRepository[Task, int]):
     def __init__(self, db_session: Session):
         self.db_session = db_session
 
-    def get_all_tasks_by_project(self, project_id: int) -> list[Task]:
-        return self.db_session.query(Task).filter(Task.project_id == project_id).all()
+    def get_all_tasks_by_project(
+            self,
+            project_id: int,
+            fields: tuple[str, ...] | None = None,
+            filters: dict[str, Any] | None = None,
+            order_by: str = "id",
+    ) -> list[Row] | None:
+        """
+        Fetch the tasks of a project matching ``filters`` in ``order_by`` order, or ``None`` if
+        the project does not exist.
+
+        The project is outer joined to its tasks, so its existence is confirmed by the same query.
+        """
+        statement = select_tasks_by_project(project_id=project_id, fields=fields, filters=filters, order_by=order_by)
+        return tasks_of_project(self.db_session.execute(statement).all())
+
+    def get_collection_version_by_project(self, project_id: int) -> Row | None:
+        """
+        Count and latest change of the tasks of a project, or ``None`` if the project does not exist.
+        """
+        return self.db_session.execute(select_task_version_by_project(project_id=project_id)).first()
+
+    def iter_all_tasks_by_project(
+            self,
+            project_id: int,
+            chunk_size: int,
+            fields: tuple[str, ...] | None = None,
+            filters: dict[str, Any] | None = None,
+            order_by: str = "id",
+    ) -> Iterator[Row]:
+        _, ordering, _ = sort_tasks(order_by)
+        statement = (
+            on_replica(select(*select_fields(TASK_RESPONSE_COLUMNS, fields)))
+            .where(Task.project_id == project_id, *filter_tasks(filters))
+            .order_by(*ordering)
+            .execution_options(yield_per=chunk_size)
+        )
+        return iter(self.db_session.execute(statement))
+
+    def get_page_by_project(
+            self,
+            project_id: int,
+            after_id: int | None,
+            limit: int,
+            order_by: str = "id",
+            fields: tuple[str, ...] | None = None,
+            filters: dict[str, Any] | None = None,
+            after_value: datetime | None = None,
+    ) -> list[Row] | None:
+        """
+        Fetch a page of the tasks of a project, or ``None`` if the project does not exist.
+
+        The page starts after the task ``after_id``, whose value of the sort column is
+        ``after_value`` when the tasks are not sorted by id.
+        """
+        statement = select_task_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            limit=limit,
+            order_by=order_by,
+            fields=fields,
+            filters=filters,
+            after_value=after_value,
+        )
+        return tasks_of_project(self.db_session.execute(statement).all())
 
     @override
     def create(self, data: Task) -> Task:
         self.db_session.add(data)
+        for statement in count_new_tasks([data.project_id]):
+            self.db_session.execute(statement)
         self.db_session.commit()
         self.db_session.refresh(data)
         return data
 
+    def create_many(self, data: list[dict[str, Any]]) -> list[Row]:
+        tasks = self.db_session.execute(insert(Task).returning(*TASK_RESPONSE_COLUMNS), data).all()
+        for statement in count_new_tasks(row.get("project_id") for row in data):
+            self.db_session.execute(statement)
+        self.db_session.commit()
+        return list(tasks)
+
     @override
     def get_all(self) -> list[Task]:
         raise NotImplementedError("Method not implemented.")
 
+    @override
+    def get_page(self, after_id: int | None, limit: int, order_by: str = "id") -> list[Row]:
+        statement = keyset(on_replica(select(*TASK_RESPONSE_COLUMNS)), Task.id, after_id, limit, order_by)
+        return list(self.db_session.execute(statement).all())
+
     @override
     def get_by_id(self, id: int) -> Task | None:
         raise NotImplementedError("Method not implemented.")
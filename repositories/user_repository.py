@@ -1,8 +1,37 @@
-from sqlalchemy.orm import Session, joinedload
+from typing import Iterator
+
+from sqlalchemy import Row, Select, func, select
+from sqlalchemy.orm import Session, aliased, joinedload
 from typing_extensions import override
 
+from helpers.fields import select_fields
+from helpers.pagination import keyset
 from models.user import User
+from models.user_type import UserType
 from repositories.i_repository import IRepository
+from settings.replica import on_replica
+
+USER_RESPONSE_TYPE = aliased(UserType, name="type")
+USER_RESPONSE_COLUMNS = (
+    User.id,
+    User.email,
+    User.username,
+    User.name,
+    User.created_by,
+    User.updated_by,
+    USER_RESPONSE_TYPE,
+)
+
+
+def select_user_rows(fields: tuple[str, ...] | None = None) -> Select:
+    """
+    Columns of the user responses, only the ones in ``fields`` when it is given. The user type is
+    only joined when it is selected.
+    """
+    statement = select(*select_fields(USER_RESPONSE_COLUMNS, fields))
+    if fields is None or "type" in fields:
+        statement = statement.outerjoin(USER_RESPONSE_TYPE, User.user_type == USER_RESPONSE_TYPE.id)
+    return statement
 
 
 class UserRepository(IRepository[User, int]):
@@ -12,6 +41,20 @@ class UserRepository(IRepository[User, int]):
     def get_by_email(self, email: str) -> User | None:
         return self.db_session.query(User).options(joinedload(User.type)).filter(User.email == email).first()
 
+    def get_session_fields(self, id: int) -> Row | None:
+        return self.db_session.execute(select(User.id, User.user_type).where(User.id == id)).first()
+
+    def get_version(self, id: int) -> Row | None:
+        return self.db_session.execute(
+            on_replica(select(User.id, func.coalesce(User.updated_at, User.created_at))).where(User.id == id)
+        ).first()
+
+    def get_collection_version(self) -> Row:
+        version = func.coalesce(User.updated_at, User.created_at)
+        return self.db_session.execute(
+            on_replica(select(func.count(User.id), func.max(User.id), func.max(version)))
+        ).one()
+
     @override
     def create(self, data: User) -> User:
         self.db_session.add(data)
@@ -21,11 +64,26 @@ class UserRepository(IRepository[User, int]):
 
     @override
     def get_all(self) -> list[User]:
-        return self.db_session.query(User).all()
+        return on_replica(self.db_session.query(User)).all()
+
+    def get_all_rows(self, fields: tuple[str, ...] | None = None) -> list[Row]:
+        return list(self.db_session.execute(on_replica(select_user_rows(fields))).all())
+
+    def iter_all(self, chunk_size: int, fields: tuple[str, ...] | None = None) -> Iterator[Row]:
+        return iter(self.db_session.execute(
+            on_replica(select_user_rows(fields)).order_by(User.id).execution_options(yield_per=chunk_size)
+        ))
+
+    @override
+    def get_page(
+            self, after_id: int | None, limit: int, order_by: str = "id", fields: tuple[str, ...] | None = None
+    ) -> list[Row]:
+        statement = keyset(on_replica(select_user_rows(fields)), User.id, after_id, limit, order_by)
+        return list(self.db_session.execute(statement).all())
 
     @override
     def get_by_id(self, id: int) -> User | None:
-        return self.db_session.query(User).options(joinedload(User.type)).filter(User.id == id).first()
+        return on_replica(self.db_session.query(User)).options(joinedload(User.type)).filter(User.id == id).first()
 
     @override
     def update(self, data: User) -> User | None:
@@ -0,0 +1,13 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class PageRequest(BaseModel):
+    limit: Optional[int] = Field(default=None, ge=1, examples=[50])
+    cursor: Optional[str] = Field(default=None, examples=['eyJpZCI6IDUwfQ=='])
+    stream: bool = Field(default=False, examples=[True])
+    fields: Optional[str] = Field(default=None, examples=['id,name,due_date'])
+
+    def is_paginated(self) -> bool:
+        return self.limit is not None or self.cursor is not None
@@ -0,0 +1,8 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class ProjectSummaryRequest(BaseModel):
+    limit: Optional[int] = Field(default=None, ge=1, examples=[50])
+    cursor: Optional[str] = Field(default=None, examples=['eyJpZCI6IDUwfQ=='])
@@ -0,0 +1,9 @@
+from typing import Optional
+
+from pydantic import BaseModel, Field
+
+
+class SearchRequest(BaseModel):
+    q: str = Field(min_length=1, max_length=200, examples=['design review'])
+    limit: Optional[int] = Field(default=None, ge=1, examples=[20])
+    cursor: Optional[str] = Field(default=None, examples=['eyJyYW5rIjogMC4xLCAidHlwZSI6ICJ0YXNrIiwgImlkIjogNX0='])
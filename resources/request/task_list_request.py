@@ -0,0 +1,22 @@
+from datetime import datetime
+from typing import Any, Literal, Optional
+
+from pydantic import Field
+
+from resources.request.page_request import PageRequest
+
+TASK_FILTER_NAMES = ("due_before", "due_after", "start_after", "name_prefix", "created_by")
+
+
+class TaskListRequest(PageRequest):
+    due_before: Optional[datetime] = Field(default=None, examples=['2025-11-01T00:00:00Z'])
+    due_after: Optional[datetime] = Field(default=None, examples=['2025-10-01T00:00:00Z'])
+    start_after: Optional[datetime] = Field(default=None, examples=['2025-10-01T00:00:00Z'])
+    name_prefix: Optional[str] = Field(default=None, min_length=1, examples=['Create'])
+    created_by: Optional[int] = Field(default=None, examples=[1])
+    sort: Literal["id", "-id", "due_date", "-due_date", "created_at", "-created_at"] = Field(
+        default="id", examples=['due_date', '-created_at']
+    )
+
+    def filters(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in TASK_FILTER_NAMES if getattr(self, name) is not None}
@@ -12,6 +12,7 @@ class ProjectResponse(BaseModel):
     due_date: Optional[datetime]
     created_by: int
     updated_by: Optional[int]
+    task_count: int
 
     model_config = ConfigDict()
     model_config['from_attributes'] = True
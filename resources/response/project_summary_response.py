@@ -0,0 +1,15 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+
+
+class ProjectSummaryResponse(BaseModel):
+    id: int
+    name: str
+    task_count: int
+    overdue_count: int
+    next_due_date: Optional[datetime]
+
+    model_config = ConfigDict()
+    model_config['from_attributes'] = True
@@ -0,0 +1,14 @@
+from typing import Literal, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SearchResultResponse(BaseModel):
+    type: Literal["project", "task"]
+    id: int
+    name: str
+    project_id: Optional[int]
+    rank: float
+
+    model_config = ConfigDict()
+    model_config['from_attributes'] = True
@@ -0,0 +1,244 @@
+from flask import Blueprint, request
+from flask_pydantic import validate
+
+from decorators.decorators import cached, conditional_async, manager_required, query_budget
+from helpers.streaming import stream_response, wants_ndjson
+from repositories.async_project_repository import AsyncProjectRepository
+from repositories.async_task_repository import AsyncTaskRepository
+from resources.request.page_request import PageRequest
+from resources.request.project_request import ProjectRequest
+from resources.request.project_summary_request import ProjectSummaryRequest
+from resources.request.task_list_request import TaskListRequest
+from resources.request.task_request import TaskRequest
+from services.project.async_project_service import AsyncProjectService
+from services.task.async_task_service import AsyncTaskService
+from settings.async_database import async_db
+
+async_project_apis = Blueprint('async_project_apis', __name__)
+
+
+@async_project_apis.route('/', methods=['POST'])
+@query_budget(3)
+@validate()
+@manager_required
+async def create_project(body: ProjectRequest):
+    """
+    Create a new project. Only accessible by managers.
+
+    :param body: ProjectRequest object containing project details
+    :type body: ProjectRequest
+    :return: JSON representation of the created project
+    :rtype: dict
+    :raises BadRequest: if request body is invalid
+    """
+    async with async_db.session() as session:
+        return await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).create_project(body=body)
+
+
+@async_project_apis.route('/', methods=['GET'])
+@query_budget(3)
+@cached("projects")
+@validate()
+async def get_projects(query: PageRequest):
+    """
+    Retrieve all projects.
+
+    Accepts the same ``limit``, ``cursor``, ``stream`` and ``fields`` parameters as the synchronous view.
+    A streamed list is fetched in full before the response starts.
+
+    :param query: PageRequest object with the optional limit, cursor, stream flag and fields
+    :type query: PageRequest
+    :return: List of projects in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
+    :raises BadRequest: if the cursor or a field is invalid
+    """
+    async with async_db.session() as session:
+        service = AsyncProjectService(repository=AsyncProjectRepository(db_session=session))
+
+        async def view():
+            ndjson = wants_ndjson()
+            if query.stream or ndjson:
+                return stream_response(
+                    await service.stream_projects(ndjson=ndjson, fields=query.fields), ndjson=ndjson
+                )
+            if query.is_paginated():
+                return await service.get_projects_page(cursor=query.cursor, limit=query.limit, fields=query.fields)
+            return await service.get_projects(fields=query.fields)
+
+        return await conditional_async(await service.get_projects_version(), view)
+
+
+@async_project_apis.route('/summary', methods=['GET'])
+@query_budget(2)
+@cached("projects", "tasks")
+@validate()
+async def get_projects_summary(query: ProjectSummaryRequest):
+    """
+    Retrieve the number of tasks, the number of overdue tasks and the next due date of each project.
+
+    Accepts the same ``limit`` and ``cursor`` parameters as the synchronous view.
+
+    :param query: ProjectSummaryRequest object with the optional limit and cursor
+    :type query: ProjectSummaryRequest
+    :return: Page with ``items`` of ``id``, ``name``, ``task_count``, ``overdue_count`` and ``next_due_date``
+    :rtype: dict
+    :raises BadRequest: if the cursor is invalid
+    """
+    async with async_db.session() as session:
+        return await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).get_projects_summary(cursor=query.cursor, limit=query.limit)
+
+
+@async_project_apis.route('/<int:project_id>', methods=['GET'])
+@query_budget(3)
+@cached("projects")
+async def get_project(project_id: int):
+    """
+    Retrieve a single project by ID.
+
+    :param project_id: ID of the project
+    :type project_id: int
+    :return: Project details in JSON format
+    :rtype: dict
+    :raises NotFound: if project with given ID does not exist
+    """
+    async with async_db.session() as session:
+        service = AsyncProjectService(repository=AsyncProjectRepository(db_session=session))
+        return await conditional_async(
+            await service.get_project_version(project_id=project_id),
+            lambda: service.get_project(project_id=project_id),
+        )
+
+
+@async_project_apis.route('/<int:project_id>', methods=['PUT'])
+@query_budget(3)
+@validate()
+@manager_required
+async def update_project(project_id: int, body: ProjectRequest):
+    """
+    Update an existing project. Only accessible by managers.
+
+    :param project_id: ID of the project to update
+    :type project_id: int
+    :param body: ProjectRequest object with updated project data
+    :type body: ProjectRequest
+    :return: Updated project details in JSON format
+    :rtype: dict
+    :raises NotFound: if project with given ID does not exist
+    :raises BadRequest: if request body is invalid
+    """
+    async with async_db.session() as session:
+        return await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).update_project(project_id=project_id, body=body)
+
+
+@async_project_apis.route('/<int:project_id>', methods=['DELETE'])
+@query_budget(5)
+@manager_required
+async def delete_project(project_id: int):
+    """
+    Delete a project by ID. Only accessible by managers.
+
+    :param project_id: ID of the project to delete
+    :type project_id: int
+    :return: Response with deletion confirmation
+    :rtype: flask.Response
+    :raises NotFound: if project with given ID does not exist
+    """
+    async with async_db.session() as session:
+        return await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).delete_project(project_id=project_id)
+
+
+@async_project_apis.route('/<int:project_id>/tasks', methods=['POST'])
+@query_budget(5)
+@validate()
+@manager_required
+async def create_task(project_id: int, body: TaskRequest):
+    """
+    Create a new task under a project. Only accessible by managers.
+
+    :param project_id: ID of the parent project
+    :type project_id: int
+    :param body: TaskRequest object with task details
+    :type body: TaskRequest
+    :return: JSON representation of the created task
+    :rtype: dict
+    :raises NotFound: if parent project does not exist
+    :raises BadRequest: if request body is invalid
+    """
+    async with async_db.session() as session:
+        await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).ensure_project_exists(project_id=project_id)
+        return await AsyncTaskService(
+            repository=AsyncTaskRepository(db_session=session)
+        ).create_task(project_id=project_id, body=body)
+
+
+@async_project_apis.route('/<int:project_id>/tasks/bulk', methods=['POST'])
+@query_budget(4)
+@manager_required
+async def create_tasks(project_id: int):
+    """
+    Create many tasks under a project in a single request. Only accessible by managers.
+
+    :param project_id: ID of the parent project
+    :type project_id: int
+    :return: JSON object with the ``created`` tasks and the ``failed`` items
+    :rtype: dict
+    :raises NotFound: if parent project does not exist
+    :raises BadRequest: if request body is not a non-empty array within the batch limit
+    """
+    async with async_db.session() as session:
+        await AsyncProjectService(
+            repository=AsyncProjectRepository(db_session=session)
+        ).ensure_project_exists(project_id=project_id)
+        return await AsyncTaskService(
+            repository=AsyncTaskRepository(db_session=session)
+        ).create_tasks(project_id=project_id, items=request.get_json(silent=True))
+
+
+@async_project_apis.route('/<int:project_id>/tasks', methods=['GET'])
+@query_budget(3)
+@cached("projects", "tasks")
+@validate()
+async def get_tasks_by_project(project_id: int, query: TaskListRequest):
+    """
+    Retrieve all tasks for a specific project.
+
+    Accepts the same page parameters, filters and ``sort`` as the synchronous view.
+    A streamed list is fetched in full before the response starts.
+
+    :param project_id: ID of the project
+    :type project_id: int
+    :param query: TaskListRequest object with the page parameters, the filters and the sort
+    :type query: TaskListRequest
+    :return: List of tasks in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
+    :raises NotFound: if project with given ID does not exist
+    :raises BadRequest: if the cursor or a field is invalid
+    """
+    async with async_db.session() as session:
+        service = AsyncTaskService(repository=AsyncTaskRepository(db_session=session))
+
+        async def view():
+            ndjson = wants_ndjson()
+            options = {"fields": query.fields, "filters": query.filters(), "sort": query.sort}
+            if query.stream or ndjson:
+                return stream_response(
+                    await service.stream_tasks_by_project(project_id=project_id, ndjson=ndjson, **options),
+                    ndjson=ndjson,
+                )
+            if query.is_paginated():
+                return await service.get_tasks_page_by_project(
+                    project_id=project_id, cursor=query.cursor, limit=query.limit, **options
+                )
+            return await service.get_tasks_by_project(project_id=project_id, **options)
+
+        return await conditional_async(await service.get_tasks_version(project_id=project_id), view)
@@ -0,0 +1,32 @@
+from flask import Blueprint
+from flask_pydantic import validate
+
+from decorators.decorators import cached, query_budget
+from repositories.async_search_repository import AsyncSearchRepository
+from resources.request.search_request import SearchRequest
+from services.search.async_search_service import AsyncSearchService
+from settings.async_database import async_db
+
+async_search_apis = Blueprint('async_search_apis', __name__)
+
+
+@async_search_apis.route('', methods=['GET'])
+@query_budget(2)
+@cached("projects", "tasks")
+@validate()
+async def search(query: SearchRequest):
+    """
+    Search the projects and the tasks.
+
+    Accepts the same ``q``, ``limit`` and ``cursor`` parameters as the synchronous view.
+
+    :param query: SearchRequest object with the query and the optional limit and cursor
+    :type query: SearchRequest
+    :return: Page with ``items`` of ``type``, ``id``, ``name``, ``project_id`` and ``rank``, and ``next_cursor``
+    :rtype: dict
+    :raises BadRequest: if the query has no word or the cursor is invalid
+    """
+    async with async_db.session() as session:
+        return await AsyncSearchService(
+            repository=AsyncSearchRepository(db_session=session)
+        ).search(q=query.q, cursor=query.cursor, limit=query.limit)
@@ -0,0 +1,123 @@
+from flask import Blueprint
+from flask_pydantic import validate
+
+from decorators.decorators import cached, conditional_async, manager_required, query_budget
+from helpers.streaming import stream_response, wants_ndjson
+from repositories.async_user_repository import AsyncUserRepository
+from resources.request.page_request import PageRequest
+from resources.request.user_request import CreateUserRequest, UpdateUserRequest
+from services.user.async_user_service import AsyncUserService
+from settings.async_database import async_db
+
+async_user_apis = Blueprint('async_user_apis', __name__)
+
+
+@async_user_apis.route('/', methods=['POST'])
+@query_budget(4)
+@validate()
+@manager_required
+async def create_user(body: CreateUserRequest):
+    """
+    Create a new user. Only accessible by managers.
+
+    :param body: CreateUserRequest object containing user data
+    :type body: CreateUserRequest
+    :return: JSON representation of the created user
+    :rtype: dict
+    :raises BadRequest: if request body is invalid
+    :raises Conflict: if user email already exists
+    """
+    async with async_db.session() as session:
+        return await AsyncUserService(repository=AsyncUserRepository(db_session=session)).create_user(body=body)
+
+
+@async_user_apis.route('/', methods=['GET'])
+@query_budget(3)
+@cached("users")
+@validate()
+async def get_users(query: PageRequest):
+    """
+    Retrieve all users.
+
+    Accepts the same ``limit``, ``cursor``, ``stream`` and ``fields`` parameters as the synchronous view.
+    A streamed list is fetched in full before the response starts.
+
+    :param query: PageRequest object with the optional limit, cursor, stream flag and fields
+    :type query: PageRequest
+    :return: List of users in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
+    :raises BadRequest: if the cursor or a field is invalid
+    """
+    async with async_db.session() as session:
+        service = AsyncUserService(repository=AsyncUserRepository(db_session=session))
+
+        async def view():
+            ndjson = wants_ndjson()
+            if query.stream or ndjson:
+                return stream_response(await service.stream_users(ndjson=ndjson, fields=query.fields), ndjson=ndjson)
+            if query.is_paginated():
+                return await service.get_users_page(cursor=query.cursor, limit=query.limit, fields=query.fields)
+            return await service.get_users(fields=query.fields)
+
+        return await conditional_async(await service.get_users_version(), view)
+
+
+@async_user_apis.route('/<int:user_id>', methods=['GET'])
+@query_budget(3)
+@cached("users")
+async def get_user(user_id: int):
+    """
+    Retrieve a single user by ID.
+
+    :param user_id: ID of the user
+    :type user_id: int
+    :return: User details in JSON format
+    :rtype: dict
+    :raises NotFound: if user with given ID does not exist
+    """
+    async with async_db.session() as session:
+        service = AsyncUserService(repository=AsyncUserRepository(db_session=session))
+        return await conditional_async(
+            await service.get_user_version(user_id=user_id), lambda: service.get_user(user_id=user_id)
+        )
+
+
+@async_user_apis.route('/<int:user_id>', methods=['PUT'])
+@query_budget(5)
+@validate()
+@manager_required
+async def update_user(user_id: int, body: UpdateUserRequest):
+    """
+    Update an existing user. Only accessible by managers.
+
+    :param user_id: ID of the user to update
+    :type user_id: int
+    :param body: UpdateUserRequest object with updated user data
+    :type body: UpdateUserRequest
+    :return: Updated user details in JSON format
+    :rtype: dict
+    :raises BadRequest: if request body is invalid
+    :raises NotFound: if user with given ID does not exist
+    """
+    async with async_db.session() as session:
+        return await AsyncUserService(
+            repository=AsyncUserRepository(db_session=session)
+        ).update_user(user_id=user_id, body=body)
+
+
+@async_user_apis.route('/<int:user_id>', methods=['DELETE'])
+@query_budget(3)
+@manager_required
+async def delete_user(user_id: int):
+    """
+    Delete a user by ID. Only accessible by managers.
+
+    :param user_id: ID of the user to delete
+    :type user_id: int
+    :return: Response with deletion confirmation
+    :rtype: flask.Response
+    :raises NotFound: if user with given ID does not exist
+    :raises UnprocessableEntity: if trying to delete the currently logged-in user
+    """
+    async with async_db.session() as session:
+        return await AsyncUserService(repository=AsyncUserRepository(db_session=session)).delete_user(user_id=user_id)
@@ -1,6 +1,7 @@
 from flask import Blueprint, request, Response
 from flask_login import logout_user, login_required
 
+from decorators.decorators import query_budget
 from repositories.user_repository import UserRepository
 from services.user.user_service import UserService
 from settings.database import db
@@ -9,6 +10,7 @@ auth_apis = Blueprint('auth_apis', __name__)
 
 
 @auth_apis.route("/login", methods=["POST"])
+@query_budget(2)
 def login():
     """
     Authenticate a user and log them in.
@@ -26,6 +28,7 @@ def login():
 
 
 @auth_apis.route("/logout", methods=["POST"])
+@query_budget(1)
 @login_required
 def logout():
     """
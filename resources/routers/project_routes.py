@@ -1,11 +1,14 @@
-from flask import Blueprint
+from flask import Blueprint, request
 from flask_pydantic import validate
-from werkzeug.exceptions import NotFound
 
-from decorators.decorators import manager_required
+from decorators.decorators import cached, conditional, manager_required, query_budget
+from helpers.streaming import stream_response, wants_ndjson
 from repositories.project_repository import ProjectRepository
 from repositories.task_repository import TaskRepository
+from resources.request.page_request import PageRequest
 from resources.request.project_request import ProjectRequest
+from resources.request.project_summary_request import ProjectSummaryRequest
+from resources.request.task_list_request import TaskListRequest
 from resources.request.task_request import TaskRequest
 from services.project.project_service import ProjectService
 from services.task.task_service import TaskService
@@ -14,7 +17,20 @@ from settings.database import db
 project_apis = Blueprint('project_apis', __name__)
 
 
+def _projects_version():
+    return ProjectService(repository=ProjectRepository(db_session=db.session)).get_projects_version()
+
+
+def _project_version(project_id: int):
+    return ProjectService(repository=ProjectRepository(db_session=db.session)).get_project_version(project_id=project_id)
+
+
+def _tasks_version(project_id: int):
+    return TaskService(repository=TaskRepository(db_session=db.session)).get_tasks_version(project_id=project_id)
+
+
 @project_apis.route('/', methods=['POST'])
+@query_budget(3)
 @validate()
 @manager_required
 def create_project(body: ProjectRequest):
@@ -31,21 +47,70 @@ def create_project(body: ProjectRequest):
 
 
 @project_apis.route('/', methods=['GET'])
-def get_projects():
+@query_budget(3)
+@cached("projects")
+@conditional(_projects_version)
+@validate()
+def get_projects(query: PageRequest):
     """
     Retrieve all projects.
 
-    :return: List of projects in JSON format
-    :rtype: list[dict]
+    When ``limit`` or ``cursor`` query parameters are given, a single page is returned
+    instead, ordered by id, together with the cursor of the next page. With ``stream=true``
+    or ``Accept: application/x-ndjson`` the full list is streamed in chunks instead.
+    ``fields`` restricts the items, and the selected columns, to a comma separated list of
+    fields; ``id`` is always included.
+
+    Responses carry an ETag; a request whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+
+    :param query: PageRequest object with the optional limit, cursor, stream flag and fields
+    :type query: PageRequest
+    :return: List of projects in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
+    :raises BadRequest: if the cursor or a field is invalid
     """
-    return ProjectService(repository=ProjectRepository(db_session=db.session)).get_projects()
+    service = ProjectService(repository=ProjectRepository(db_session=db.session))
+    ndjson = wants_ndjson()
+    if query.stream or ndjson:
+        return stream_response(service.stream_projects(ndjson=ndjson, fields=query.fields), ndjson=ndjson)
+    if query.is_paginated():
+        return service.get_projects_page(cursor=query.cursor, limit=query.limit, fields=query.fields)
+    return service.get_projects(fields=query.fields)
+
+
+@project_apis.route('/summary', methods=['GET'])
+@query_budget(2)
+@cached("projects", "tasks")
+@validate()
+def get_projects_summary(query: ProjectSummaryRequest):
+    """
+    Retrieve the number of tasks, the number of overdue tasks and the next due date of each project.
+
+    Projects are returned a page at a time, ordered by id, as ``items`` together with the
+    cursor of the next page, and counted by a single query per page. A task is overdue when
+    its due date has passed at the time of the request.
+
+    :param query: ProjectSummaryRequest object with the optional limit and cursor
+    :type query: ProjectSummaryRequest
+    :return: Page with ``items`` of ``id``, ``name``, ``task_count``, ``overdue_count`` and ``next_due_date``
+    :rtype: dict
+    :raises BadRequest: if the cursor is invalid
+    """
+    return ProjectService(
+        repository=ProjectRepository(db_session=db.session)
+    ).get_projects_summary(cursor=query.cursor, limit=query.limit)
 
 
 @project_apis.route('/<int:project_id>', methods=['GET'])
+@query_budget(3)
+@cached("projects")
+@conditional(_project_version)
 def get_project(project_id: int):
     """
     Retrieve a single project by ID.
 
+    Responses carry an ETag; a request whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+
     :param project_id: ID of the project
     :type project_id: int
     :return: Project details in JSON format
@@ -56,6 +121,7 @@ def get_project(project_id: int):
 
 
 @project_apis.route('/<int:project_id>', methods=['PUT'])
+@query_budget(3)
 @validate()
 @manager_required
 def update_project(project_id: int, body: ProjectRequest):
@@ -77,6 +143,7 @@ def update_project(project_id: int, body: ProjectRequest):
 
 
 @project_apis.route('/<int:project_id>', methods=['DELETE'])
+@query_budget(5)
 @manager_required
 def delete_project(project_id: int):
     """
@@ -92,6 +159,7 @@ def delete_project(project_id: int):
 
 
 @project_apis.route('/<int:project_id>/tasks', methods=['POST'])
+@query_budget(5)
 @validate()
 @manager_required
 def create_task(project_id: int, body: TaskRequest):
@@ -107,22 +175,73 @@ def create_task(project_id: int, body: TaskRequest):
     :raises NotFound: if parent project does not exist
     :raises BadRequest: if request body is invalid
     """
-    if not ProjectService(repository=ProjectRepository(db_session=db.session)).get_project(project_id=project_id):
-        raise NotFound(f'Not found project with id={project_id}.')
+    ProjectService(repository=ProjectRepository(db_session=db.session)).ensure_project_exists(project_id=project_id)
     return TaskService(repository=TaskRepository(db_session=db.session)).create_task(project_id=project_id, body=body)
 
 
+@project_apis.route('/<int:project_id>/tasks/bulk', methods=['POST'])
+@query_budget(4)
+@manager_required
+def create_tasks(project_id: int):
+    """
+    Create many tasks under a project in a single request. Only accessible by managers.
+
+    Expects a JSON array of TaskRequest objects. All valid items are inserted in one
+    statement and transaction; invalid items are reported by their index in the array.
+
+    :param project_id: ID of the parent project
+    :type project_id: int
+    :return: JSON object with the ``created`` tasks and the ``failed`` items
+    :rtype: dict
+    :raises NotFound: if parent project does not exist
+    :raises BadRequest: if request body is not a non-empty array within the batch limit
+    """
+    ProjectService(repository=ProjectRepository(db_session=db.session)).ensure_project_exists(project_id=project_id)
+    return TaskService(
+        repository=TaskRepository(db_session=db.session)
+    ).create_tasks(project_id=project_id, items=request.get_json(silent=True))
+
+
 @project_apis.route('/<int:project_id>/tasks', methods=['GET'])
-def get_tasks_by_project(project_id: int):
+@query_budget(3)
+@cached("projects", "tasks")
+@conditional(_tasks_version)
+@validate()
+def get_tasks_by_project(project_id: int, query: TaskListRequest):
     """
     Retrieve all tasks for a specific project.
 
+    ``due_before``, ``due_after``, ``start_after``, ``name_prefix`` and ``created_by`` filter
+    the tasks, and ``sort`` orders them by ``id``, ``due_date`` or ``created_at``, descending
+    with a ``-`` prefix. Tasks are ordered by id by default.
+
+    When ``limit`` or ``cursor`` query parameters are given, a single page is returned
+    instead, together with the cursor of the next page. With ``stream=true``
+    or ``Accept: application/x-ndjson`` the full list is streamed in chunks instead.
+    ``fields`` restricts the items, and the selected columns, to a comma separated list of
+    fields; ``id`` is always included.
+
+    Responses carry an ETag; a request whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+
     :param project_id: ID of the project
     :type project_id: int
-    :return: List of tasks in JSON format
-    :rtype: list[dict]
+    :param query: TaskListRequest object with the page parameters, the filters and the sort
+    :type query: TaskListRequest
+    :return: List of tasks in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
     :raises NotFound: if project with given ID does not exist
+    :raises BadRequest: if the cursor or a field is invalid
     """
-    if not ProjectService(repository=ProjectRepository(db_session=db.session)).get_project(project_id=project_id):
-        raise NotFound(f'Not found project with id={project_id}.')
-    return TaskService(repository=TaskRepository(db_session=db.session)).get_tasks_by_project(project_id=project_id)
+    service = TaskService(repository=TaskRepository(db_session=db.session))
+    ndjson = wants_ndjson()
+    options = {"fields": query.fields, "filters": query.filters(), "sort": query.sort}
+    if query.stream or ndjson:
+        ProjectService(repository=ProjectRepository(db_session=db.session)).ensure_project_exists(project_id=project_id)
+        return stream_response(
+            service.stream_tasks_by_project(project_id=project_id, ndjson=ndjson, **options), ndjson=ndjson
+        )
+    if query.is_paginated():
+        return service.get_tasks_page_by_project(
+            project_id=project_id, cursor=query.cursor, limit=query.limit, **options
+        )
+    return service.get_tasks_by_project(project_id=project_id, **options)
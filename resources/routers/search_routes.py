@@ -0,0 +1,33 @@
+from flask import Blueprint
+from flask_pydantic import validate
+
+from decorators.decorators import cached, query_budget
+from repositories.search_repository import SearchRepository
+from resources.request.search_request import SearchRequest
+from services.search.search_service import SearchService
+from settings.database import db
+
+search_apis = Blueprint('search_apis', __name__)
+
+
+@search_apis.route('', methods=['GET'])
+@query_budget(2)
+@cached("projects", "tasks")
+@validate()
+def search(query: SearchRequest):
+    """
+    Search the projects by name and subject and the tasks by name and description.
+
+    Results match every word of ``q``, the last one as a prefix, and come best ranked first, a
+    match in the name ranking above one in the subject or description. They are returned a
+    page at a time, of ``limit`` results, together with the cursor of the next page.
+
+    :param query: SearchRequest object with the query and the optional limit and cursor
+    :type query: SearchRequest
+    :return: Page with ``items`` of ``type``, ``id``, ``name``, ``project_id`` and ``rank``, and ``next_cursor``
+    :rtype: dict
+    :raises BadRequest: if the query has no word or the cursor is invalid
+    """
+    return SearchService(
+        repository=SearchRepository(db_session=db.session)
+    ).search(q=query.q, cursor=query.cursor, limit=query.limit)
@@ -1,8 +1,10 @@
 from flask import Blueprint
 from flask_pydantic import validate
 
-from decorators.decorators import manager_required
+from decorators.decorators import cached, conditional, manager_required, query_budget
+from helpers.streaming import stream_response, wants_ndjson
 from repositories.user_repository import UserRepository
+from resources.request.page_request import PageRequest
 from resources.request.user_request import CreateUserRequest, UpdateUserRequest
 from services.user.user_service import UserService
 from settings.database import db
@@ -10,7 +12,16 @@ from settings.database import db
 user_apis = Blueprint('user_apis', __name__)
 
 
+def _users_version():
+    return UserService(repository=UserRepository(db_session=db.session)).get_users_version()
+
+
+def _user_version(user_id: int):
+    return UserService(repository=UserRepository(db_session=db.session)).get_user_version(user_id=user_id)
+
+
 @user_apis.route('/', methods=['POST'])
+@query_budget(4)
 @validate()
 @manager_required
 def create_user(body: CreateUserRequest):
@@ -28,21 +39,47 @@ def create_user(body: CreateUserRequest):
 
 
 @user_apis.route('/', methods=['GET'])
-def get_users():
+@query_budget(3)
+@cached("users")
+@conditional(_users_version)
+@validate()
+def get_users(query: PageRequest):
     """
     Retrieve all users.
 
-    :return: List of users in JSON format
-    :rtype: list[dict]
+    When ``limit`` or ``cursor`` query parameters are given, a single page is returned
+    instead, ordered by id, together with the cursor of the next page. With ``stream=true``
+    or ``Accept: application/x-ndjson`` the full list is streamed in chunks instead.
+    ``fields`` restricts the items, and the selected columns, to a comma separated list of
+    fields; ``id`` is always included.
+
+    Responses carry an ETag; a request whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+
+    :param query: PageRequest object with the optional limit, cursor, stream flag and fields
+    :type query: PageRequest
+    :return: List of users in JSON format, or a page with ``items`` and ``next_cursor``
+    :rtype: list[dict] | dict | flask.Response
+    :raises BadRequest: if the cursor or a field is invalid
     """
-    return UserService(repository=UserRepository(db_session=db.session)).get_users()
+    service = UserService(repository=UserRepository(db_session=db.session))
+    ndjson = wants_ndjson()
+    if query.stream or ndjson:
+        return stream_response(service.stream_users(ndjson=ndjson, fields=query.fields), ndjson=ndjson)
+    if query.is_paginated():
+        return service.get_users_page(cursor=query.cursor, limit=query.limit, fields=query.fields)
+    return service.get_users(fields=query.fields)
 
 
 @user_apis.route('/<int:user_id>', methods=['GET'])
+@query_budget(3)
+@cached("users")
+@conditional(_user_version)
 def get_user(user_id: int):
     """
     Retrieve a single user by ID.
 
+    Responses carry an ETag; a request whose ``If-None-Match`` matches it gets ``304 Not Modified``.
+
     :param user_id: ID of the user
     :type user_id: int
     :return: User details in JSON format
@@ -53,6 +90,7 @@ def get_user(user_id: int):
 
 
 @user_apis.route('/<int:user_id>', methods=['PUT'])
+@query_budget(5)
 @validate()
 @manager_required
 def update_user(user_id: int, body: UpdateUserRequest):
@@ -72,6 +110,7 @@ def update_user(user_id: int, body: UpdateUserRequest):
 
 
 @user_apis.route('/<int:user_id>', methods=['DELETE'])
+@query_budget(3)
 @manager_required
 def delete_user(user_id: int):
     """
@@ -0,0 +1,121 @@
+from datetime import datetime, timezone
+from typing import Any, Iterator, List
+
+from flask import Response
+from flask_login import current_user
+from werkzeug.exceptions import BadRequest, NotFound
+
+from helpers.fields import parse_fields, response_model
+from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import stream_json
+from models.project import Project
+from repositories.async_project_repository import AsyncProjectRepository
+from resources.request.project_request import ProjectRequest
+from resources.response.project_response import ProjectResponse
+from resources.response.project_summary_response import ProjectSummaryResponse
+
+
+class AsyncProjectService:
+    def __init__(self, repository: AsyncProjectRepository):
+        self.repository = repository
+
+    async def get_project_by_id(self, project_id: int) -> Project | None:
+        project = await self.repository.get_by_id(id=project_id)
+        if not project:
+            raise NotFound(f'Not found project with id={project_id}.')
+        return project
+
+    async def get_project_version(self, project_id: int) -> tuple | None:
+        return await self.repository.get_version(id=project_id)
+
+    async def get_projects_version(self) -> tuple:
+        return await self.repository.get_collection_version()
+
+    async def ensure_project_exists(self, project_id: int) -> None:
+        if not await self.repository.exists(id=project_id):
+            raise NotFound(f'Not found project with id={project_id}.')
+
+    async def create_project(self, body: ProjectRequest) -> dict[str, Any] | None:
+        if is_invalid_request(body):
+            raise BadRequest()
+
+        project = await self.repository.create(
+            Project(
+                name=body.name,
+                subject=body.subject,
+                start_date=body.start_date,
+                due_date=body.due_date,
+                created_at=datetime.now(timezone.utc),
+                created_by=current_user.id
+            )
+        )
+        response_cache.invalidate("projects")
+        return dump(ProjectResponse, project)
+
+    async def get_projects(self, fields: str | None = None) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, ProjectResponse)
+        projects = await self.repository.get_all_rows(fields=fields)
+        return dump_all(response_model(ProjectResponse, fields), projects)
+
+    async def stream_projects(self, ndjson: bool = False, fields: str | None = None) -> Iterator[str]:
+        """
+        Fetch every project up front, since the session closes before the response is streamed.
+        """
+        fields = parse_fields(fields, ProjectResponse)
+        model = response_model(ProjectResponse, fields)
+        return stream_json(
+            await self.repository.get_all_rows(fields=fields),
+            lambda project: dump(model, project),
+            ndjson=ndjson
+        )
+
+    async def get_projects_page(
+            self, cursor: str | None, limit: int | None, fields: str | None = None
+    ) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, ProjectResponse)
+        projects, next_cursor = make_page(
+            await self.repository.get_page(after_id=decode_cursor(cursor), limit=limit + 1, fields=fields), limit
+        )
+        return {
+            "items": dump_all(response_model(ProjectResponse, fields), projects),
+            "next_cursor": next_cursor,
+        }
+
+    async def get_projects_summary(self, cursor: str | None, limit: int | None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        summaries, next_cursor = make_page(
+            await self.repository.get_summary_page(
+                after_id=decode_cursor(cursor), limit=limit + 1, now=datetime.now(timezone.utc)
+            ),
+            limit
+        )
+        return {"items": dump_all(ProjectSummaryResponse, summaries), "next_cursor": next_cursor}
+
+    async def get_project(self, project_id: int) -> dict[str, Any] | None:
+        project = await self.get_project_by_id(project_id=project_id)
+        return dump(ProjectResponse, project)
+
+    async def update_project(self, project_id: int, body: ProjectRequest) -> dict[str, Any] | None:
+        project = await self.get_project_by_id(project_id=project_id)
+
+        if is_invalid_request(body):
+            raise BadRequest()
+
+        project.update(body.__dict__)
+        project.updated_at = datetime.now(timezone.utc)
+        project.updated_by = current_user.id
+
+        project = await self.repository.update(project)
+        response_cache.invalidate("projects")
+        return dump(ProjectResponse, project)
+
+    async def delete_project(self, project_id: int) -> Response | None:
+        project = await self.get_project_by_id(project_id=project_id)
+
+        await self.repository.delete(project)
+        response_cache.invalidate("projects")
+        return Response(f'Project with id={project_id} deleted.', status=200)
@@ -1,15 +1,21 @@
 from datetime import datetime, timezone
-from typing import List, Any
+from typing import Iterator, List, Any
 
 from flask import Response
 from flask_login import current_user
 from werkzeug.exceptions import BadRequest, NotFound
 
+from helpers.fields import parse_fields, response_model
 from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import STREAM_CHUNK_SIZE, stream_json
 from models.project import Project
 from repositories.project_repository import ProjectRepository
 from resources.request.project_request import ProjectRequest
 from resources.response.project_response import ProjectResponse
+from resources.response.project_summary_response import ProjectSummaryResponse
 
 
 class ProjectService:
@@ -22,6 +28,16 @@ class ProjectService:
             raise NotFound(f'Not found project with id={project_id}.')
         return project
 
+    def get_project_version(self, project_id: int) -> tuple | None:
+        return self.repository.get_version(id=project_id)
+
+    def get_projects_version(self) -> tuple:
+        return self.repository.get_collection_version()
+
+    def ensure_project_exists(self, project_id: int) -> None:
+        if not self.repository.exists(id=project_id):
+            raise NotFound(f'Not found project with id={project_id}.')
+
     def create_project(self, body: ProjectRequest) -> dict[str, Any] | None:
         if is_invalid_request(body):
             raise BadRequest()
@@ -36,14 +52,46 @@ class ProjectService:
                 created_by=current_user.id
             )
         )
-        return ProjectResponse.model_validate(project).model_dump()
+        response_cache.invalidate("projects")
+        return dump(ProjectResponse, project)
+
+    def get_projects(self, fields: str | None = None) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, ProjectResponse)
+        return dump_all(response_model(ProjectResponse, fields), self.repository.get_all_rows(fields=fields))
 
-    def get_projects(self) -> List[dict[str, Any] | None]:
-        return [ProjectResponse.model_validate(project).model_dump() for project in self.repository.get_all()]
+    def stream_projects(self, ndjson: bool = False, fields: str | None = None) -> Iterator[str]:
+        fields = parse_fields(fields, ProjectResponse)
+        model = response_model(ProjectResponse, fields)
+        return stream_json(
+            self.repository.iter_all(chunk_size=STREAM_CHUNK_SIZE, fields=fields),
+            lambda project: dump(model, project),
+            ndjson=ndjson
+        )
+
+    def get_projects_page(self, cursor: str | None, limit: int | None, fields: str | None = None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, ProjectResponse)
+        projects, next_cursor = make_page(
+            self.repository.get_page(after_id=decode_cursor(cursor), limit=limit + 1, fields=fields), limit
+        )
+        return {
+            "items": dump_all(response_model(ProjectResponse, fields), projects),
+            "next_cursor": next_cursor,
+        }
+
+    def get_projects_summary(self, cursor: str | None, limit: int | None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        summaries, next_cursor = make_page(
+            self.repository.get_summary_page(
+                after_id=decode_cursor(cursor), limit=limit + 1, now=datetime.now(timezone.utc)
+            ),
+            limit
+        )
+        return {"items": dump_all(ProjectSummaryResponse, summaries), "next_cursor": next_cursor}
 
     def get_project(self, project_id: int) -> dict[str, Any] | None:
         project = self.get_project_by_id(project_id=project_id)
-        return ProjectResponse.model_validate(project).model_dump()
+        return dump(ProjectResponse, project)
 
     def update_project(self, project_id: int, body: ProjectRequest) -> dict[str, Any] | None:
         project = self.get_project_by_id(project_id=project_id)
@@ -56,10 +104,18 @@ class ProjectService:
         project.updated_by = current_user.id
 
         project = self.repository.update(project)
-        return ProjectResponse.model_validate(project).model_dump()
+        response_cache.invalidate("projects")
+        return dump(ProjectResponse, project)
+
+    def reconcile_task_counts(self, batch_size: int) -> int:
+        repaired = self.repository.reconcile_task_counts(batch_size=batch_size)
+        if repaired:
+            response_cache.invalidate("projects")
+        return repaired
 
     def delete_project(self, project_id: int) -> Response | None:
         project = self.get_project_by_id(project_id=project_id)
 
         self.repository.delete(project)
+        response_cache.invalidate("projects")
         return Response(f'Project with id={project_id} deleted.', status=200)
@@ -0,0 +1,25 @@
+from typing import Any
+
+from helpers.pagination import decode_rank_cursor, get_page_size, make_ranked_page
+from helpers.search import SEARCH_MAX_CANDIDATES, search_terms
+from helpers.serialization import dump_all
+from repositories.async_search_repository import AsyncSearchRepository
+from resources.response.search_response import SearchResultResponse
+
+
+class AsyncSearchService:
+    def __init__(self, repository: AsyncSearchRepository):
+        self.repository = repository
+
+    async def search(self, q: str, cursor: str | None, limit: int | None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        results, next_cursor = make_ranked_page(
+            await self.repository.search(
+                terms=search_terms(q),
+                after=decode_rank_cursor(cursor),
+                limit=limit + 1,
+                max_candidates=SEARCH_MAX_CANDIDATES,
+            ),
+            limit
+        )
+        return {"items": dump_all(SearchResultResponse, results), "next_cursor": next_cursor}
@@ -0,0 +1,114 @@
+from datetime import datetime, timezone
+from typing import Any, Iterator, List
+
+from flask_login import current_user
+from werkzeug.exceptions import BadRequest, NotFound
+
+from helpers.fields import parse_fields, response_model
+from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_sort_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import stream_json
+from models.task import Task
+from repositories.async_task_repository import AsyncTaskRepository
+from resources.request.task_request import TaskRequest
+from resources.response.task_response import TaskResponse
+from services.task.task_service import validate_tasks
+
+
+class AsyncTaskService:
+    def __init__(self, repository: AsyncTaskRepository):
+        self.repository = repository
+
+    async def create_task(self, project_id: int, body: TaskRequest) -> dict[str, Any] | None:
+        if is_invalid_request(body):
+            raise BadRequest()
+
+        task = await self.repository.create(
+            Task(
+                name=body.name,
+                description=body.description,
+                start_date=body.start_date,
+                due_date=body.due_date,
+                project_id=project_id,
+                created_at=datetime.now(timezone.utc),
+                created_by=current_user.id
+            )
+        )
+        response_cache.invalidate("tasks", "projects")
+        return dump(TaskResponse, task)
+
+    async def create_tasks(self, project_id: int, items: list[Any]) -> dict[str, Any]:
+        rows, failed = validate_tasks(project_id=project_id, items=items)
+        tasks = await self.repository.create_many(rows) if rows else []
+        if tasks:
+            response_cache.invalidate("tasks", "projects")
+        return {
+            "created": dump_all(TaskResponse, sorted(tasks, key=lambda t: t.id)),
+            "failed": failed,
+        }
+
+    async def get_tasks_version(self, project_id: int) -> tuple | None:
+        return await self.repository.get_collection_version_by_project(project_id=project_id)
+
+    async def get_tasks_by_project(
+            self,
+            project_id: int,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, TaskResponse)
+        tasks = await self.repository.get_all_tasks_by_project(
+            project_id=project_id, fields=fields, filters=filters, order_by=sort
+        )
+        if tasks is None:
+            raise NotFound(f'Not found project with id={project_id}.')
+        return dump_all(response_model(TaskResponse, fields), tasks)
+
+    async def stream_tasks_by_project(
+            self,
+            project_id: int,
+            ndjson: bool = False,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> Iterator[str]:
+        """
+        Fetch every task of the project up front, since the session closes before the response is streamed.
+        """
+        return stream_json(
+            await self.get_tasks_by_project(project_id=project_id, fields=fields, filters=filters, sort=sort),
+            lambda task: task,
+            ndjson=ndjson
+        )
+
+    async def get_tasks_page_by_project(
+            self,
+            project_id: int,
+            cursor: str | None,
+            limit: int | None,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, TaskResponse)
+        after_id, after_value = decode_sort_cursor(cursor, sort)
+        tasks = await self.repository.get_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            after_value=after_value,
+            limit=limit + 1,
+            order_by=sort,
+            fields=fields,
+            filters=filters,
+        )
+        if tasks is None:
+            raise NotFound(f'Not found project with id={project_id}.')
+        tasks, next_cursor = make_page(tasks, limit, sort=sort)
+        return {
+            "items": dump_all(response_model(TaskResponse, fields), tasks),
+            "next_cursor": next_cursor,
+        }
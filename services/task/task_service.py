@@ -1,15 +1,60 @@
+import os
 from datetime import datetime, timezone
-from typing import List, Any
+from typing import Iterator, List, Any
 
-from werkzeug.exceptions import BadRequest
+from pydantic import ValidationError
+from werkzeug.exceptions import BadRequest, NotFound
 
+from helpers.fields import parse_fields, response_model
 from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_sort_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import STREAM_CHUNK_SIZE, stream_json
 from models.task import Task
 from flask_login import current_user
 from repositories.task_repository import TaskRepository
 from resources.request.task_request import TaskRequest
 from resources.response.task_response import TaskResponse
 
+MAX_BULK_TASKS = int(os.getenv("MAX_BULK_TASKS", 1000))
+
+
+def validate_tasks(project_id: int, items: list[Any]) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """
+    Split a batch of task bodies into the rows to insert and the errors of the invalid ones.
+    """
+    if not isinstance(items, list) or not items or len(items) > MAX_BULK_TASKS:
+        raise BadRequest()
+
+    created_at = datetime.now(timezone.utc)
+    rows, failed = [], []
+    for index, item in enumerate(items):
+        try:
+            body = TaskRequest.model_validate(item)
+        except ValidationError as e:
+            failed.append({
+                "index": index,
+                "errors": [
+                    {"field": ".".join(str(loc) for loc in error["loc"]), "message": error["msg"]}
+                    for error in e.errors()
+                ]
+            })
+            continue
+        if is_invalid_request(body):
+            failed.append({"index": index, "errors": [{"field": None, "message": "Invalid request body."}]})
+            continue
+        rows.append({
+            "name": body.name,
+            "description": body.description,
+            "start_date": body.start_date,
+            "due_date": body.due_date,
+            "project_id": project_id,
+            "created_at": created_at,
+            "created_by": current_user.id
+        })
+    return rows, failed
+
 
 class TaskService:
     def __init__(self, repository: TaskRepository):
@@ -30,10 +75,90 @@ class TaskService:
                 created_by=current_user.id
             )
         )
-        return TaskResponse.model_validate(task).model_dump()
+        response_cache.invalidate("tasks", "projects")
+        return dump(TaskResponse, task)
+
+    def create_tasks(self, project_id: int, items: list[Any]) -> dict[str, Any]:
+        """
+        Validate a whole batch up front and insert every valid task in a single statement.
+
+        Items that fail validation are reported by their position in the batch and the
+        remaining ones are still created.
+        """
+        rows, failed = validate_tasks(project_id=project_id, items=items)
+        tasks = self.repository.create_many(rows) if rows else []
+        if tasks:
+            response_cache.invalidate("tasks", "projects")
+        return {
+            "created": dump_all(TaskResponse, sorted(tasks, key=lambda t: t.id)),
+            "failed": failed,
+        }
 
-    def get_tasks_by_project(self, project_id: int) -> List[dict[str, Any] | None]:
-        return [
-            TaskResponse.model_validate(task).model_dump()
-            for task in self.repository.get_all_tasks_by_project(project_id=project_id)
-        ]
+    def get_tasks_version(self, project_id: int) -> tuple | None:
+        return self.repository.get_collection_version_by_project(project_id=project_id)
+
+    def get_tasks_by_project(
+            self,
+            project_id: int,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, TaskResponse)
+        tasks = self.repository.get_all_tasks_by_project(
+            project_id=project_id, fields=fields, filters=filters, order_by=sort
+        )
+        if tasks is None:
+            raise NotFound(f'Not found project with id={project_id}.')
+        return dump_all(response_model(TaskResponse, fields), tasks)
+
+    def stream_tasks_by_project(
+            self,
+            project_id: int,
+            ndjson: bool = False,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> Iterator[str]:
+        fields = parse_fields(fields, TaskResponse)
+        model = response_model(TaskResponse, fields)
+        return stream_json(
+            self.repository.iter_all_tasks_by_project(
+                project_id=project_id, chunk_size=STREAM_CHUNK_SIZE, fields=fields, filters=filters, order_by=sort
+            ),
+            lambda task: dump(model, task),
+            ndjson=ndjson
+        )
+
+    def get_tasks_page_by_project(
+            self,
+            project_id: int,
+            cursor: str | None,
+            limit: int | None,
+            fields: str | None = None,
+            filters: dict[str, Any] | None = None,
+            sort: str = "id",
+    ) -> dict[str, Any]:
+        """
+        Page of the tasks of a project matching ``filters``, in ``sort`` order. The cursor of
+        the next page is only valid with the same sort.
+        """
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, TaskResponse)
+        after_id, after_value = decode_sort_cursor(cursor, sort)
+        tasks = self.repository.get_page_by_project(
+            project_id=project_id,
+            after_id=after_id,
+            after_value=after_value,
+            limit=limit + 1,
+            order_by=sort,
+            fields=fields,
+            filters=filters,
+        )
+        if tasks is None:
+            raise NotFound(f'Not found project with id={project_id}.')
+        tasks, next_cursor = make_page(tasks, limit, sort=sort)
+        return {
+            "items": dump_all(response_model(TaskResponse, fields), tasks),
+            "next_cursor": next_cursor,
+        }
@@ -0,0 +1,117 @@
+from datetime import datetime, timezone
+from typing import Any, Iterator, List
+
+from flask import Response
+from flask_login import current_user
+from werkzeug.exceptions import BadRequest, Conflict, NotFound, UnprocessableEntity
+from werkzeug.security import generate_password_hash
+
+from helpers.fields import parse_fields, response_model
+from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import stream_json
+from models.user import User
+from repositories.async_user_repository import AsyncUserRepository
+from resources.request.user_request import CreateUserRequest, UpdateUserRequest
+from resources.response.user_response import UserResponse
+from services.user.session_user import session_user_cache
+
+
+class AsyncUserService:
+    def __init__(self, repository: AsyncUserRepository):
+        self.repository = repository
+
+    async def get_user_by_id(self, user_id: int) -> User | None:
+        user = await self.repository.get_by_id(id=user_id)
+        if not user:
+            raise NotFound(f'Not found user with id={user_id}.')
+        return user
+
+    async def get_user_version(self, user_id: int) -> tuple | None:
+        return await self.repository.get_version(id=user_id)
+
+    async def get_users_version(self) -> tuple:
+        return await self.repository.get_collection_version()
+
+    async def get_user_by_email(self, email: str) -> User | None:
+        return await self.repository.get_by_email(email=email)
+
+    async def create_user(self, body: CreateUserRequest) -> dict[str, Any] | None:
+        if is_invalid_request(body):
+            raise BadRequest()
+
+        if await self.get_user_by_email(body.email):
+            raise Conflict()
+
+        user = await self.repository.create(
+            User(
+                email=body.email,
+                password=generate_password_hash(body.password),
+                username=body.username,
+                name=body.name,
+                user_type=body.user_type,
+                created_at=datetime.now(timezone.utc),
+                created_by=current_user.id
+            )
+        )
+        response_cache.invalidate("users")
+        return dump(UserResponse, user)
+
+    async def get_users(self, fields: str | None = None) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, UserResponse)
+        return dump_all(response_model(UserResponse, fields), await self.repository.get_all_rows(fields=fields))
+
+    async def stream_users(self, ndjson: bool = False, fields: str | None = None) -> Iterator[str]:
+        """
+        Fetch every user up front, since the session closes before the response is streamed.
+        """
+        fields = parse_fields(fields, UserResponse)
+        model = response_model(UserResponse, fields)
+        return stream_json(
+            await self.repository.get_all_rows(fields=fields),
+            lambda user: dump(model, user),
+            ndjson=ndjson
+        )
+
+    async def get_users_page(self, cursor: str | None, limit: int | None, fields: str | None = None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, UserResponse)
+        users, next_cursor = make_page(
+            await self.repository.get_page(after_id=decode_cursor(cursor), limit=limit + 1, fields=fields), limit
+        )
+        return {
+            "items": dump_all(response_model(UserResponse, fields), users),
+            "next_cursor": next_cursor,
+        }
+
+    async def get_user(self, user_id: int) -> dict[str, Any] | None:
+        user = await self.get_user_by_id(user_id=user_id)
+        return dump(UserResponse, user)
+
+    async def update_user(self, user_id: int, body: UpdateUserRequest) -> dict[str, Any] | None:
+        user = await self.get_user_by_id(user_id=user_id)
+
+        if is_invalid_request(body):
+            raise BadRequest()
+
+        user.update(body.__dict__)
+        user.updated_at = datetime.now(timezone.utc)
+        user.updated_by = current_user.id
+
+        user = await self.repository.update(user)
+        session_user_cache.delete(user_id)
+        response_cache.invalidate("users")
+        return dump(UserResponse, user)
+
+    async def delete_user(self, user_id: int) -> Response | None:
+        user = await self.get_user_by_id(user_id=user_id)
+
+        if current_user.id == user.id:
+            raise UnprocessableEntity()
+
+        await self.repository.delete(user)
+        session_user_cache.delete(user_id)
+        response_cache.invalidate("users")
+        return Response(f'User with id={user_id} deleted.', status=200)
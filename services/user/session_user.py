@@ -0,0 +1,23 @@
+import os
+
+from flask_login import UserMixin
+
+from helpers.cache import TTLCache
+
+session_user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_LOADER_CACHE_SIZE", 1024)),
+    ttl=float(os.getenv("USER_LOADER_CACHE_TTL", 60)),
+)
+
+
+class SessionUser(UserMixin):
+    """
+    Fields of the logged user needed to authorize a request, kept instead of the full ``User`` entity.
+    """
+
+    def __init__(self, id: int, user_type: int):
+        self.id = id
+        self.user_type = user_type
+
+    def get_id(self):
+        return str(self.id)
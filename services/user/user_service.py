@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import List, Any
+from typing import Iterator, List, Any
 
 from flask import Response
 from flask_login import login_user, current_user
@@ -7,12 +7,18 @@ from werkzeug.exceptions import BadRequest, NotFound, Unauthorized, Conflict, Un
 from werkzeug.security import check_password_hash
 from werkzeug.security import generate_password_hash
 
+from helpers.fields import parse_fields, response_model
 from helpers.helpers import is_invalid_request
+from helpers.pagination import decode_cursor, get_page_size, make_page
+from helpers.response_cache import response_cache
+from helpers.serialization import dump, dump_all
+from helpers.streaming import STREAM_CHUNK_SIZE, stream_json
 from models.user import User
 from repositories.user_repository import UserRepository
 from resources.request.auth_request import LoginRequest
 from resources.request.user_request import CreateUserRequest, UpdateUserRequest
 from resources.response.user_response import UserResponse
+from services.user.session_user import SessionUser, session_user_cache
 
 
 class UserService:
@@ -25,9 +31,25 @@ class UserService:
             raise NotFound(f'Not found user with id={user_id}.')
         return user
 
+    def get_user_version(self, user_id: int) -> tuple | None:
+        return self.repository.get_version(id=user_id)
+
+    def get_users_version(self) -> tuple:
+        return self.repository.get_collection_version()
+
     def get_user_by_email(self, email: str) -> User | None:
         return self.repository.get_by_email(email=email)
 
+    def load_session_user(self, user_id: int) -> SessionUser | None:
+        session_user = session_user_cache.get(user_id)
+        if session_user is None:
+            row = self.repository.get_session_fields(id=user_id)
+            if not row:
+                return None
+            session_user = SessionUser(id=row.id, user_type=row.user_type)
+            session_user_cache.set(user_id, session_user)
+        return session_user
+
     def login(self, data: LoginRequest) -> Response | None:
         if not data or "email" not in data or "password" not in data:
             raise BadRequest()
@@ -58,14 +80,36 @@ class UserService:
                 created_by=current_user.id
             )
         )
-        return UserResponse.model_validate(user).model_dump()
+        response_cache.invalidate("users")
+        return dump(UserResponse, user)
+
+    def get_users(self, fields: str | None = None) -> List[dict[str, Any] | None]:
+        fields = parse_fields(fields, UserResponse)
+        return dump_all(response_model(UserResponse, fields), self.repository.get_all_rows(fields=fields))
+
+    def stream_users(self, ndjson: bool = False, fields: str | None = None) -> Iterator[str]:
+        fields = parse_fields(fields, UserResponse)
+        model = response_model(UserResponse, fields)
+        return stream_json(
+            self.repository.iter_all(chunk_size=STREAM_CHUNK_SIZE, fields=fields),
+            lambda user: dump(model, user),
+            ndjson=ndjson
+        )
 
-    def get_users(self) -> List[dict[str, Any] | None]:
-        return [UserResponse.model_validate(user).model_dump() for user in self.repository.get_all()]
+    def get_users_page(self, cursor: str | None, limit: int | None, fields: str | None = None) -> dict[str, Any]:
+        limit = get_page_size(limit)
+        fields = parse_fields(fields, UserResponse)
+        users, next_cursor = make_page(
+            self.repository.get_page(after_id=decode_cursor(cursor), limit=limit + 1, fields=fields), limit
+        )
+        return {
+            "items": dump_all(response_model(UserResponse, fields), users),
+            "next_cursor": next_cursor,
+        }
 
     def get_user(self, user_id: int) -> dict[str, Any] | None:
         user = self.get_user_by_id(user_id=user_id)
-        return UserResponse.model_validate(user).model_dump()
+        return dump(UserResponse, user)
 
     def update_user(self, user_id: int, body: UpdateUserRequest) -> dict[str, Any] | None:
         user = self.get_user_by_id(user_id=user_id)
@@ -78,7 +122,9 @@ class UserService:
         user.updated_by = current_user.id
 
         user = self.repository.update(user)
-        return UserResponse.model_validate(user).model_dump()
+        session_user_cache.delete(user_id)
+        response_cache.invalidate("users")
+        return dump(UserResponse, user)
 
     def delete_user(self, user_id: int) -> Response | None:
         user = self.get_user_by_id(user_id=user_id)
@@ -87,4 +133,6 @@ class UserService:
             raise UnprocessableEntity()
 
         self.repository.delete(user)
+        session_user_cache.delete(user_id)
+        response_cache.invalidate("users")
         return Response(f'User with id={user_id} deleted.', status=200)
@@ -0,0 +1,64 @@
+import os
+from contextlib import asynccontextmanager
+from threading import Lock
+from typing import AsyncIterator
+
+from flask import Flask, current_app
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+ASYNC_DRIVERS = {"postgresql": "asyncpg", "sqlite": "aiosqlite"}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """
+    Same database as ``database_url`` through the asyncio driver of its backend.
+    """
+    url = make_url(database_url)
+    backend = url.get_backend_name()
+    return url.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+class _AsyncState:
+    def __init__(self, engine: AsyncEngine):
+        self.engine = engine
+        self.sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+        self.connected = False
+        self.lock = Lock()
+
+
+class AsyncDatabase:
+    """
+    ``AsyncSession`` factory bound to the application database, used by the async views.
+
+    Flask runs every async view on a new event loop, and pooled asyncio connections cannot
+    move between loops, so connections are opened per session instead of being pooled.
+    """
+
+    def init_app(self, app: Flask):
+        url = app.config.get("ASYNC_DATABASE_URI") or get_async_database_url(app.config["SQLALCHEMY_DATABASE_URI"])
+        connect_args = {}
+        statement_timeout = int(os.getenv("DATABASE_STATEMENT_TIMEOUT", 0))
+        if make_url(url).get_backend_name() == "postgresql" and statement_timeout:
+            connect_args["server_settings"] = {"statement_timeout": str(statement_timeout)}
+        engine = create_async_engine(url, poolclass=NullPool, connect_args=connect_args)
+        app.extensions["async_db"] = _AsyncState(engine)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        state: _AsyncState = current_app.extensions["async_db"]
+        if not state.connected:
+            # The first connection initializes the dialect under an asyncio lock bound to the loop
+            # that takes it, so concurrent first requests on other loops must wait for it here.
+            # Each loop runs on its own thread, which is the only one this lock blocks.
+            with state.lock:
+                if not state.connected:
+                    async with state.engine.connect():
+                        pass
+                    state.connected = True
+        async with state.sessionmaker() as session:
+            yield session
+
+
+async_db = AsyncDatabase()
@@ -0,0 +1,53 @@
+import click
+from flask import Flask
+from flask.cli import with_appcontext
+from flask_migrate import upgrade
+from sqlalchemy_utils import create_database, database_exists
+
+from repositories.project_repository import ProjectRepository
+from services.project.project_service import ProjectService
+from settings.database import db
+from settings.seed import seed_data
+
+
+@click.command("init-db")
+@with_appcontext
+def init_db_command():
+    """
+    Create the database if it does not exist and upgrade it to the latest migration.
+    """
+    if not database_exists(db.engine.url):
+        create_database(db.engine.url)
+    upgrade()
+    click.echo("Database initialized.")
+
+
+@click.command("seed-db")
+@with_appcontext
+def seed_db_command():
+    """
+    Insert the user types and the admin user when they are missing.
+    """
+    seed_data(db.session)
+    click.echo("Database seeded.")
+
+
+@click.command("reconcile-task-counts")
+@click.option("--batch-size", default=1000, show_default=True, help="Projects recomputed per transaction.")
+@with_appcontext
+def reconcile_task_counts_command(batch_size: int):
+    """
+    Recompute the task count of every project from its tasks, repairing the ones that drifted.
+
+    Tasks inserted while a batch runs may be missed by it, so run it again if writes were not quiet.
+    """
+    repaired = ProjectService(
+        repository=ProjectRepository(db_session=db.session)
+    ).reconcile_task_counts(batch_size=batch_size)
+    click.echo(f"Repaired the task count of {repaired} projects.")
+
+
+def add_commands(app: Flask):
+    app.cli.add_command(init_db_command)
+    app.cli.add_command(seed_db_command)
+    app.cli.add_command(reconcile_task_counts_command)
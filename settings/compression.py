@@ -0,0 +1,177 @@
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Flask, Response, current_app, request
+from werkzeug.datastructures import ETags
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+COMPRESSIBLE_MIMETYPES = {"application/json", "application/x-ndjson", "text/plain", "text/html"}
+
+
+class GzipCompressor:
+    def __init__(self, level: int):
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+class BrotliCompressor:
+    def __init__(self, level: int):
+        self._compressor = brotli.Compressor(quality=level)
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int):
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def process(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush()
+
+
+COMPRESSORS = {
+    "zstd": ZstdCompressor if zstandard is not None else None,
+    "br": BrotliCompressor if brotli is not None else None,
+    "gzip": GzipCompressor,
+}
+PACKAGES = {"zstd": "zstandard", "br": "brotli"}
+LEVEL_SETTINGS = {"zstd": "COMPRESSION_ZSTD_LEVEL", "br": "COMPRESSION_BROTLI_LEVEL", "gzip": "COMPRESSION_GZIP_LEVEL"}
+
+
+def get_encodings(app: Flask) -> list[str]:
+    """
+    ``COMPRESSION_ENCODINGS`` of the app, in order of preference, or ``auto`` for those of
+    ``zstd``, ``br`` and ``gzip`` whose package is installed.
+
+    :raises ValueError: if an encoding is unknown or its package is not installed
+    """
+    if app.config["COMPRESSION_ENCODINGS"].strip() == "auto":
+        return [encoding for encoding, compressor in COMPRESSORS.items() if compressor is not None]
+    encodings = [encoding.strip() for encoding in app.config["COMPRESSION_ENCODINGS"].split(",") if encoding.strip()]
+    for encoding in encodings:
+        if encoding not in COMPRESSORS:
+            raise ValueError(f"Unknown compression encoding {encoding!r}.")
+        if COMPRESSORS[encoding] is None:
+            raise ValueError(f"Compression encoding {encoding!r} requires the {PACKAGES[encoding]} package.")
+    return encodings
+
+
+def compress(encoding: str, data: bytes, level: int) -> bytes:
+    compressor = COMPRESSORS[encoding](level)
+    return compressor.process(data) + compressor.finish()
+
+
+def compress_chunks(encoding: str, chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    """
+    Compress a streamed body chunk by chunk, flushing after each one so the client can decode
+    the rows it has received without waiting for the end of the stream.
+    """
+    compressor = COMPRESSORS[encoding](level)
+    for chunk in chunks:
+        data = compressor.process(chunk) + compressor.flush()
+        if data:
+            yield data
+    yield compressor.finish()
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Entity tag of the ``encoding`` representation of the response tagged ``etag``, which differs
+    from the uncompressed one as strong validators must.
+    """
+    return f"{etag}-{encoding}"
+
+
+def negotiate_encoding(encodings: list[str]) -> str | None:
+    return request.accept_encodings.best_match(encodings)
+
+
+def is_compressible(response: Response) -> bool:
+    return (
+        200 <= response.status_code < 300
+        and response.status_code not in (204, 206)
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+        and "Content-Encoding" not in response.headers
+    )
+
+
+def is_too_small(response: Response) -> bool:
+    if response.is_streamed:
+        return False
+    return (response.calculate_content_length() or 0) < current_app.config["COMPRESSION_MIN_SIZE"]
+
+
+def add_response_compression(app: Flask) -> None:
+    """
+    Compress the JSON and text responses with the best encoding of ``COMPRESSION_ENCODINGS``
+    accepted by the client, at the ``COMPRESSION_<ENCODING>_LEVEL`` of that encoding.
+
+    Bodies shorter than ``COMPRESSION_MIN_SIZE`` are sent as they are, as compressing them
+    costs more than it saves. Streamed bodies are always compressed, chunk by chunk. The
+    ``ETag`` of a compressed response gets the encoding as a suffix.
+    """
+    if not app.config["COMPRESSION_ENABLED"]:
+        return
+    encodings = get_encodings(app)
+
+    @app.after_request
+    def compress_response(response: Response) -> Response:
+        if not is_compressible(response):
+            return response
+        response.vary.add("Accept-Encoding")
+        encoding = negotiate_encoding(encodings)
+        if encoding is None or is_too_small(response):
+            return response
+
+        level = current_app.config[LEVEL_SETTINGS[encoding]]
+        if response.is_streamed:
+            response.response = compress_chunks(encoding, response.iter_encoded(), level)
+            response.headers.pop("Content-Length", None)
+        else:
+            response.set_data(compress(encoding, response.get_data(), level))
+        response.headers["Content-Encoding"] = encoding
+        etag, weak = response.get_etag()
+        if etag:
+            response.set_etag(encoded_etag(etag, encoding), weak=weak)
+        return response
+
+
+def matching_etag(etag: str, if_none_match: ETags) -> str | None:
+    """
+    Tag of ``if_none_match`` that matches ``etag``, either as is or as one of its compressed
+    representations, or ``None`` if the client copy is stale.
+    """
+    for candidate in (etag, *(encoded_etag(etag, encoding) for encoding in COMPRESSORS)):
+        if candidate in if_none_match:
+            return candidate
+    return None
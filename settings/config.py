@@ -0,0 +1,30 @@
+import os
+
+from settings.database import get_database_url, get_replica_database_url
+
+
+class Config:
+    """
+    Default settings of the application, read from the environment.
+    """
+    SECRET_KEY = os.getenv("SECRET_KEY", "dev-secret-key")
+    SQLALCHEMY_DATABASE_URI = os.getenv("DATABASE_URL") or get_database_url()
+    DATABASE_REPLICA_URI = os.getenv("DATABASE_REPLICA_URL") or get_replica_database_url()
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    ASYNC_VIEWS = os.getenv("ASYNC_VIEWS", "false").lower() == "true"
+    ASYNC_DATABASE_URI = os.getenv("ASYNC_DATABASE_URL")
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+    QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE")
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", 500))
+    SLOW_QUERY_EXPLAIN_RATE = float(os.getenv("SLOW_QUERY_EXPLAIN_RATE", 0))
+    SLOW_QUERY_EXPLAIN_FILE = os.getenv("SLOW_QUERY_EXPLAIN_FILE", "slow_queries.log")
+    SLOW_QUERY_EXPLAIN_MAX_BYTES = int(os.getenv("SLOW_QUERY_EXPLAIN_MAX_BYTES", 1_048_576))
+    SLOW_QUERY_EXPLAIN_BACKUPS = int(os.getenv("SLOW_QUERY_EXPLAIN_BACKUPS", 5))
+    JSON_PROVIDER = os.getenv("JSON_PROVIDER", "auto")
+    JSON_DATETIME_FORMAT = os.getenv("JSON_DATETIME_FORMAT", "http")
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "false").lower() == "true"
+    COMPRESSION_ENCODINGS = os.getenv("COMPRESSION_ENCODINGS", "auto")
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+    COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", 6))
+    COMPRESSION_BROTLI_LEVEL = int(os.getenv("COMPRESSION_BROTLI_LEVEL", 4))
+    COMPRESSION_ZSTD_LEVEL = int(os.getenv("COMPRESSION_ZSTD_LEVEL", 3))
@@ -1,15 +1,22 @@
 import os
+from typing import Any
 
 from dotenv import load_dotenv
 from flask_sqlalchemy import SQLAlchemy
 from pydantic import PostgresDsn
+from sqlalchemy import make_url
 from sqlalchemy.orm import registry
 
+from settings.pool import InstrumentedQueuePool
+from settings.replica import RoutingSession
+
 load_dotenv()
 
 mapper_registry = registry()
 
-db: SQLAlchemy = SQLAlchemy(session_options={"expire_on_commit": False}, metadata=mapper_registry.metadata)
+db: SQLAlchemy = SQLAlchemy(
+    session_options={"expire_on_commit": False, "class_": RoutingSession}, metadata=mapper_registry.metadata
+)
 
 
 def get_database_url() -> str:
@@ -23,3 +30,48 @@ def get_database_url() -> str:
             path=os.getenv("DATABASE_NAME"),
         )
     )
+
+
+def get_replica_database_url() -> str | None:
+    """
+    URL of the read replica from the ``DATABASE_REPLICA_*`` variables, or ``None`` when
+    ``DATABASE_REPLICA_HOST`` is not set. The other parts default to the primary ones.
+    """
+    if not os.getenv("DATABASE_REPLICA_HOST"):
+        return None
+    return str(
+        PostgresDsn.build(
+            scheme=os.getenv("DATABASE_REPLICA_SCHEME", os.getenv("DATABASE_SCHEME")),
+            username=os.getenv("DATABASE_REPLICA_USER", os.getenv("DATABASE_USER")),
+            password=os.getenv("DATABASE_REPLICA_PASSWORD", os.getenv("DATABASE_PASSWORD")),
+            host=os.getenv("DATABASE_REPLICA_HOST"),
+            port=int(os.getenv("DATABASE_REPLICA_PORT", os.getenv("DATABASE_PORT"))),
+            path=os.getenv("DATABASE_REPLICA_NAME", os.getenv("DATABASE_NAME")),
+        )
+    )
+
+
+def get_engine_options(database_url: str) -> dict[str, Any]:
+    """
+    Engine options for ``SQLALCHEMY_ENGINE_OPTIONS``, read from the environment.
+
+    In-memory SQLite keeps its single-connection pool, so only the pool sizing of the other
+    databases is configurable. ``DATABASE_STATEMENT_TIMEOUT`` is in milliseconds, only
+    applies to PostgreSQL and ``0`` disables it.
+    """
+    url = make_url(database_url)
+    options: dict[str, Any] = {"pool_pre_ping": os.getenv("DATABASE_POOL_PRE_PING", "true").lower() == "true"}
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return options
+
+    options.update(
+        poolclass=InstrumentedQueuePool,
+        pool_size=int(os.getenv("DATABASE_POOL_SIZE", 5)),
+        max_overflow=int(os.getenv("DATABASE_MAX_OVERFLOW", 10)),
+        pool_timeout=float(os.getenv("DATABASE_POOL_TIMEOUT", 30)),
+        pool_recycle=int(os.getenv("DATABASE_POOL_RECYCLE", 1800)),
+    )
+    statement_timeout = int(os.getenv("DATABASE_STATEMENT_TIMEOUT", 0))
+    if url.get_backend_name() == "postgresql" and statement_timeout:
+        options["connect_args"] = {"options": f"-c statement_timeout={statement_timeout}"}
+    return options
@@ -0,0 +1,229 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from threading import Lock
+from typing import Any, Iterable, Iterator
+
+from flask import Flask, Response, g, has_app_context, request
+from flask.json.provider import JSONProvider
+from sqlalchemy import Engine, event
+
+from helpers.response_cache import response_cache
+from settings.pool import get_pool_stats
+
+METRICS_PATH = "/metrics"
+PROMETHEUS_MIMETYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+class RequestMetrics:
+    """
+    Work done while serving a single request.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.serialization_seconds = 0.0
+        self.response_bytes = 0
+
+    def server_timing(self) -> str:
+        return (
+            f'db;dur={self.db_seconds * 1000:.2f};desc="{self.queries} queries", '
+            f'serialize;dur={self.serialization_seconds * 1000:.2f}, '
+            f'total;dur={(time.perf_counter() - self.started) * 1000:.2f}'
+        )
+
+
+class Histogram:
+    """
+    Cumulative histogram with a series for every combination of label values.
+    """
+
+    def __init__(self, name: str, documentation: str, buckets: tuple[float, ...], labels: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = buckets
+        self.labels = labels
+        self.series: dict[tuple[str, ...], tuple[list[int], list[float]]] = {}
+        self._lock = Lock()
+
+    def observe(self, value: float, *label_values: str) -> None:
+        with self._lock:
+            counts, total = self.series.setdefault(label_values, ([0] * (len(self.buckets) + 1), [0.0]))
+            counts[bisect_left(self.buckets, value)] += 1
+            total[0] += value
+
+    def clear(self) -> None:
+        with self._lock:
+            self.series.clear()
+
+    def render(self) -> Iterator[str]:
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = {labels: (list(counts), total[0]) for labels, (counts, total) in self.series.items()}
+        for label_values, (counts, total) in sorted(series.items()):
+            labels = ",".join(f'{name}="{value}"' for name, value in zip(self.labels, label_values))
+            cumulative = 0
+            for bucket, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                yield f'{self.name}_bucket{{{labels},le="{bucket}"}} {cumulative}'
+            yield f"{self.name}_sum{{{labels}}} {total}"
+            yield f"{self.name}_count{{{labels}}} {cumulative}"
+
+
+class MetricsRegistry:
+    """
+    Per-endpoint histograms of the requests served by this process.
+    """
+
+    LABELS = ("method", "endpoint", "status")
+
+    def __init__(self):
+        self.duration = Histogram(
+            "http_request_duration_seconds", "Time spent serving the request.", DURATION_BUCKETS, self.LABELS
+        )
+        self.queries = Histogram(
+            "http_request_db_queries", "Statements sent to the database by the request.", QUERY_BUCKETS, self.LABELS
+        )
+        self.db = Histogram(
+            "http_request_db_seconds", "Time spent running database statements.", DURATION_BUCKETS, self.LABELS
+        )
+        self.serialization = Histogram(
+            "http_request_serialization_seconds", "Time spent building and encoding the response body.",
+            DURATION_BUCKETS, self.LABELS
+        )
+        self.size = Histogram("http_response_size_bytes", "Size of the response body.", SIZE_BUCKETS, self.LABELS)
+
+    def histograms(self) -> tuple[Histogram, ...]:
+        return self.duration, self.queries, self.db, self.serialization, self.size
+
+    def observe(self, metrics: RequestMetrics, *label_values: str) -> None:
+        self.duration.observe(time.perf_counter() - metrics.started, *label_values)
+        self.queries.observe(metrics.queries, *label_values)
+        self.db.observe(metrics.db_seconds, *label_values)
+        self.serialization.observe(metrics.serialization_seconds, *label_values)
+        self.size.observe(metrics.response_bytes, *label_values)
+
+    def clear(self) -> None:
+        for histogram in self.histograms():
+            histogram.clear()
+
+    def render(self, engines: dict[str | None, Engine]) -> str:
+        lines = [line for histogram in self.histograms() for line in histogram.render()]
+        lines.extend(_render_gauges("response_cache", response_cache.stats()))
+        for bind, engine in engines.items():
+            lines.extend(_render_gauges("db_pool", get_pool_stats(engine), f'{{bind="{bind or "default"}"}}'))
+        return "\n".join(lines) + "\n"
+
+
+def _render_gauges(prefix: str, stats: dict[str, float], labels: str = "") -> Iterator[str]:
+    for name, value in stats.items():
+        yield f"{prefix}_{name}{labels} {float(value)}"
+
+
+metrics_registry = MetricsRegistry()
+
+
+def current_request_metrics() -> RequestMetrics | None:
+    return g.get("request_metrics") if has_app_context() else None
+
+
+@contextmanager
+def serialization_timer() -> Iterator[None]:
+    """
+    Add the time spent in the block to the serialization time of the current request.
+    """
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics = current_request_metrics()
+        if metrics is not None:
+            metrics.serialization_seconds += time.perf_counter() - start
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    conn.info["query_started"] = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def stop_query_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    elapsed = time.perf_counter() - conn.info.pop("query_started")
+    metrics = current_request_metrics()
+    if metrics is not None:
+        metrics.queries += 1
+        metrics.db_seconds += elapsed
+
+
+class TimedJSONProvider(JSONProvider):
+    """
+    Wrap the JSON provider of the app to count the encoding as serialization time.
+    """
+
+    def __init__(self, app: Flask, provider: JSONProvider):
+        super().__init__(app)
+        self.provider = provider
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        with serialization_timer():
+            return self.provider.dumps(obj, **kwargs)
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return self.provider.loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        with serialization_timer():
+            return self.provider.response(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.provider, name)
+
+
+def _count_bytes(chunks: Iterable[str | bytes], metrics: RequestMetrics) -> Iterator[str | bytes]:
+    for chunk in chunks:
+        metrics.response_bytes += len(chunk.encode() if isinstance(chunk, str) else chunk)
+        yield chunk
+
+
+def add_request_metrics(app: Flask, db: Any) -> None:
+    """
+    Record the queries, database time, serialization time and response size of every request.
+
+    They are returned on the ``Server-Timing`` header and aggregated into the histograms served
+    in the Prometheus text format at ``/metrics``. A streamed body is produced after the header
+    is sent, so its work only reaches the histograms.
+    """
+    app.json = TimedJSONProvider(app, app.json)
+
+    @app.before_request
+    def start_request_metrics():
+        g.request_metrics = RequestMetrics()
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        metrics = g.pop("request_metrics", None)
+        if metrics is None or request.path == METRICS_PATH:
+            return response
+
+        labels = (request.method, request.url_rule.rule if request.url_rule else "unmatched", str(response.status_code))
+        response.headers["Server-Timing"] = metrics.server_timing()
+        if response.is_streamed:
+            g.request_metrics = metrics
+            response.response = _count_bytes(response.response, metrics)
+            response.call_on_close(lambda: metrics_registry.observe(metrics, *labels))
+        else:
+            metrics.response_bytes = response.calculate_content_length() or 0
+            metrics_registry.observe(metrics, *labels)
+        return response
+
+    def metrics_view() -> Response:
+        return Response(metrics_registry.render(dict(db.engines)), mimetype=PROMETHEUS_MIMETYPE)
+
+    app.add_url_rule(METRICS_PATH, endpoint="metrics", view_func=metrics_view)
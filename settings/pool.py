@@ -0,0 +1,85 @@
+import time
+from threading import Lock
+from typing import Any
+
+from sqlalchemy import Engine
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """
+    Time spent by requests waiting for a connection to be checked out of the pool.
+    """
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+        self._lock = Lock()
+
+    def observe(self, wait_seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkouts += 1
+            self.timeouts += timed_out
+            self.wait_seconds_total += wait_seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+
+    def stats(self) -> dict[str, float]:
+        return {
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_seconds_total": self.wait_seconds_total,
+            "wait_seconds_max": self.wait_seconds_max,
+            "wait_seconds_avg": self.wait_seconds_total / self.checkouts if self.checkouts else 0.0,
+        }
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    ``QueuePool`` that records how long each checkout waited for a free connection.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except TimeoutError:
+            self.metrics.observe(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.observe(time.perf_counter() - start)
+        return connection
+
+    def recreate(self) -> "InstrumentedQueuePool":
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+def get_pool_stats(engine: Engine) -> dict[str, float]:
+    """
+    Occupancy of the engine pool and, when it is instrumented, its checkout wait times.
+
+    ``saturation`` is the share of the pool capacity, including the overflow, that is
+    checked out; at ``1.0`` new requests queue for up to ``pool_timeout`` seconds.
+    """
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        return {}
+
+    capacity = pool.size() + max(pool._max_overflow, 0)
+    stats = {
+        "size": pool.size(),
+        "max_overflow": pool._max_overflow,
+        "checked_out": pool.checkedout(),
+        "overflow": max(pool.overflow(), 0),
+        "saturation": pool.checkedout() / capacity if capacity else 0.0,
+    }
+    if isinstance(pool, InstrumentedQueuePool):
+        stats.update(pool.metrics.stats())
+    return stats
@@ -0,0 +1,61 @@
+from typing import Any, TypeVar
+
+import sqlalchemy as sa
+from flask import Flask, request
+from flask_sqlalchemy.session import Session
+from sqlalchemy import event
+
+REPLICA_BIND_KEY = "replica"
+READ_ONLY_METHODS = ("GET", "HEAD", "OPTIONS")
+
+Statement = TypeVar("Statement")
+
+
+def on_replica(statement: Statement) -> Statement:
+    """
+    Mark a read-only ``Select`` or ``Query`` as safe to run on the read replica.
+    """
+    return statement.execution_options(use_replica=True)
+
+
+class RoutingSession(Session):
+    """
+    Session that runs the statements marked with ``on_replica`` on the replica engine.
+
+    The replica is only used while ``info["replica_reads"]`` is set, which happens for
+    read-only requests, and stops being used once the session flushes, so a request reads
+    its own writes. Without a replica bind everything runs on the primary.
+    """
+
+    def get_bind(
+        self,
+        mapper: Any | None = None,
+        clause: Any | None = None,
+        bind: sa.engine.Engine | sa.engine.Connection | None = None,
+        **kwargs: Any,
+    ) -> sa.engine.Engine | sa.engine.Connection:
+        if bind is None and self._reads_from_replica(clause) and REPLICA_BIND_KEY in self._db.engines:
+            return self._db.engines[REPLICA_BIND_KEY]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+    def _reads_from_replica(self, clause: Any | None) -> bool:
+        return (
+            self.info.get("replica_reads", False)
+            and isinstance(clause, sa.Executable)
+            and clause.get_execution_options().get("use_replica", False)
+        )
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def pin_to_primary(session: RoutingSession, flush_context: Any) -> None:
+    session.info["replica_reads"] = False
+
+
+def add_replica_routing(app: Flask, db: Any) -> None:
+    # The replica mirrors the schema of the primary, so it must not keep the metadata of its own
+    # that Flask-SQLAlchemy creates for every bind, which ``create_all`` would then try to apply.
+    db.metadatas.pop(REPLICA_BIND_KEY, None)
+
+    @app.before_request
+    def allow_replica_reads():
+        db.session.info["replica_reads"] = request.method in READ_ONLY_METHODS
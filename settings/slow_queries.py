@@ -0,0 +1,118 @@
+import logging
+import random
+import sys
+import time
+from logging.handlers import RotatingFileHandler
+from typing import Any
+
+from flask import Flask, has_request_context, request
+from sqlalchemy import Engine, event
+
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN (ANALYZE, BUFFERS) ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+MAX_PARAMETERS_LENGTH = 1000
+
+_explain_loggers: dict[str, logging.Logger] = {}
+
+
+def find_repository_method() -> str | None:
+    """
+    ``Class.method`` of the innermost repository frame on the stack, if a repository issued the statement.
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith("repositories."):
+            owner = frame.f_locals.get("self")
+            return f"{type(owner).__name__}.{frame.f_code.co_name}" if owner else frame.f_code.co_name
+        frame = frame.f_back
+    return None
+
+
+def current_route() -> str | None:
+    if not has_request_context():
+        return None
+    return f"{request.method} {request.url_rule.rule if request.url_rule else request.path}"
+
+
+def get_explain_logger(path: str, max_bytes: int, backup_count: int) -> logging.Logger:
+    """
+    Logger writing only to the rotating file at ``path``, shared by every app using the same file.
+    """
+    if path not in _explain_loggers:
+        logger = logging.getLogger(f"{__name__}.explain.{path}")
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+        handler = RotatingFileHandler(path, maxBytes=max_bytes, backupCount=backup_count, delay=True)
+        handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+        logger.addHandler(handler)
+        _explain_loggers[path] = logger
+    return _explain_loggers[path]
+
+
+def explain(conn: Any, statement: str, parameters: Any) -> list[tuple] | None:
+    """
+    Plan of a ``SELECT`` run on a new cursor of the same connection, so the results of the
+    statement itself are left untouched. Other statements are not explained, as
+    ``EXPLAIN ANALYZE`` executes them again.
+    """
+    prefix = EXPLAIN_PREFIXES.get(conn.dialect.name)
+    if prefix is None or not statement.lstrip().upper().startswith("SELECT"):
+        return None
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(prefix + statement, parameters)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def add_slow_query_log(app: Flask, db: Any) -> None:
+    """
+    Log the statements of the app engines slower than ``SLOW_QUERY_THRESHOLD_MS`` with their
+    parameters, the repository method that issued them and the route.
+
+    A ``SLOW_QUERY_EXPLAIN_RATE`` share of the slow ``SELECT`` statements is also explained,
+    with ``EXPLAIN (ANALYZE, BUFFERS)`` on PostgreSQL and ``EXPLAIN QUERY PLAN`` on SQLite, into
+    the rotating ``SLOW_QUERY_EXPLAIN_FILE``.
+    """
+    threshold = app.config["SLOW_QUERY_THRESHOLD_MS"] / 1000
+    if threshold <= 0:
+        return
+    explain_rate = app.config["SLOW_QUERY_EXPLAIN_RATE"]
+    explain_logger = None
+    if explain_rate > 0:
+        explain_logger = get_explain_logger(
+            app.config["SLOW_QUERY_EXPLAIN_FILE"],
+            app.config["SLOW_QUERY_EXPLAIN_MAX_BYTES"],
+            app.config["SLOW_QUERY_EXPLAIN_BACKUPS"],
+        )
+
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info["slow_query_started"] = time.perf_counter()
+
+    def log_slow_query(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info.pop("slow_query_started")
+        if elapsed < threshold:
+            return
+
+        caller, route = find_repository_method(), current_route()
+        app.logger.warning(
+            "Slow query (%.1f ms) in %s on %s: %s | parameters: %s",
+            elapsed * 1000, caller, route, statement, repr(parameters)[:MAX_PARAMETERS_LENGTH],
+        )
+        if explain_logger is not None and not executemany and random.random() < explain_rate:
+            plan = explain(conn, statement, parameters)
+            if plan is not None:
+                explain_logger.info(
+                    "%.1f ms in %s on %s\n%s\nparameters: %s\n%s\n",
+                    elapsed * 1000, caller, route, statement, repr(parameters)[:MAX_PARAMETERS_LENGTH],
+                    "\n".join(" | ".join(str(column) for column in row) for row in plan),
+                )
+
+    with app.app_context():
+        engines: list[Engine] = list(db.engines.values())
+    for engine in engines:
+        event.listen(engine, "before_cursor_execute", start_timer)
+        event.listen(engine, "after_cursor_execute", log_slow_query)
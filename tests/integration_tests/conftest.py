@@ -1,7 +1,14 @@
 import pytest
-from flask import Flask
+from flask import Flask, g
+from flask_migrate import upgrade
 from werkzeug.security import generate_password_hash
+
+from helpers.query_counter import assert_max_queries, count_queries
 from models.user import User
+from services.user.session_user import session_user_cache
+from main import create_app
+from settings.database import db
+from settings.seed import seed_data
 
 from resources.routers.auth_routes import auth_apis
 from resources.routers.project_routes import project_apis
@@ -14,6 +21,9 @@ def client():
 
     app = Flask(__name__)
     app.config["TESTING"] = True
+    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite://"
+    app.config["RESPONSE_CACHE_ENABLED"] = False
+    app.config["QUERY_BUDGET_MODE"] = "raise"
     app.secret_key = "testing-key"
 
     login_manager = flask_login.LoginManager()
@@ -27,9 +37,61 @@ def client():
     app.register_blueprint(project_apis, url_prefix="/projects")
     app.register_blueprint(user_apis, url_prefix="/users")
 
+    db.init_app(app)
+    with app.app_context():
+        db.create_all()
+
     return app.test_client()
 
 
+@pytest.fixture
+def database_app(tmp_path):
+    """
+    App bound to a throwaway SQLite database built by running the Alembic migrations.
+    """
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+        "QUERY_BUDGET_MODE": "raise",
+    })
+    with app.app_context():
+        upgrade()
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def database_client(database_app):
+    @database_app.before_request
+    def reset_login_user():
+        # Requests share the app context held by ``database_app``, and with it ``g``, where
+        # Flask-Login keeps the user of the previous request.
+        g.pop("_login_user", None)
+
+    seed_data(db.session)
+    session_user_cache.clear()
+    return database_app.test_client()
+
+
+@pytest.fixture
+def queries(database_app):
+    """
+    Statements sent to the database while the test runs.
+    """
+    with count_queries() as counter:
+        yield counter.statements
+
+
+@pytest.fixture
+def max_queries():
+    """
+    Context manager failing the test when the block runs more than the given number of queries.
+    """
+    return assert_max_queries
+
+
 @pytest.fixture
 def user():
     user = User(
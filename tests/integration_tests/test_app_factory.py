@@ -0,0 +1,27 @@
+from main import create_app
+from models.user import User
+from settings.database import db
+
+
+def test_create_app_does_not_touch_the_database(tmp_path):
+    path = tmp_path / "app.db"
+
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{path}"})
+
+    assert not path.exists()
+    assert {"project_apis", "user_apis", "auth_apis"} <= set(app.blueprints)
+
+
+def test_init_db_and_seed_db_commands(tmp_path):
+    app = create_app({"SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'app.db'}"})
+    runner = app.test_cli_runner()
+
+    init = runner.invoke(args=["init-db"])
+    seed = runner.invoke(args=["seed-db"])
+    runner.invoke(args=["seed-db"])
+
+    assert init.exit_code == 0, init.output
+    assert seed.exit_code == 0, seed.output
+    with app.app_context():
+        assert [user.email for user in db.session.query(User).all()] == ["admin@admin.com"]
+        db.session.remove()
@@ -0,0 +1,188 @@
+import json
+
+import pytest
+from flask import g
+from flask_migrate import upgrade
+from sqlalchemy import event
+
+from main import create_app
+from models.project import Project
+from models.task import Task
+from models.user import User
+from services.user.session_user import session_user_cache
+from settings.database import db
+from settings.seed import seed_data
+from tests.integration_tests.conftest import login_as
+
+PROJECT_BODY = {
+    "name": "Project",
+    "subject": "Subject",
+    "start_date": "2025-10-30T00:00:00Z",
+    "due_date": "2025-11-10T00:00:00Z",
+}
+
+
+@pytest.fixture
+def async_client(tmp_path):
+    """
+    Client of the app serving projects, tasks and users with the async views over aiosqlite.
+    """
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+        "ASYNC_VIEWS": True,
+    })
+
+    @app.before_request
+    def reset_login_user():
+        g.pop("_login_user", None)
+
+    with app.app_context():
+        upgrade()
+        seed_data(db.session)
+        project = Project(name="Seeded", created_by=1)
+        db.session.add(project)
+        db.session.commit()
+        db.session.add_all([Task(name=f"Task {index}", description="Task", project_id=project.id, created_by=1)
+                            for index in range(3)])
+        db.session.commit()
+        session_user_cache.clear()
+        yield app.test_client()
+        db.session.remove()
+
+
+def test_async_views_are_registered(async_client):
+    assert "async_project_apis" in async_client.application.blueprints
+    assert "project_apis" not in async_client.application.blueprints
+
+
+def test_get_projects(async_client):
+    response = async_client.get("/projects/")
+
+    assert response.status_code == 200
+    assert [project["name"] for project in response.json] == ["Seeded"]
+
+
+def test_get_projects_page_and_stream(async_client):
+    page = async_client.get("/projects/?limit=1")
+    stream = async_client.get("/projects/", headers={"Accept": "application/x-ndjson"})
+
+    assert page.json["items"][0]["name"] == "Seeded"
+    assert page.json["next_cursor"] is None
+    assert [json.loads(line)["name"] for line in stream.get_data(as_text=True).splitlines()] == ["Seeded"]
+
+
+def test_get_project_not_modified(async_client):
+    etag = async_client.get("/projects/1").headers["ETag"]
+
+    response = async_client.get("/projects/1", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize("path", ["/projects/", "/projects/1", "/projects/1/tasks", "/users/", "/users/1"])
+def test_conditional_get_opens_one_connection(async_client, path):
+    connections = []
+    engine = async_client.application.extensions["async_db"].engine
+    etag = async_client.get(path).headers["ETag"]
+    event.listen(engine.sync_engine, "connect", lambda *args: connections.append(args))
+
+    fresh = async_client.get(path)
+    not_modified = async_client.get(path, headers={"If-None-Match": etag})
+
+    assert (fresh.status_code, not_modified.status_code) == (200, 304)
+    assert len(connections) == 2
+
+
+def test_get_missing_project(async_client):
+    assert async_client.get("/projects/99").status_code == 404
+    assert async_client.get("/projects/99/tasks").status_code == 404
+
+
+def test_get_tasks_by_project(async_client):
+    tasks = async_client.get("/projects/1/tasks")
+    page = async_client.get("/projects/1/tasks?limit=2")
+
+    assert [task["name"] for task in tasks.json] == ["Task 0", "Task 1", "Task 2"]
+    assert len(page.json["items"]) == 2
+    assert page.json["next_cursor"] is not None
+
+
+def test_get_with_fields(async_client):
+    projects = async_client.get("/projects/?fields=name")
+    tasks = async_client.get("/projects/1/tasks?fields=name&limit=1")
+    users = async_client.get("/users/?fields=email")
+
+    assert projects.json == [{"id": 1, "name": "Seeded"}]
+    assert tasks.json["items"] == [{"id": 1, "name": "Task 0"}]
+    assert set(users.json[0]) == {"id", "email"}
+    assert async_client.get("/users/?fields=password").status_code == 400
+
+
+
+
+def test_get_projects_summary(async_client):
+    response = async_client.get("/projects/summary")
+
+    assert response.json == {
+        "items": [{"id": 1, "name": "Seeded", "task_count": 3, "overdue_count": 0, "next_due_date": None}],
+        "next_cursor": None,
+    }
+
+def test_search(async_client):
+    page = async_client.get("/search?q=task&limit=2")
+    following = async_client.get(f"/search?q=task&limit=2&cursor={page.json['next_cursor']}")
+
+    assert [item["name"] for item in page.json["items"] + following.json["items"]] == ["Task 0", "Task 1", "Task 2"]
+    assert following.json["next_cursor"] is None
+    assert async_client.get("/search?q=seed").json["items"][0]["type"] == "project"
+
+def test_project_and_task_writes(async_client):
+    login_as(async_client, User(id=1))
+
+    created = async_client.post("/projects/", json=PROJECT_BODY)
+    updated = async_client.put(f"/projects/{created.json['id']}", json={**PROJECT_BODY, "name": "Renamed"})
+    task = async_client.post(f"/projects/{created.json['id']}/tasks", json={**PROJECT_BODY, "description": "Task"})
+    bulk = async_client.post(f"/projects/{created.json['id']}/tasks/bulk", json=[
+        {**PROJECT_BODY, "description": "Task"}, {"description": "Missing name"}
+    ])
+    deleted = async_client.delete("/projects/1")
+
+    assert created.status_code == 200
+    assert updated.json["name"] == "Renamed"
+    assert task.json["name"] == "Project"
+    assert (len(bulk.json["created"]), len(bulk.json["failed"])) == (1, 1)
+    assert deleted.status_code == 200
+    assert async_client.get("/projects/1").status_code == 404
+
+
+def test_project_writes_require_manager(async_client):
+    assert async_client.post("/projects/", json=PROJECT_BODY).status_code == 401
+
+
+def test_user_views(async_client):
+    login_as(async_client, User(id=1))
+
+    created = async_client.post("/users/", json={
+        "email": "new@example.com",
+        "password": "password",
+        "username": "new",
+        "name": "New",
+        "user_type": 2,
+    })
+    updated = async_client.put(f"/users/{created.json['id']}", json={
+        "email": "new@example.com",
+        "username": "new",
+        "name": "Renamed",
+        "user_type": 1,
+    })
+    users = async_client.get("/users/")
+    self_delete = async_client.delete("/users/1")
+
+    assert created.json["type"] == {"id": 2, "user_type": "employee"}
+    assert updated.json["type"] == {"id": 1, "user_type": "manager"}
+    assert [user["username"] for user in users.json] == ["admin", "new"]
+    assert async_client.get(f"/users/{created.json['id']}").json["name"] == "Renamed"
+    assert self_delete.status_code == 422
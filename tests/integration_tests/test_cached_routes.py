@@ -0,0 +1,109 @@
+import pytest
+
+from helpers.response_cache import MemoryCacheBackend, response_cache
+from models.project import Project
+from models.user import User
+from settings.database import db
+from tests.integration_tests.conftest import login_as
+
+
+@pytest.fixture
+def cache(database_app, monkeypatch):
+    database_app.config["RESPONSE_CACHE_ENABLED"] = True
+    monkeypatch.setattr(response_cache, "backend", MemoryCacheBackend(maxsize=100, ttl=60))
+    monkeypatch.setattr(response_cache, "hits", 0)
+    monkeypatch.setattr(response_cache, "misses", 0)
+    return response_cache
+
+
+@pytest.fixture
+def project(database_client):
+    project = Project(name="Project", subject="Subject", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    return project
+
+
+def test_repeated_get_is_served_without_queries(database_client, cache, project, queries):
+    first = database_client.get("/projects/")
+    fetched = len(queries)
+    second = database_client.get("/projects/")
+
+    assert second.status_code == 200
+    assert second.json == first.json
+    assert second.headers["ETag"] == first.headers["ETag"]
+    assert len(queries) == fetched
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_cached_response_answers_if_none_match(database_client, cache, project):
+    etag = database_client.get(f"/projects/{project.id}").headers["ETag"]
+
+    response = database_client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert cache.stats()["hits"] == 1
+
+
+def test_write_invalidates_cached_list(database_client, cache, project):
+    database_client.get("/projects/")
+    login_as(database_client, User(id=1))
+    database_client.post("/projects/", json={
+        "name": "Another",
+        "subject": "Subject",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    response = database_client.get("/projects/")
+
+    assert [project["name"] for project in response.json] == ["Project", "Another"]
+    assert cache.stats()["hits"] == 0
+
+
+def test_task_write_invalidates_cached_tasks(database_client, cache, project):
+    assert database_client.get(f"/projects/{project.id}/tasks").json == []
+    login_as(database_client, User(id=1))
+    database_client.post(f"/projects/{project.id}/tasks", json={
+        "name": "Task",
+        "description": "Description",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    response = database_client.get(f"/projects/{project.id}/tasks")
+
+    assert [task["name"] for task in response.json] == ["Task"]
+
+
+
+def test_task_write_invalidates_cached_summary(database_client, cache, project):
+    assert database_client.get("/projects/summary").json["items"][0]["task_count"] == 0
+    login_as(database_client, User(id=1))
+    database_client.post(f"/projects/{project.id}/tasks", json={
+        "name": "Task",
+        "description": "Description",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    response = database_client.get("/projects/summary")
+
+    assert response.json["items"][0]["task_count"] == 1
+    assert response.json["items"][0]["overdue_count"] == 1
+
+def test_cache_is_keyed_by_role_and_query_string(database_client, cache, project):
+    database_client.get("/projects/")
+    database_client.get("/projects/?limit=1")
+    login_as(database_client, User(id=1))
+    database_client.get("/projects/")
+
+    assert cache.stats() == {"hits": 0, "misses": 3, "hit_ratio": 0.0}
+
+
+def test_streamed_responses_are_not_cached(database_client, cache, project):
+    database_client.get("/projects/?stream=true")
+    database_client.get("/projects/?stream=true")
+
+    assert cache.stats()["hits"] == 0
@@ -0,0 +1,88 @@
+import gzip
+import json
+
+import pytest
+from flask_migrate import upgrade
+
+from main import create_app
+from models.project import Project
+from models.task import Task
+from settings.database import db
+
+
+@pytest.fixture
+def compression_app(tmp_path):
+    """
+    App compressing responses with gzip, over a project with enough tasks to pass the minimum size.
+    """
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'compression.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+        "COMPRESSION_ENABLED": True,
+        "COMPRESSION_ENCODINGS": "gzip",
+        "COMPRESSION_MIN_SIZE": 500,
+    })
+    with app.app_context():
+        upgrade()
+        project = Project(name="Project", created_by=1)
+        db.session.add(project)
+        db.session.flush()
+        db.session.add_all([
+            Task(name=f"Task {index}", description="Compressed task", project_id=project.id, created_by=1)
+            for index in range(50)
+        ])
+        db.session.commit()
+        db.session.remove()
+    return app
+
+
+def test_large_response_is_compressed(compression_app):
+    client = compression_app.test_client()
+
+    plain = client.get("/projects/1/tasks")
+    compressed = client.get("/projects/1/tasks", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in plain.headers
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert compressed.headers["Vary"] == "Accept-Encoding"
+    assert int(compressed.headers["Content-Length"]) < int(plain.headers["Content-Length"])
+    assert json.loads(gzip.decompress(compressed.get_data())) == plain.json
+
+
+def test_small_response_is_not_compressed(compression_app):
+    response = compression_app.test_client().get("/projects/1", headers={"Accept-Encoding": "gzip"})
+
+    assert response.status_code == 200
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_streamed_response_is_compressed(compression_app):
+    client = compression_app.test_client()
+
+    plain = client.get("/projects/1/tasks")
+    streamed = client.get("/projects/1/tasks?stream=true", headers={"Accept-Encoding": "gzip"})
+
+    assert streamed.is_streamed
+    assert streamed.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(streamed.get_data())) == plain.json
+
+
+def test_compressed_etag_varies_and_revalidates(compression_app):
+    client = compression_app.test_client()
+    plain_etag = client.get("/projects/1/tasks").headers["ETag"]
+    etag = client.get("/projects/1/tasks", headers={"Accept-Encoding": "gzip"}).headers["ETag"]
+
+    not_modified = client.get("/projects/1/tasks", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+
+    assert etag == plain_etag[:-1] + '-gzip"'
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+
+
+def test_compression_is_off_by_default(database_client):
+    response = database_client.get("/projects/?stream=true", headers={"Accept-Encoding": "gzip"})
+
+    assert "Content-Encoding" not in response.headers
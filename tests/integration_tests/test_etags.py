@@ -0,0 +1,84 @@
+import pytest
+
+from models.project import Project
+from models.user import User
+from settings.database import db
+from tests.integration_tests.conftest import login_as
+
+
+@pytest.fixture
+def project(database_client):
+    project = Project(name="Project", subject="Subject", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    return project
+
+
+def test_get_project_not_modified(database_client, project):
+    response = database_client.get(f"/projects/{project.id}")
+    etag = response.headers["ETag"]
+
+    not_modified = database_client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert not_modified.status_code == 304
+    assert not_modified.headers["ETag"] == etag
+    assert not_modified.get_data() == b""
+
+
+def test_get_project_etag_changes_after_update(database_client, project):
+    etag = database_client.get(f"/projects/{project.id}").headers["ETag"]
+    login_as(database_client, User(id=1))
+    database_client.put(f"/projects/{project.id}", json={
+        "name": "Renamed",
+        "subject": "Subject",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    response = database_client.get(f"/projects/{project.id}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json["name"] == "Renamed"
+    assert response.headers["ETag"] != etag
+
+
+def test_get_nonexistent_project_has_no_etag(database_client):
+    response = database_client.get("/projects/9999", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+    assert "ETag" not in response.headers
+
+
+def test_get_tasks_etag_changes_after_task_created(database_client, project):
+    etag = database_client.get(f"/projects/{project.id}/tasks").headers["ETag"]
+    login_as(database_client, User(id=1))
+    database_client.post(f"/projects/{project.id}/tasks", json={
+        "name": "Task",
+        "description": "Task",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-02T00:00:00Z",
+    })
+
+    response = database_client.get(f"/projects/{project.id}/tasks", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert len(response.json) == 1
+
+
+def test_collection_etag_depends_on_query(database_client, project):
+    full = database_client.get("/projects/").headers["ETag"]
+    page = database_client.get("/projects/?limit=1").headers["ETag"]
+
+    response = database_client.get("/projects/?limit=1", headers={"If-None-Match": full})
+
+    assert full != page
+    assert response.status_code == 200
+
+
+def test_get_users_not_modified(database_client):
+    etag = database_client.get("/users/").headers["ETag"]
+    item_etag = database_client.get("/users/1").headers["ETag"]
+
+    assert database_client.get("/users/", headers={"If-None-Match": etag}).status_code == 304
+    assert database_client.get("/users/1", headers={"If-None-Match": item_etag}).status_code == 304
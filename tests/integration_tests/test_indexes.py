@@ -0,0 +1,82 @@
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import event, text
+
+from models.project import Project
+from repositories.project_repository import ProjectRepository
+from repositories.task_repository import TaskRepository
+from settings.database import db
+
+
+@pytest.fixture
+def seeded_database(database_app):
+    projects = [Project(name=f"Project {index}", created_by=1) for index in range(20)]
+    db.session.add_all(projects)
+    db.session.commit()
+    TaskRepository(db_session=db.session).create_many([
+        {
+            "name": f"Task {index}",
+            "description": "Seeded task",
+            "project_id": projects[index % len(projects)].id,
+            "created_by": 1,
+        }
+        for index in range(2000)
+    ])
+    db.session.execute(text("ANALYZE"))
+    return projects
+
+
+def explain(run):
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(db.engine, "before_cursor_execute", capture)
+    try:
+        run()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", capture)
+
+    statement, parameters = statements[-1]
+    plan = db.session.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return " ".join(row[-1] for row in plan)
+
+
+def test_task_list_uses_project_index(seeded_database):
+    repository = TaskRepository(db_session=db.session)
+    plan = explain(lambda: repository.get_all_tasks_by_project(project_id=seeded_database[3].id))
+
+    assert "ix_task_project_id" in plan
+    assert "SCAN task" not in plan
+
+
+def test_task_page_uses_project_id_index(seeded_database):
+    repository = TaskRepository(db_session=db.session)
+    plan = explain(lambda: repository.get_page_by_project(project_id=seeded_database[3].id, after_id=500, limit=51))
+
+    assert "ix_task_project_id_id" in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.mark.parametrize("order_by, index", [
+    ("due_date", "ix_task_project_id_due_date_id"),
+    ("-created_at", "ix_task_project_id_created_at_id"),
+])
+def test_sorted_task_page_uses_sort_index(seeded_database, order_by, index):
+    repository = TaskRepository(db_session=db.session)
+    plan = explain(lambda: repository.get_page_by_project(
+        project_id=seeded_database[3].id, after_id=None, limit=51, order_by=order_by
+    ))
+
+    assert index in plan
+    assert "TEMP B-TREE" not in plan
+
+
+def test_projects_summary_reads_tasks_from_due_date_index(seeded_database):
+    repository = ProjectRepository(db_session=db.session)
+    plan = explain(lambda: repository.get_summary_page(after_id=None, limit=11, now=datetime.now(timezone.utc)))
+
+    assert "COVERING INDEX ix_task_project_id_due_date_id" in plan
+    assert "SCAN task" not in plan
@@ -0,0 +1,20 @@
+from datetime import datetime
+
+from helpers.json_provider import OrjsonJSONProvider
+from models.project import Project
+from settings.database import db
+
+
+def test_responses_keep_http_dates_and_sorted_keys(database_client):
+    project = Project(name="Projeto ç", start_date=datetime(2025, 10, 29, 14, 22, 11), created_by=1)
+    db.session.add(project)
+    db.session.commit()
+
+    response = database_client.get(f"/projects/{project.id}")
+    streamed = database_client.get("/projects/?stream=true")
+
+    assert isinstance(database_client.application.json.provider, OrjsonJSONProvider)
+    assert response.json["start_date"] == "Wed, 29 Oct 2025 14:22:11 GMT"
+    assert response.json["name"] == "Projeto ç"
+    assert list(response.json) == sorted(response.json)
+    assert streamed.json == [response.json]
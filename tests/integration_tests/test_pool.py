@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import TimeoutError
+
+from settings.database import get_engine_options
+from settings.pool import get_pool_stats
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "1")
+    monkeypatch.setenv("DATABASE_MAX_OVERFLOW", "1")
+    monkeypatch.setenv("DATABASE_POOL_TIMEOUT", "0.01")
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **get_engine_options(url))
+    yield engine
+    engine.dispose()
+
+
+def test_pool_stats_report_saturation(engine):
+    with engine.connect():
+        half = get_pool_stats(engine)
+        with engine.connect():
+            full = get_pool_stats(engine)
+
+    assert half["checked_out"] == 1
+    assert half["saturation"] == 0.5
+    assert full["saturation"] == 1.0
+    assert full["checkouts"] == 2
+
+
+def test_pool_stats_count_checkout_timeouts(engine):
+    with engine.connect(), engine.connect():
+        with pytest.raises(TimeoutError):
+            engine.connect()
+
+    stats = get_pool_stats(engine)
+    assert stats["timeouts"] == 1
+    assert stats["wait_seconds_max"] >= 0.01
+    assert stats["saturation"] == 0.0
+
+
+def test_in_memory_engine_has_no_pool_stats():
+    assert get_pool_stats(create_engine("sqlite://", **get_engine_options("sqlite://"))) == {}
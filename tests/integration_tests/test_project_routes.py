@@ -94,6 +94,43 @@ def test_get_projects(mock_get_all_projects, client):
     assert len(response.json) > 0
 
 
+@patch("services.project.project_service.ProjectService.get_projects_page")
+def test_get_projects_paginated(mock_get_projects_page, client):
+    mock_get_projects_page.return_value = {
+        "items": [{"id": 1, "name": "Test Project", "subject": "X"}],
+        "next_cursor": "eyJpZCI6IDF9",
+    }
+    response = client.get("/projects/?limit=1")
+    assert response.status_code == 200
+    assert response.json["next_cursor"] == "eyJpZCI6IDF9"
+    mock_get_projects_page.assert_called_once_with(cursor=None, limit=1, fields=None)
+
+
+@patch("services.project.project_service.ProjectService.stream_projects")
+def test_get_projects_streamed(mock_stream_projects, client):
+    mock_stream_projects.return_value = iter(["[", '{"id": 1}', ',{"id": 2}', "]"])
+    response = client.get("/projects/?stream=true")
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert [project["id"] for project in response.json] == [1, 2]
+    mock_stream_projects.assert_called_once_with(ndjson=False, fields=None)
+
+
+@patch("services.project.project_service.ProjectService.stream_projects")
+def test_get_projects_ndjson(mock_stream_projects, client):
+    mock_stream_projects.return_value = iter(['{"id": 1}\n', '{"id": 2}\n'])
+    response = client.get("/projects/", headers={"Accept": "application/x-ndjson"})
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.get_data(as_text=True).splitlines() == ['{"id": 1}', '{"id": 2}']
+    mock_stream_projects.assert_called_once_with(ndjson=True, fields=None)
+
+
+def test_get_projects_invalid_limit(client):
+    response = client.get("/projects/?limit=0")
+    assert response.status_code == 400
+
+
 @patch("services.project.project_service.ProjectService.get_project")
 def test_get_project_by_id(mock_get_project_by_id, client):
     mock_get_project_by_id.return_value = {
@@ -180,14 +217,14 @@ def test_delete_project_as_employee_forbidden(
     assert response.status_code == 403
 
 
-@patch("repositories.project_repository.ProjectRepository.get_by_id")
+@patch("repositories.project_repository.ProjectRepository.exists")
 @patch("services.task.task_service.TaskService.create_task")
 @patch("flask_login.utils._get_user")
 def test_create_task_for_project(
-    mock__get_user, mock_create_task, mock_get_project, client, user, project
+    mock__get_user, mock_create_task, mock_project_exists, client, user, project
 ):
     login_as(client, user)
-    mock_get_project.return_value = project
+    mock_project_exists.return_value = True
     mock__get_user.return_value = user
     mock_create_task.return_value = {
         "id": 1,
@@ -209,14 +246,14 @@ def test_create_task_for_project(
     assert response.json["name"] == "Task 1"
 
 
-@patch("repositories.project_repository.ProjectRepository.get_by_id")
+@patch("repositories.project_repository.ProjectRepository.exists")
 @patch("flask_login.utils._get_user")
 def test_create_task_for_nonexistent_project(
-    mock__get_user, mock_create_task, client, user
+    mock__get_user, mock_project_exists, client, user
 ):
     login_as(client, user)
     mock__get_user.return_value = user
-    mock_create_task.return_value = None
+    mock_project_exists.return_value = False
 
     payload = {
         "name": "Task X",
@@ -229,12 +266,44 @@ def test_create_task_for_nonexistent_project(
     assert response.status_code == 404
 
 
-@patch("services.project.project_service.ProjectService.get_project_by_id")
-@patch("services.task.task_service.TaskService.get_tasks_by_project")
-def test_get_tasks_by_project(
-    mock_get_tasks_by_project_id, mock_get_project_by_id, client, project
+@patch("repositories.project_repository.ProjectRepository.exists")
+@patch("services.task.task_service.TaskService.create_tasks")
+@patch("flask_login.utils._get_user")
+def test_create_tasks_bulk(
+    mock__get_user, mock_create_tasks, mock_project_exists, client, user, project
+):
+    login_as(client, user)
+    mock_project_exists.return_value = True
+    mock__get_user.return_value = user
+    mock_create_tasks.return_value = {
+        "created": [{"id": 1, "name": "Task 1"}],
+        "failed": [{"index": 1, "errors": [{"field": "name", "message": "Field required"}]}],
+    }
+
+    payload = [{"name": "Task 1", "description": "Task description"}, {"description": "No name"}]
+
+    response = client.post("/projects/1/tasks/bulk", json=payload)
+    assert response.status_code == 200
+    assert response.json["created"][0]["name"] == "Task 1"
+    assert response.json["failed"][0]["index"] == 1
+    mock_create_tasks.assert_called_once_with(project_id=1, items=payload)
+
+
+@patch("services.task.task_service.TaskService.create_tasks")
+@patch("flask_login.utils._get_user")
+def test_create_tasks_bulk_as_employee_forbidden(
+    mock__get_user, mock_create_tasks, client, user_employee
 ):
-    mock_get_project_by_id.return_value = project
+    login_as(client, user_employee)
+    mock__get_user.return_value = user_employee
+
+    response = client.post("/projects/1/tasks/bulk", json=[{"name": "Task 1"}])
+    assert response.status_code == 403
+    mock_create_tasks.assert_not_called()
+
+
+@patch("services.task.task_service.TaskService.get_tasks_by_project")
+def test_get_tasks_by_project(mock_get_tasks_by_project_id, client):
     mock_get_tasks_by_project_id.return_value = [{"id": 1, "name": "Task 1"}]
     response = client.get("/projects/1/tasks")
     assert response.status_code == 200
@@ -242,12 +311,8 @@ def test_get_tasks_by_project(
     assert len(response.json) > 0
 
 
-@patch("services.project.project_service.ProjectService.get_project")
-@patch("services.task.task_service.TaskService.get_tasks_by_project")
-def test_get_tasks_for_nonexistent_project(
-    mock_get_tasks_by_project_id, mock_get_project_by_id, client
-):
-    mock_get_project_by_id.return_value = None
-    mock_get_tasks_by_project_id.return_value = []
+@patch("repositories.task_repository.TaskRepository.get_all_tasks_by_project")
+def test_get_tasks_for_nonexistent_project(mock_get_all_tasks_by_project, client):
+    mock_get_all_tasks_by_project.return_value = None
     response = client.get("/projects/9999/tasks")
     assert response.status_code == 404
@@ -0,0 +1,66 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from helpers.json_provider import format_http_date
+from models.project import Project
+from models.task import Task
+from settings.database import db
+
+
+@pytest.fixture
+def projects(database_client):
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    website, billing, empty = (Project(name=name, created_by=1) for name in ("Website", "Billing", "Empty"))
+    db.session.add_all([website, billing, empty])
+    db.session.commit()
+    due_dates = {
+        website.id: [
+            now - timedelta(days=2), now - timedelta(days=1), now + timedelta(days=3), now + timedelta(hours=1)
+        ],
+        billing.id: [None, now + timedelta(days=7)],
+    }
+    db.session.add_all([
+        Task(name=f"Task {index}", description="Task", project_id=project_id, due_date=due_date, created_by=1)
+        for project_id, dates in due_dates.items() for index, due_date in enumerate(dates)
+    ])
+    db.session.commit()
+    return website, billing, empty, now
+
+
+def test_get_projects_summary(database_client, projects, queries):
+    website, billing, empty, now = projects
+
+    response = database_client.get("/projects/summary")
+
+    assert response.status_code == 200
+    assert [
+        (item["name"], item["task_count"], item["overdue_count"]) for item in response.json["items"]
+    ] == [("Website", 4, 2), ("Billing", 2, 0), ("Empty", 0, 0)]
+    assert [item["next_due_date"] is not None for item in response.json["items"]] == [True, True, False]
+    assert response.json["next_cursor"] is None
+    assert len(queries) == 1
+
+
+def test_projects_summary_next_due_date(database_client, projects):
+    website, *_, now = projects
+    item = database_client.get("/projects/summary?limit=1").json["items"][0]
+
+    assert item["id"] == website.id
+    assert item["next_due_date"] == format_http_date(now + timedelta(hours=1))
+
+
+def test_projects_summary_pages(database_client, projects, queries):
+    first = database_client.get("/projects/summary?limit=2")
+    queries.clear()
+    second = database_client.get(f"/projects/summary?limit=2&cursor={first.json['next_cursor']}")
+
+    assert [item["name"] for item in first.json["items"]] == ["Website", "Billing"]
+    assert [item["name"] for item in second.json["items"]] == ["Empty"]
+    assert second.json["next_cursor"] is None
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize("query", ["limit=0", "cursor=invalid"])
+def test_projects_summary_invalid_query(database_client, projects, query):
+    assert database_client.get(f"/projects/summary?{query}").status_code == 400
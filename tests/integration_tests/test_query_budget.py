@@ -0,0 +1,72 @@
+import logging
+
+import pytest
+from flask import jsonify
+
+from decorators.decorators import query_budget
+from helpers.query_counter import QueryBudgetExceeded
+from main import create_app
+from models.project import Project
+from models.task import Task
+from settings.database import db
+
+
+def create_n_plus_one_app(tmp_path, mode):
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'budget.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+        "QUERY_BUDGET_MODE": mode,
+    })
+
+    @app.route("/task-counts")
+    @query_budget(2)
+    def task_counts():
+        return jsonify({project.name: len(project.tasks) for project in db.session.query(Project).all()})
+
+    with app.app_context():
+        db.create_all()
+        for index in range(3):
+            project = Project(name=f"Project {index}", created_by=1)
+            project.tasks = [Task(name="Task", description="Task", created_by=1)]
+            db.session.add(project)
+        db.session.commit()
+    return app
+
+
+def test_route_over_budget_fails(tmp_path):
+    app = create_n_plus_one_app(tmp_path, "raise")
+
+    with pytest.raises(QueryBudgetExceeded) as error:
+        app.test_client().get("/task-counts")
+
+    assert "GET /task-counts ran 4 queries, over its budget of 2" in str(error.value)
+    assert "3 x SELECT task." in str(error.value)
+
+
+def test_route_over_budget_logs_repeated_statements(tmp_path, caplog):
+    app = create_n_plus_one_app(tmp_path, "warn")
+
+    with caplog.at_level(logging.WARNING):
+        response = app.test_client().get("/task-counts")
+
+    assert response.status_code == 200
+    assert "GET /task-counts ran 4 queries, over its budget of 2" in caplog.text
+    assert "3 x SELECT task." in caplog.text
+
+
+def test_route_over_budget_is_ignored_when_off(tmp_path):
+    app = create_n_plus_one_app(tmp_path, "off")
+
+    assert app.test_client().get("/task-counts").status_code == 200
+
+
+def test_every_route_declares_a_query_budget(database_app):
+    views = {
+        endpoint: view for endpoint, view in database_app.view_functions.items()
+        if endpoint.split(".")[0] in database_app.blueprints
+    }
+
+    assert views
+    assert [endpoint for endpoint, view in views.items() if not hasattr(view, "query_budget")] == []
@@ -0,0 +1,116 @@
+import pytest
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+from settings.database import db
+from tests.integration_tests.conftest import login_as
+
+
+@pytest.fixture
+def project(database_client):
+    project = Project(name="Project", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    db.session.add_all([Task(name=f"Task {index}", description="Task", project_id=project.id, created_by=1)
+                        for index in range(3)])
+    db.session.commit()
+    return project
+
+
+def task_queries(queries):
+    """
+    Statements other than the ETag version lookup that precedes every conditional GET.
+    """
+    return [statement for statement in queries if "count(task.id)" not in statement]
+
+
+def test_get_tasks_by_project_is_a_single_query(database_client, project, queries, max_queries):
+    with max_queries(2):
+        response = database_client.get(f"/projects/{project.id}/tasks")
+
+    assert response.status_code == 200
+    assert len(response.json) == 3
+    assert len(task_queries(queries)) == 1
+    assert len(queries) == 2
+
+
+def test_get_tasks_page_by_project_is_a_single_query(database_client, project, queries):
+    response = database_client.get(f"/projects/{project.id}/tasks?limit=2")
+
+    assert response.status_code == 200
+    assert len(response.json["items"]) == 2
+    assert len(task_queries(queries)) == 1
+
+
+def test_get_tasks_by_project_without_tasks(database_client, queries):
+    project = Project(name="Empty", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    queries.clear()
+
+    response = database_client.get(f"/projects/{project.id}/tasks")
+
+    assert response.status_code == 200
+    assert response.json == []
+    assert len(task_queries(queries)) == 1
+
+
+def test_get_tasks_for_nonexistent_project_is_a_single_query(database_client, queries):
+    response = database_client.get("/projects/9999/tasks")
+
+    assert response.status_code == 404
+    assert len(task_queries(queries)) == 1
+
+
+def test_get_tasks_by_project_not_modified_skips_fetch(database_client, project, queries, max_queries):
+    etag = database_client.get(f"/projects/{project.id}/tasks").headers["ETag"]
+    queries.clear()
+
+    with max_queries(1):
+        response = database_client.get(f"/projects/{project.id}/tasks", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert task_queries(queries) == []
+    assert len(queries) == 1
+
+
+def test_create_task_checks_project_with_exists(database_client, project, queries):
+    login_as(database_client, User(id=1))
+
+    response = database_client.post(f"/projects/{project.id}/tasks", json={
+        "name": "New Task",
+        "description": "Task",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-02T00:00:00Z",
+    })
+
+    assert response.status_code == 200
+    project_queries = [statement for statement in queries if "FROM project" in statement]
+    assert len(project_queries) == 1
+    assert "EXISTS" in project_queries[0]
+
+
+def test_get_projects_query_count_does_not_grow_with_rows(database_client, project, max_queries):
+    db.session.add_all([Project(name=f"Project {index}", created_by=1) for index in range(20)])
+    db.session.commit()
+
+    with max_queries(2):
+        response = database_client.get("/projects/")
+
+    assert len(response.json) == 21
+
+
+def test_get_users_loads_user_types_in_the_same_query(database_client, max_queries):
+    db.session.add_all([
+        User(email=f"user{index}@example.com", password="password", username=f"user{index}", name=f"User {index}",
+             user_type=2, created_by=1)
+        for index in range(10)
+    ])
+    db.session.commit()
+
+    with max_queries(2):
+        response = database_client.get("/users/")
+
+    assert len(response.json) == 11
+    assert {user["type"]["user_type"] for user in response.json} == {"manager", "employee"}
@@ -0,0 +1,85 @@
+import pytest
+from flask_migrate import upgrade
+
+from main import create_app
+from models.project import Project
+from models.task import Task
+from models.user import User
+from repositories.project_repository import ProjectRepository
+from settings.database import db
+from settings.replica import REPLICA_BIND_KEY
+from settings.seed import seed_data
+from tests.integration_tests.conftest import login_as
+
+
+@pytest.fixture
+def replica_app(tmp_path):
+    """
+    App whose primary and read replica are two SQLite files holding different data.
+    """
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'primary.db'}",
+        "DATABASE_REPLICA_URI": f"sqlite:///{tmp_path / 'replica.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+    })
+    with app.app_context():
+        upgrade()
+        seed_data(db.session)
+        db.session.add(Project(name="Primary", created_by=1))
+        db.session.commit()
+
+        replica = db.engines[REPLICA_BIND_KEY]
+        db.metadata.create_all(replica)
+        with replica.begin() as connection:
+            connection.execute(Project.__table__.insert(), [{"id": 1, "name": "Replica", "created_by": 1}])
+            connection.execute(Task.__table__.insert(), [
+                {"name": "Replica task", "description": "Task", "project_id": 1, "created_by": 1}
+            ])
+        yield app
+        db.session.remove()
+
+
+@pytest.fixture
+def replica_client(replica_app):
+    return replica_app.test_client()
+
+
+def test_get_requests_read_from_replica(replica_client):
+    assert [project["name"] for project in replica_client.get("/projects/").json] == ["Replica"]
+    assert replica_client.get("/projects/1").json["name"] == "Replica"
+    assert [task["name"] for task in replica_client.get("/projects/1/tasks").json] == ["Replica task"]
+
+
+def test_writes_read_and_write_on_primary(replica_client, replica_app):
+    login_as(replica_client, User(id=1))
+
+    response = replica_client.put("/projects/1", json={
+        "name": "Renamed",
+        "subject": "Subject",
+        "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    assert response.status_code == 200
+    assert db.session.execute(Project.__table__.select()).one().name == "Renamed"
+    with db.engines[REPLICA_BIND_KEY].connect() as connection:
+        assert connection.execute(Project.__table__.select()).one().name == "Replica"
+
+
+def test_reads_after_a_write_go_to_primary(replica_app):
+    with replica_app.test_request_context("/projects/", method="GET"):
+        replica_app.preprocess_request()
+        repository = ProjectRepository(db_session=db.session)
+        before = [project.name for project in repository.get_all_rows()]
+
+        repository.create(Project(name="New", created_by=1))
+
+        assert before == ["Replica"]
+        assert [project.name for project in repository.get_all_rows()] == ["Primary", "New"]
+
+
+def test_reads_outside_requests_use_primary(replica_app):
+    db.session.remove()
+    assert [project.name for project in ProjectRepository(db_session=db.session).get_all()] == ["Primary"]
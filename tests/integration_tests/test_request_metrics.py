@@ -0,0 +1,66 @@
+import re
+
+import pytest
+
+from models.project import Project
+from models.task import Task
+from settings.database import db
+from settings.metrics import metrics_registry
+
+
+@pytest.fixture
+def project(database_client):
+    metrics_registry.clear()
+    project = Project(name="Project", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    db.session.add_all([Task(name=f"Task {index}", description="Task", project_id=project.id, created_by=1)
+                        for index in range(3)])
+    db.session.commit()
+    yield project
+    metrics_registry.clear()
+
+
+def test_get_projects_returns_server_timing(database_client, project):
+    response = database_client.get("/projects/")
+
+    timing = response.headers["Server-Timing"]
+    assert response.status_code == 200
+    assert re.match(r'db;dur=[\d.]+;desc="2 queries", serialize;dur=[\d.]+, total;dur=[\d.]+$', timing)
+
+
+def test_metrics_aggregate_requests_per_endpoint(database_client, project):
+    database_client.get(f"/projects/{project.id}/tasks")
+    database_client.get(f"/projects/{project.id}/tasks")
+
+    response = database_client.get("/metrics")
+    body = response.get_data(as_text=True)
+
+    labels = 'method="GET",endpoint="/projects/<int:project_id>/tasks",status="200"'
+    assert response.status_code == 200
+    assert response.mimetype == "text/plain"
+    assert f"http_request_duration_seconds_count{{{labels}}} 2" in body
+    assert f'http_request_db_queries_bucket{{{labels},le="2"}} 2' in body
+    assert f"http_request_serialization_seconds_count{{{labels}}} 2" in body
+    assert "response_cache_hits" in body
+    assert 'endpoint="/metrics"' not in body
+
+
+def test_metrics_record_the_size_of_streamed_responses(database_client, project):
+    response = database_client.get(f"/projects/{project.id}/tasks?stream=true")
+    size = len(response.get_data())
+    response.close()
+
+    body = database_client.get("/metrics").get_data(as_text=True)
+
+    labels = 'method="GET",endpoint="/projects/<int:project_id>/tasks",status="200"'
+    assert f"http_response_size_bytes_sum{{{labels}}} {float(size)}" in body
+
+
+def test_unmatched_requests_share_a_series(database_client, project):
+    database_client.get("/missing/1")
+    database_client.get("/missing/2")
+
+    body = database_client.get("/metrics").get_data(as_text=True)
+
+    assert 'http_request_duration_seconds_count{method="GET",endpoint="unmatched",status="404"} 2' in body
@@ -0,0 +1,114 @@
+import pytest
+
+from models.project import Project
+from models.task import Task
+from models.user import User
+from settings.database import db
+from tests.integration_tests.conftest import login_as
+
+
+@pytest.fixture
+def projects(database_client):
+    website = Project(name="Website redesign", subject="Marketing site", created_by=1)
+    billing = Project(name="Billing", subject="Invoices and website payments", created_by=1)
+    db.session.add_all([website, billing])
+    db.session.commit()
+    db.session.add_all([
+        Task(name="Review website mockups", description="Homepage", project_id=website.id, created_by=1),
+        Task(name="Deploy", description="Release the website", project_id=website.id, created_by=1),
+        Task(name="Send invoices", description="Monthly run", project_id=billing.id, created_by=1),
+    ])
+    db.session.commit()
+    return website, billing
+
+
+def results(response):
+    return [(item["type"], item["name"]) for item in response.json["items"]]
+
+
+def test_search_ranks_name_matches_first(database_client, projects):
+    response = database_client.get("/search?q=website")
+
+    assert response.status_code == 200
+    assert results(response)[:2] == [("project", "Website redesign"), ("task", "Review website mockups")]
+    assert sorted(results(response)[2:]) == [("project", "Billing"), ("task", "Deploy")]
+    assert [item["rank"] for item in response.json["items"]] == sorted(
+        (item["rank"] for item in response.json["items"]), reverse=True
+    )
+    assert response.json["next_cursor"] is None
+
+
+def test_search_matches_all_words_and_a_prefix_of_the_last(database_client, projects):
+    website, _ = projects
+
+    response = database_client.get("/search?q=website%20mock")
+
+    assert response.json["items"] == [{
+        "type": "task", "id": response.json["items"][0]["id"], "name": "Review website mockups",
+        "project_id": website.id, "rank": response.json["items"][0]["rank"],
+    }]
+    assert results(database_client.get("/search?q=INVOICE")) == [("task", "Send invoices"), ("project", "Billing")]
+    assert results(database_client.get("/search?q=invoice%20site")) == []
+
+
+def test_search_pages(database_client, projects, queries):
+    expected = results(database_client.get("/search?q=website"))
+    walked, cursor = [], ""
+    for _ in range(len(expected)):
+        queries.clear()
+        page = database_client.get(f"/search?q=website&limit=1{cursor}")
+        walked.extend(results(page))
+        assert len(queries) == 1
+        if page.json["next_cursor"] is None:
+            break
+        cursor = f"&cursor={page.json['next_cursor']}"
+
+    assert walked == expected
+
+
+def test_search_follows_writes(database_client, projects):
+    website, billing = projects
+    login_as(database_client, User(id=1))
+
+    database_client.post(f"/projects/{billing.id}/tasks", json={
+        "name": "Archive receipts", "description": "Yearly", "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+    database_client.put(f"/projects/{website.id}", json={
+        "name": "Storefront", "subject": "Marketing", "start_date": "2025-10-30T00:00:00Z",
+        "due_date": "2025-11-10T00:00:00Z",
+    })
+
+    assert results(database_client.get("/search?q=receipts")) == [("task", "Archive receipts")]
+    assert results(database_client.get("/search?q=redesign")) == []
+    assert results(database_client.get("/search?q=storefront")) == [("project", "Storefront")]
+
+
+def test_search_ranks_the_newest_candidates(database_client, projects, monkeypatch):
+    website, _ = projects
+    monkeypatch.setattr("services.search.search_service.SEARCH_MAX_CANDIDATES", 5)
+    db.session.add(Task(name="Design brief", description="Homepage", project_id=website.id, created_by=1))
+    db.session.commit()
+    db.session.add_all(
+        Task(name=f"Task {index}", description="Design review", project_id=website.id, created_by=1)
+        for index in range(20)
+    )
+    db.session.commit()
+    db.session.add(Task(name="Design", description="Homepage", project_id=website.id, created_by=1))
+    db.session.commit()
+
+    walked, cursor = [], ""
+    while True:
+        page = database_client.get(f"/search?q=design&limit=2{cursor}").json
+        walked.extend((item["type"], item["name"]) for item in page["items"])
+        if page["next_cursor"] is None:
+            break
+        cursor = f"&cursor={page['next_cursor']}"
+
+    assert walked == [("task", "Design"), *(("task", f"Task {index}") for index in range(16, 20))]
+    assert walked == results(database_client.get("/search?q=design"))
+
+
+@pytest.mark.parametrize("query", ["", "q=", "q=%2B%2A%22", "q=website&cursor=invalid", "q=website&limit=0"])
+def test_search_rejects_invalid_queries(database_client, projects, query):
+    assert database_client.get(f"/search?{query}").status_code == 400
@@ -0,0 +1,73 @@
+import logging
+
+import pytest
+from flask_migrate import upgrade
+
+from main import create_app
+from models.project import Project
+from settings.database import db
+
+
+@pytest.fixture
+def slow_query_app(tmp_path):
+    """
+    App logging every statement as slow and explaining all of them into a file under ``tmp_path``.
+    """
+    app = create_app({
+        "TESTING": True,
+        "SECRET_KEY": "testing-key",
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'slow.db'}",
+        "RESPONSE_CACHE_ENABLED": False,
+        "SLOW_QUERY_THRESHOLD_MS": 0.000001,
+        "SLOW_QUERY_EXPLAIN_RATE": 1.0,
+        "SLOW_QUERY_EXPLAIN_FILE": str(tmp_path / "slow_queries.log"),
+    })
+    with app.app_context():
+        upgrade()
+        db.session.add(Project(name="Project", created_by=1))
+        db.session.commit()
+        db.session.remove()
+    return app
+
+
+def test_slow_query_is_logged_with_repository_method_and_route(slow_query_app, caplog):
+    with caplog.at_level(logging.WARNING):
+        response = slow_query_app.test_client().get("/projects/?limit=10")
+
+    assert response.status_code == 200
+    messages = [record.getMessage() for record in caplog.records if "Slow query" in record.getMessage()]
+    page_query = next(message for message in messages if "ProjectRepository.get_page" in message)
+    assert "on GET /projects/" in page_query
+    assert "FROM project" in page_query
+    assert "parameters: (11," in page_query
+
+
+def test_slow_select_plan_is_written_to_the_explain_file(slow_query_app, tmp_path):
+    slow_query_app.test_client().get("/projects/")
+
+    for handler in logging.getLogger(f"settings.slow_queries.explain.{tmp_path / 'slow_queries.log'}").handlers:
+        handler.flush()
+    content = (tmp_path / "slow_queries.log").read_text()
+    assert "ProjectRepository.get_all_rows on GET /projects/" in content
+    assert "SCAN project" in content
+
+
+def test_writes_are_not_explained(slow_query_app, tmp_path):
+    with slow_query_app.app_context():
+        db.session.add(Project(name="Other", created_by=1))
+        db.session.commit()
+
+    explain_file = tmp_path / "slow_queries.log"
+    assert not explain_file.exists() or "INSERT" not in explain_file.read_text()
+
+
+def test_slow_query_log_is_disabled_with_a_zero_threshold(tmp_path, caplog):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'fast.db'}",
+        "SLOW_QUERY_THRESHOLD_MS": 0,
+    })
+
+    with caplog.at_level(logging.WARNING), app.app_context():
+        db.create_all()
+
+    assert "Slow query" not in caplog.text
@@ -0,0 +1,67 @@
+import json
+from datetime import datetime
+
+import pytest
+
+from models.project import Project
+from models.task import Task
+from settings.database import db
+
+
+@pytest.fixture
+def project(database_client):
+    project = Project(name="Project", subject="Subject", due_date=datetime(2025, 11, 10), created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    db.session.add_all([Task(name=f"Task {index}", description="Task", project_id=project.id, created_by=1)
+                        for index in range(3)])
+    db.session.commit()
+    return project
+
+
+def selects(queries, table):
+    return [statement for statement in queries if f"FROM {table}" in statement and "count(" not in statement]
+
+
+def test_get_projects_selects_only_the_fields(database_client, project, queries):
+    response = database_client.get("/projects/?fields=name,due_date")
+
+    assert response.status_code == 200
+    assert response.json == [{"id": project.id, "name": "Project", "due_date": "Mon, 10 Nov 2025 00:00:00 GMT"}]
+    statement = selects(queries, "project")[0]
+    assert "project.name" in statement
+    assert "project.subject" not in statement
+
+
+def test_get_tasks_page_and_stream_select_only_the_fields(database_client, project, queries):
+    page = database_client.get(f"/projects/{project.id}/tasks?fields=name&limit=2")
+    streamed = database_client.get(f"/projects/{project.id}/tasks?fields=name&stream=true")
+
+    assert page.json["items"] == [{"id": 1, "name": "Task 0"}, {"id": 2, "name": "Task 1"}]
+    assert page.json["next_cursor"] is not None
+    assert json.loads(streamed.get_data()) == [{"id": index + 1, "name": f"Task {index}"} for index in range(3)]
+    statements = selects(queries, "task")
+    assert statements
+    assert all("task.description" not in statement for statement in statements)
+
+
+def test_get_users_without_type_skips_the_join(database_client, queries):
+    response = database_client.get("/users/?fields=email")
+
+    assert response.status_code == 200
+    assert set(response.json[0]) == {"id", "email"}
+    statements = selects(queries, "user")
+    assert statements
+    assert all("JOIN" not in statement for statement in statements)
+
+
+def test_unknown_field_is_rejected(database_client, project):
+    assert database_client.get("/projects/?fields=name,secret").status_code == 400
+    assert database_client.get(f"/projects/{project.id}/tasks?fields=project_id&stream=true").status_code == 400
+
+
+def test_fields_are_part_of_the_etag(database_client, project):
+    full = database_client.get("/projects/").headers["ETag"]
+    sparse = database_client.get("/projects/?fields=name").headers["ETag"]
+
+    assert full != sparse
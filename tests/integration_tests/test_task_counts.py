@@ -0,0 +1,86 @@
+import pytest
+from sqlalchemy import update
+
+from helpers.response_cache import MemoryCacheBackend, response_cache
+from models.project import Project
+from models.user import User
+from settings.database import db
+from tests.integration_tests.conftest import login_as
+
+TASK_BODY = {
+    "name": "Task",
+    "description": "Description",
+    "start_date": "2025-10-30T00:00:00Z",
+    "due_date": "2025-11-10T00:00:00Z",
+}
+
+
+@pytest.fixture
+def cache(database_app, monkeypatch):
+    database_app.config["RESPONSE_CACHE_ENABLED"] = True
+    monkeypatch.setattr(response_cache, "backend", MemoryCacheBackend(maxsize=100, ttl=60))
+    return response_cache
+
+
+@pytest.fixture
+def projects(database_client):
+    projects = [Project(name=f"Project {index}", created_by=1) for index in range(3)]
+    db.session.add_all(projects)
+    db.session.commit()
+    return projects
+
+
+def task_counts(database_client):
+    return [project["task_count"] for project in database_client.get("/projects/").json]
+
+
+def test_task_writes_update_the_project_count(database_client, projects):
+    login_as(database_client, User(id=1))
+
+    database_client.post(f"/projects/{projects[0].id}/tasks", json=TASK_BODY)
+    database_client.post(f"/projects/{projects[1].id}/tasks/bulk", json=[TASK_BODY, TASK_BODY, {"name": "Invalid"}])
+
+    assert task_counts(database_client) == [1, 2, 0]
+    assert database_client.get(f"/projects/{projects[1].id}").json["task_count"] == 2
+
+
+def test_task_write_refreshes_cached_counts(database_client, cache, projects):
+    detail = f"/projects/{projects[0].id}"
+    assert database_client.get(detail).json["task_count"] == 0
+    assert task_counts(database_client) == [0, 0, 0]
+    login_as(database_client, User(id=1))
+
+    database_client.post(f"{detail}/tasks", json=TASK_BODY)
+
+    assert database_client.get(detail).json["task_count"] == 1
+    assert task_counts(database_client) == [1, 0, 0]
+
+
+def test_task_write_changes_the_project_etags(database_client, cache, projects):
+    detail = f"/projects/{projects[0].id}"
+    etags = {path: database_client.get(path).headers["ETag"] for path in (detail, "/projects/")}
+    login_as(database_client, User(id=1))
+
+    database_client.post(f"{detail}/tasks/bulk", json=[TASK_BODY])
+
+    for path, etag in etags.items():
+        response = database_client.get(path, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+    assert database_client.get(detail).json["task_count"] == 1
+
+
+def test_reconcile_task_counts_repairs_drift(database_app, database_client, projects):
+    login_as(database_client, User(id=1))
+    database_client.post(f"/projects/{projects[0].id}/tasks/bulk", json=[TASK_BODY, TASK_BODY])
+    database_client.post(f"/projects/{projects[2].id}/tasks", json=TASK_BODY)
+    db.session.execute(update(Project).where(Project.id != projects[2].id).values(task_count=7))
+    db.session.commit()
+    runner = database_app.test_cli_runner()
+
+    repaired = runner.invoke(args=["reconcile-task-counts", "--batch-size", "2"])
+    again = runner.invoke(args=["reconcile-task-counts"])
+
+    assert repaired.output == "Repaired the task count of 2 projects.\n"
+    assert again.output == "Repaired the task count of 0 projects.\n"
+    assert task_counts(database_client) == [2, 0, 1]
@@ -0,0 +1,100 @@
+from datetime import datetime
+
+import pytest
+
+from models.project import Project
+from models.task import Task
+from settings.database import db
+
+DUE_DATES = [datetime(2025, 11, 3), None, datetime(2025, 11, 1), datetime(2025, 11, 3), None, datetime(2025, 11, 2)]
+
+
+@pytest.fixture
+def project(database_client):
+    project = Project(name="Project", created_by=1)
+    db.session.add(project)
+    db.session.commit()
+    db.session.add_all([
+        Task(
+            name=f"{'Review' if index % 2 else 'Build'} {index}",
+            description="Task",
+            project_id=project.id,
+            start_date=datetime(2025, 10, index + 1),
+            due_date=due_date,
+            created_at=datetime(2025, 10, 10 - index),
+            created_by=1 + index % 3,
+        )
+        for index, due_date in enumerate(DUE_DATES)
+    ])
+    db.session.commit()
+    return project
+
+
+def names(response):
+    return [task["name"] for task in response.json]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("due_before=2025-11-03T00:00:00", ["Build 2", "Review 5"]),
+    ("due_after=2025-11-01T00:00:00", ["Build 0", "Review 3", "Review 5"]),
+    ("start_after=2025-10-04T00:00:00", ["Build 4", "Review 5"]),
+    ("name_prefix=Rev", ["Review 1", "Review 3", "Review 5"]),
+    ("created_by=2", ["Review 1", "Build 4"]),
+    ("name_prefix=Review&due_after=2025-11-01T00:00:00&created_by=3", ["Review 5"]),
+])
+def test_filter_tasks(database_client, project, query, expected):
+    response = database_client.get(f"/projects/{project.id}/tasks?{query}")
+
+    assert response.status_code == 200
+    assert names(response) == expected
+
+
+def test_name_prefix_is_not_a_pattern(database_client, project):
+    assert database_client.get(f"/projects/{project.id}/tasks?name_prefix=_uild").json == []
+
+
+def test_filters_leaving_no_task_still_find_the_project(database_client, project):
+    response = database_client.get(f"/projects/{project.id}/tasks?created_by=99")
+
+    assert response.status_code == 200
+    assert response.json == []
+    assert database_client.get("/projects/9999/tasks?created_by=99").status_code == 404
+
+
+@pytest.mark.parametrize("sort, expected", [
+    ("due_date", ["Build 2", "Review 5", "Build 0", "Review 3", "Review 1", "Build 4"]),
+    ("-due_date", ["Build 4", "Review 1", "Review 3", "Build 0", "Review 5", "Build 2"]),
+    ("-created_at", ["Build 0", "Review 1", "Build 2", "Review 3", "Build 4", "Review 5"]),
+    ("created_at", ["Review 5", "Build 4", "Review 3", "Build 2", "Review 1", "Build 0"]),
+])
+def test_sort_tasks_and_walk_their_pages(database_client, project, sort, expected):
+    path = f"/projects/{project.id}/tasks?sort={sort}"
+    walked, cursor = [], ""
+    for _ in range(len(expected)):
+        page = database_client.get(f"{path}&fields=name&limit=2{cursor}").json
+        walked.extend(task["name"] for task in page["items"])
+        if page["next_cursor"] is None:
+            break
+        cursor = f"&cursor={page['next_cursor']}"
+
+    assert names(database_client.get(path)) == expected
+    assert walked == expected
+    assert [task["name"] for task in database_client.get(f"{path}&stream=true").json] == expected
+
+
+def test_sorted_page_with_filters(database_client, project):
+    page = database_client.get(f"/projects/{project.id}/tasks?sort=-due_date&name_prefix=Review&limit=1").json
+    following = database_client.get(
+        f"/projects/{project.id}/tasks?sort=-due_date&name_prefix=Review&limit=5&cursor={page['next_cursor']}"
+    ).json
+
+    assert [task["name"] for task in page["items"]] == ["Review 1"]
+    assert [task["name"] for task in following["items"]] == ["Review 3", "Review 5"]
+    assert "sort_key" not in page["items"][0]
+
+
+def test_invalid_sort_and_cursor_are_rejected(database_client, project):
+    id_cursor = database_client.get(f"/projects/{project.id}/tasks?limit=1").json["next_cursor"]
+
+    assert database_client.get(f"/projects/{project.id}/tasks?sort=name").status_code == 400
+    assert database_client.get(f"/projects/{project.id}/tasks?sort=due_date&cursor={id_cursor}").status_code == 400
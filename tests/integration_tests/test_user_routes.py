@@ -27,6 +27,15 @@ def test_get_users(mock_get_users, client):
     assert response.json[0]["username"] == "test1"
 
 
+@patch("services.user.user_service.UserService.get_users_page")
+def test_get_users_paginated(mock_get_users_page, client):
+    mock_get_users_page.return_value = {"items": [{"id": 1, "username": "test1"}], "next_cursor": None}
+    response = client.get("/users/?limit=10&cursor=eyJpZCI6IDB9")
+    assert response.status_code == 200
+    assert response.json["items"][0]["username"] == "test1"
+    mock_get_users_page.assert_called_once_with(cursor="eyJpZCI6IDB9", limit=10, fields=None)
+
+
 @patch("services.user.user_service.UserService.get_user")
 def test_get_user_by_id(mock_get_user, client):
     mock_get_user.return_value = {"id": 123, "username": "testuser"}
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
@@ -6,3 +6,8 @@ import pytest
 @pytest.fixture
 def mock_repository():
     return Mock()
+
+
+@pytest.fixture
+def mock_async_repository():
+    return AsyncMock()
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+
+import pytest
+from werkzeug.exceptions import BadRequest, NotFound, UnprocessableEntity
+
+from models.project import Project
+from models.user import User
+from resources.request.project_request import ProjectRequest
+from services.project.async_project_service import AsyncProjectService
+from services.task.async_task_service import AsyncTaskService
+from services.user.async_user_service import AsyncUserService
+
+
+@pytest.fixture
+def fake_project():
+    return Project(
+        id=1,
+        name="Test Project",
+        subject="Testing",
+        start_date="2025-10-29 14:22:11.949",
+        due_date="2026-10-29 14:22:11.949",
+        created_at=datetime.now(timezone.utc),
+        created_by=1,
+        task_count=0,
+    )
+
+
+@pytest.fixture
+def fake_request():
+    return ProjectRequest(
+        name="New Project",
+        subject="New Subject",
+        start_date="2025-10-29 14:22:11.949",
+        due_date="2026-10-29 14:22:11.949",
+    )
+
+
+def test_get_project_not_found(mock_async_repository):
+    mock_async_repository.get_by_id.return_value = None
+
+    with pytest.raises(NotFound):
+        asyncio.run(AsyncProjectService(repository=mock_async_repository).get_project(99))
+
+
+def test_get_projects(mock_async_repository, fake_project):
+    mock_async_repository.get_all_rows.return_value = [fake_project]
+
+    result = asyncio.run(AsyncProjectService(repository=mock_async_repository).get_projects())
+
+    assert [project["name"] for project in result] == ["Test Project"]
+
+
+def test_create_project_invalidates_response_cache(mock_async_repository, fake_project, fake_request):
+    mock_async_repository.create.return_value = fake_project
+    with patch("services.project.async_project_service.current_user") as mock_current_user, patch(
+        "services.project.async_project_service.response_cache"
+    ) as mock_response_cache:
+        mock_current_user.id = 1
+        result = asyncio.run(AsyncProjectService(repository=mock_async_repository).create_project(fake_request))
+
+    assert result["id"] == 1
+    mock_async_repository.create.assert_awaited_once()
+    mock_response_cache.invalidate.assert_called_once_with("projects")
+
+
+@patch("services.project.async_project_service.is_invalid_request", return_value=True)
+def test_update_project_invalid_request(mock_invalid, mock_async_repository, fake_project, fake_request):
+    mock_async_repository.get_by_id.return_value = fake_project
+
+    with pytest.raises(BadRequest):
+        asyncio.run(AsyncProjectService(repository=mock_async_repository).update_project(1, fake_request))
+    mock_async_repository.update.assert_not_awaited()
+
+
+def test_get_tasks_by_missing_project(mock_async_repository):
+    mock_async_repository.get_all_tasks_by_project.return_value = None
+
+    with pytest.raises(NotFound):
+        asyncio.run(AsyncTaskService(repository=mock_async_repository).get_tasks_by_project(project_id=99))
+
+
+def test_delete_user_self_delete(mock_async_repository):
+    mock_async_repository.get_by_id.return_value = User(id=1)
+
+    with patch("services.user.async_user_service.current_user", Mock(id=1)):
+        with pytest.raises(UnprocessableEntity):
+            asyncio.run(AsyncUserService(repository=mock_async_repository).delete_user(1))
+    mock_async_repository.delete.assert_not_awaited()
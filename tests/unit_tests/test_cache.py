@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from helpers.cache import TTLCache
+
+
+def test_get_counts_hits_and_misses():
+    cache = TTLCache(maxsize=10, ttl=60)
+    assert cache.get("key") is None
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_entry_expires_after_ttl():
+    cache = TTLCache(maxsize=10, ttl=5)
+    with patch("helpers.cache.time.monotonic", return_value=100):
+        cache.set("key", "value")
+    with patch("helpers.cache.time.monotonic", return_value=106):
+        assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_delete_and_zero_size():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("key", "value")
+    cache.delete("key")
+    assert cache.get("key") is None
+
+    disabled = TTLCache(maxsize=0, ttl=60)
+    disabled.set("key", "value")
+    assert disabled.get("key") is None
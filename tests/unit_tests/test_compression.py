@@ -0,0 +1,75 @@
+import gzip
+
+import pytest
+from flask import Flask
+from werkzeug.datastructures import ETags
+
+from settings.compression import COMPRESSORS, compress, compress_chunks, get_encodings, matching_etag
+
+DECOMPRESSORS = {"gzip": gzip.decompress}
+if COMPRESSORS["br"] is not None:
+    import brotli
+    DECOMPRESSORS["br"] = brotli.decompress
+if COMPRESSORS["zstd"] is not None:
+    import zstandard
+    DECOMPRESSORS["zstd"] = lambda data: zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+ROW = b'{"id":%d,"name":"Task %d","description":"Task"}'
+BODY = b"[" + b",".join(ROW % (index, index) for index in range(200)) + b"]"
+
+
+@pytest.mark.parametrize("encoding", DECOMPRESSORS)
+def test_compress_round_trips(encoding):
+    compressed = compress(encoding, BODY, 5)
+
+    assert len(compressed) < len(BODY)
+    assert DECOMPRESSORS[encoding](compressed) == BODY
+
+
+@pytest.mark.parametrize("encoding", DECOMPRESSORS)
+def test_compress_chunks_flushes_every_chunk(encoding):
+    chunks = [BODY[index:index + 1000] for index in range(0, len(BODY), 1000)]
+
+    compressed = list(compress_chunks(encoding, chunks, 5))
+
+    assert len(compressed) >= len(chunks)
+    assert DECOMPRESSORS[encoding](b"".join(compressed)) == BODY
+
+
+def test_get_encodings_keeps_the_order_of_preference():
+    app = Flask(__name__)
+    app.config["COMPRESSION_ENCODINGS"] = " gzip , br,"
+
+    if COMPRESSORS["br"] is None:
+        with pytest.raises(ValueError, match="brotli"):
+            get_encodings(app)
+    else:
+        assert get_encodings(app) == ["gzip", "br"]
+
+
+def test_get_encodings_auto_skips_missing_packages(monkeypatch):
+    app = Flask(__name__)
+    app.config["COMPRESSION_ENCODINGS"] = "auto"
+    monkeypatch.setitem(COMPRESSORS, "zstd", None)
+    monkeypatch.setitem(COMPRESSORS, "br", None)
+
+    assert get_encodings(app) == ["gzip"]
+
+    app.config["COMPRESSION_ENCODINGS"] = "zstd,gzip"
+    with pytest.raises(ValueError, match="zstandard"):
+        get_encodings(app)
+
+
+def test_get_encodings_rejects_unknown_encoding():
+    app = Flask(__name__)
+    app.config["COMPRESSION_ENCODINGS"] = "gzip,lzma"
+
+    with pytest.raises(ValueError, match="lzma"):
+        get_encodings(app)
+
+
+def test_matching_etag_accepts_compressed_representations():
+    assert matching_etag("abc", ETags(["abc"])) == "abc"
+    assert matching_etag("abc", ETags(["other", "abc-gzip"])) == "abc-gzip"
+    assert matching_etag("abc", ETags(["abc-lzma"])) is None
+    assert matching_etag("abc", ETags(star_tag=True)) == "abc"
@@ -0,0 +1,39 @@
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from helpers.fields import parse_fields, response_model, select_fields
+from repositories.user_repository import USER_RESPONSE_COLUMNS, USER_RESPONSE_TYPE, select_user_rows
+from resources.response.task_response import TaskResponse
+from resources.response.user_response import UserResponse
+
+
+def test_parse_fields_keeps_model_order_and_adds_id():
+    assert parse_fields(" due_date,name ,", TaskResponse) == ("id", "name", "due_date")
+
+
+@pytest.mark.parametrize("fields", [None, "", " , "])
+def test_parse_fields_without_names_selects_everything(fields):
+    assert parse_fields(fields, TaskResponse) is None
+
+
+def test_parse_fields_rejects_unknown_fields():
+    with pytest.raises(BadRequest, match="password"):
+        parse_fields("name,password", UserResponse)
+
+
+def test_response_model_only_has_the_fields():
+    model = response_model(TaskResponse, ("id", "name"))
+
+    assert model is response_model(TaskResponse, ("id", "name"))
+    assert response_model(TaskResponse, None) is TaskResponse
+    assert model.model_validate({"id": 1, "name": "Task"}).model_dump() == {"id": 1, "name": "Task"}
+
+
+def test_select_fields_handles_the_aliased_user_type():
+    assert select_fields(USER_RESPONSE_COLUMNS, ("id", "type"))[-1] is USER_RESPONSE_TYPE
+    assert len(select_fields(USER_RESPONSE_COLUMNS, None)) == len(USER_RESPONSE_COLUMNS)
+
+
+def test_select_user_rows_only_joins_the_type_when_selected():
+    assert "JOIN" not in str(select_user_rows(("id", "email")))
+    assert "JOIN" in str(select_user_rows(("id", "type")))
@@ -0,0 +1,91 @@
+import json
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask
+from werkzeug.http import http_date
+
+from helpers import json_provider
+from helpers.json_provider import (
+    OrjsonJSONProvider, PydanticJSONProvider, StdlibJSONProvider, create_json_provider, format_http_date
+)
+
+PAYLOAD = [{
+    "name": "Task ü",
+    "id": 1,
+    "start_date": datetime(2025, 10, 29, 14, 22, 11),
+    "due_date": date(2025, 11, 2),
+    "budget": Decimal("1.50"),
+    "description": None,
+}]
+
+
+def make_app(**config) -> Flask:
+    app = Flask(__name__)
+    app.config.update(config)
+    return app
+
+
+def test_orjson_provider_matches_the_default_provider():
+    app = make_app()
+    default = app.json.response(PAYLOAD).get_data()
+    fast = OrjsonJSONProvider(app).response(PAYLOAD).get_data()
+
+    assert json.loads(fast) == json.loads(default)
+    assert json.loads(fast)[0]["start_date"] == "Wed, 29 Oct 2025 14:22:11 GMT"
+    assert list(json.loads(fast)[0]) == sorted(PAYLOAD[0])
+    assert fast.endswith(b"\n")
+
+
+def test_orjson_provider_encodes_iso_dates():
+    provider = OrjsonJSONProvider(make_app(), datetime_format="iso")
+
+    assert json.loads(provider.dumps(PAYLOAD))[0]["start_date"] == "2025-10-29T14:22:11"
+    assert provider.loads(b'{"a": 1}') == {"a": 1}
+
+
+def test_stdlib_provider_encodes_iso_dates():
+    provider = StdlibJSONProvider(make_app(), datetime_format="iso")
+
+    assert json.loads(provider.dumps(PAYLOAD))[0]["due_date"] == "2025-11-02"
+
+
+def test_pydantic_provider_encodes_iso_dates_in_field_order():
+    app = make_app()
+    document = json.loads(PydanticJSONProvider(app).response(PAYLOAD).get_data())
+
+    assert document[0]["start_date"] == "2025-10-29T14:22:11"
+    assert list(document[0]) == list(PAYLOAD[0])
+
+
+def test_create_json_provider_picks_orjson_when_installed():
+    assert isinstance(create_json_provider(make_app(JSON_PROVIDER="auto")), OrjsonJSONProvider)
+
+
+def test_create_json_provider_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(json_provider, "orjson", None)
+
+    assert isinstance(create_json_provider(make_app(JSON_PROVIDER="auto")), StdlibJSONProvider)
+    with pytest.raises(ValueError, match="requires the orjson package"):
+        create_json_provider(make_app(JSON_PROVIDER="orjson"))
+
+
+@pytest.mark.parametrize("config", [
+    {"JSON_PROVIDER": "ujson"},
+    {"JSON_DATETIME_FORMAT": "unix"},
+    {"JSON_PROVIDER": "pydantic", "JSON_DATETIME_FORMAT": "http"},
+])
+def test_create_json_provider_rejects_invalid_config(config):
+    with pytest.raises(ValueError):
+        create_json_provider(make_app(**config))
+
+
+@pytest.mark.parametrize("value", [
+    datetime(2025, 10, 29, 14, 22, 11, 949000),
+    datetime(2024, 2, 29, 23, 30, tzinfo=timezone(timedelta(hours=-3))),
+    datetime(1999, 12, 31, 0, 0, 5, tzinfo=timezone.utc),
+    date(2025, 1, 5),
+])
+def test_format_http_date_matches_werkzeug(value):
+    assert format_http_date(value) == http_date(value)
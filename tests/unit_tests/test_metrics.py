@@ -0,0 +1,53 @@
+from flask import Flask, g
+
+from settings.metrics import Histogram, RequestMetrics, TimedJSONProvider, serialization_timer
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("request_seconds", "Request time.", (0.1, 1.0), ("endpoint",))
+    histogram.observe(0.05, "/projects/")
+    histogram.observe(0.5, "/projects/")
+    histogram.observe(5, "/projects/")
+
+    lines = list(histogram.render())
+
+    assert lines[:2] == ["# HELP request_seconds Request time.", "# TYPE request_seconds histogram"]
+    assert 'request_seconds_bucket{endpoint="/projects/",le="0.1"} 1' in lines
+    assert 'request_seconds_bucket{endpoint="/projects/",le="1.0"} 2' in lines
+    assert 'request_seconds_bucket{endpoint="/projects/",le="+Inf"} 3' in lines
+    assert 'request_seconds_sum{endpoint="/projects/"} 5.55' in lines
+    assert 'request_seconds_count{endpoint="/projects/"} 3' in lines
+
+
+def test_serialization_timer_adds_to_the_request_metrics():
+    app = Flask(__name__)
+    with app.app_context():
+        g.request_metrics = RequestMetrics()
+        with serialization_timer():
+            pass
+
+        assert g.request_metrics.serialization_seconds > 0
+
+
+def test_serialization_timer_without_request_metrics():
+    with serialization_timer():
+        pass
+
+
+def test_timed_json_provider_delegates_to_the_wrapped_provider():
+    app = Flask(__name__)
+    provider = TimedJSONProvider(app, app.json)
+
+    assert provider.dumps({"b": 1, "a": 2}) == app.json.dumps({"b": 1, "a": 2})
+    assert provider.loads('{"a": 1}') == {"a": 1}
+    assert provider.sort_keys is app.json.sort_keys
+
+
+def test_server_timing_reports_queries_and_durations():
+    metrics = RequestMetrics()
+    metrics.queries = 2
+    metrics.db_seconds = 0.0125
+
+    header = metrics.server_timing()
+
+    assert header.startswith('db;dur=12.50;desc="2 queries", serialize;dur=0.00, total;dur=')
@@ -1,13 +1,16 @@
 from datetime import datetime, timezone
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
-from flask import Response
+from flask import Flask, Response
 from models.project import Project
 from resources.request.project_request import ProjectRequest
 from services.project.project_service import ProjectService
 from werkzeug.exceptions import BadRequest, NotFound
 
+from helpers.pagination import encode_cursor
+
 
 @pytest.fixture
 def service(mock_repository):
@@ -24,6 +27,7 @@ def fake_project():
         due_date="2026-10-29 14:22:11.949",
         created_at=datetime.now(timezone.utc),
         created_by=1,
+        task_count=0,
     )
 
 
@@ -52,6 +56,20 @@ def test_get_project_by_id_not_found(service, mock_repository):
         service.get_project_by_id(99)
 
 
+def test_ensure_project_exists(service, mock_repository):
+    mock_repository.exists.return_value = True
+
+    service.ensure_project_exists(project_id=1)
+    mock_repository.exists.assert_called_once_with(id=1)
+
+
+def test_ensure_project_exists_not_found(service, mock_repository):
+    mock_repository.exists.return_value = False
+
+    with pytest.raises(NotFound):
+        service.ensure_project_exists(project_id=99)
+
+
 @patch("services.project.project_service.is_invalid_request", return_value=False)
 def test_create_project_success(
     mock_is_invalid, service, mock_repository, fake_project, fake_request
@@ -69,6 +87,7 @@ def test_create_project_success(
             "due_date": datetime(2026, 10, 29, 14, 22, 11, 949000),
             "created_by": 1,
             "updated_by": None,
+            "task_count": 0,
         }
 
         mock_repository.create.assert_called_once()
@@ -82,7 +101,7 @@ def test_create_project_invalid_request(mock_is_invalid, service, fake_request):
 
 
 def test_get_projects_success(service, mock_repository, fake_project):
-    mock_repository.get_all.return_value = [fake_project]
+    mock_repository.get_all_rows.return_value = [fake_project]
     result = service.get_projects()
 
     assert result == [
@@ -94,11 +113,86 @@ def test_get_projects_success(service, mock_repository, fake_project):
             "due_date": datetime(2026, 10, 29, 14, 22, 11, 949000),
             "created_by": 1,
             "updated_by": None,
+            "task_count": 0,
         }
     ]
-    mock_repository.get_all.assert_called_once()
+    mock_repository.get_all_rows.assert_called_once()
+
+
+def test_stream_projects_json_array(service, mock_repository, fake_project):
+    mock_repository.iter_all.return_value = iter([fake_project, fake_project])
+
+    with Flask(__name__).app_context():
+        body = "".join(service.stream_projects())
+
+    assert body.startswith("[{") and body.endswith("}]")
+    assert body.count('"name": "Test Project"') == 2
+
+
+def test_stream_projects_ndjson(service, mock_repository, fake_project):
+    mock_repository.iter_all.return_value = iter([fake_project, fake_project])
+
+    with Flask(__name__).app_context():
+        lines = "".join(service.stream_projects(ndjson=True)).splitlines()
+
+    assert len(lines) == 2
+    assert all(line.startswith('{') for line in lines)
+
+
+def test_get_projects_page_with_next_cursor(service, mock_repository, fake_project):
+    next_project = Project(id=2, name="Next", created_by=1, task_count=0)
+    mock_repository.get_page.return_value = [fake_project, next_project]
+
+    result = service.get_projects_page(cursor=None, limit=1)
+
+    assert [item["id"] for item in result["items"]] == [1]
+    assert result["next_cursor"] == encode_cursor(1)
+    mock_repository.get_page.assert_called_once_with(after_id=None, limit=2, fields=None)
 
 
+def test_get_projects_page_last_page(service, mock_repository, fake_project):
+    mock_repository.get_page.return_value = [fake_project]
+
+    result = service.get_projects_page(cursor=encode_cursor(0), limit=10)
+
+    assert len(result["items"]) == 1
+    assert result["next_cursor"] is None
+    mock_repository.get_page.assert_called_once_with(after_id=0, limit=11, fields=None)
+
+
+def test_get_projects_page_limit_is_capped(service, mock_repository):
+    mock_repository.get_page.return_value = []
+
+    with patch("helpers.pagination.MAX_PAGE_SIZE", 100):
+        service.get_projects_page(cursor=None, limit=100000)
+
+    mock_repository.get_page.assert_called_once_with(after_id=None, limit=101, fields=None)
+
+
+def test_get_projects_page_invalid_cursor(service, mock_repository):
+    with pytest.raises(BadRequest):
+        service.get_projects_page(cursor="not-a-cursor", limit=10)
+    mock_repository.get_page.assert_not_called()
+
+
+
+def test_get_projects_summary(service, mock_repository):
+    due_date = datetime(2026, 11, 1)
+    mock_repository.get_summary_page.return_value = [
+        SimpleNamespace(id=1, name="Website", task_count=4, overdue_count=2, next_due_date=due_date),
+        SimpleNamespace(id=2, name="Empty", task_count=0, overdue_count=0, next_due_date=None),
+    ]
+
+    result = service.get_projects_summary(cursor=encode_cursor(0), limit=1)
+
+    assert result == {
+        "items": [{"id": 1, "name": "Website", "task_count": 4, "overdue_count": 2, "next_due_date": due_date}],
+        "next_cursor": encode_cursor(1),
+    }
+    kwargs = mock_repository.get_summary_page.call_args.kwargs
+    assert (kwargs["after_id"], kwargs["limit"]) == (0, 2)
+    assert kwargs["now"].tzinfo is timezone.utc
+
 def test_get_project_success(service, fake_project):
     with patch.object(service, "get_project_by_id", return_value=fake_project):
         result = service.get_project(1)
@@ -111,6 +205,7 @@ def test_get_project_success(service, fake_project):
             "due_date": datetime(2026, 10, 29, 14, 22, 11, 949000),
             "created_by": 1,
             "updated_by": None,
+            "task_count": 0,
         }
         service.get_project_by_id.assert_called_once_with(project_id=1)
 
@@ -134,6 +229,7 @@ def test_update_project_success(
             "due_date": datetime(2026, 10, 29, 14, 22, 11, 949000),
             "created_by": 1,
             "updated_by": 2,
+            "task_count": 0,
         }
         fake_project.update.assert_called_once_with(fake_request.__dict__)
         mock_repository.update.assert_called_once_with(fake_project)
@@ -156,3 +252,12 @@ def test_delete_project_success(service, mock_repository, fake_project):
         assert result.status_code == 200
         assert "deleted" in result.get_data(as_text=True)
         mock_repository.delete.assert_called_once_with(fake_project)
+
+
+def test_delete_project_invalidates_response_cache(service, fake_project):
+    with patch.object(service, "get_project_by_id", return_value=fake_project), patch(
+        "services.project.project_service.response_cache"
+    ) as mock_response_cache:
+        service.delete_project(1)
+
+    mock_response_cache.invalidate.assert_called_once_with("projects")
@@ -0,0 +1,44 @@
+import pytest
+from sqlalchemy import create_engine, text
+
+from helpers.query_counter import QueryBudgetExceeded, assert_max_queries, count_queries
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+def test_count_queries_groups_repeated_statements(engine):
+    with engine.connect() as connection, count_queries() as counter:
+        for value in range(3):
+            connection.execute(text("SELECT :value"), {"value": value})
+        connection.execute(text("SELECT  1"))
+
+    assert len(counter) == 4
+    assert counter.groups() == [("SELECT ?", 3), ("SELECT 1", 1)]
+    assert counter.report() == "  3 x SELECT ?\n  1 x SELECT 1"
+
+
+def test_nested_counters_both_count(engine):
+    with engine.connect() as connection, count_queries() as outer:
+        connection.execute(text("SELECT 1"))
+        with count_queries() as inner:
+            connection.execute(text("SELECT 2"))
+
+    assert len(outer) == 2
+    assert len(inner) == 1
+
+
+def test_assert_max_queries_fails_over_budget(engine):
+    with engine.connect() as connection:
+        with assert_max_queries(2):
+            connection.execute(text("SELECT 1"))
+            connection.execute(text("SELECT 2"))
+
+        with pytest.raises(QueryBudgetExceeded, match="Block ran 3 queries, over its budget of 2"):
+            with assert_max_queries(2):
+                for _ in range(3):
+                    connection.execute(text("SELECT 1"))
@@ -0,0 +1,99 @@
+import pytest
+from flask import Flask, Response
+
+from helpers.response_cache import (
+    MemoryCacheBackend, RedisCacheBackend, ResponseCache, enabled_by_default
+)
+
+
+class FakeRedis:
+    """
+    Minimal stand-in for the subset of the Redis client API used by ``RedisCacheBackend``.
+    """
+
+    def __init__(self):
+        self.values = {}
+        self.expiries = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value
+        self.expiries[key] = ex
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, b"0")) + 1).encode()
+        return int(self.values[key])
+
+
+def test_response_round_trips_through_memory_backend():
+    cache = ResponseCache(backend=MemoryCacheBackend(maxsize=10, ttl=60))
+    key = cache.make_key(("projects",), "/projects/", "", 1)
+    response = Response('{"id": 1}', status=200, mimetype="application/json")
+    response.set_etag("abc")
+
+    assert cache.get(key) is None
+    cache.set(key, response)
+    hit = cache.get(key)
+
+    assert hit.get_data() == b'{"id": 1}'
+    assert hit.mimetype == "application/json"
+    assert hit.get_etag() == ("abc", False)
+    assert cache.stats() == {"hits": 1, "misses": 1, "hit_ratio": 0.5}
+
+
+def test_invalidate_changes_the_key_of_the_namespace_only():
+    cache = ResponseCache(backend=MemoryCacheBackend(maxsize=10, ttl=60))
+    projects = cache.make_key(("projects",), "/projects/")
+    users = cache.make_key(("users",), "/users/")
+
+    cache.invalidate("projects")
+
+    assert cache.make_key(("projects",), "/projects/") != projects
+    assert cache.make_key(("users",), "/users/") == users
+
+
+def test_key_depends_on_every_part():
+    cache = ResponseCache(backend=MemoryCacheBackend(maxsize=10, ttl=60))
+
+    assert cache.make_key(("users",), "/users/", "limit=1", 1) != cache.make_key(("users",), "/users/", "limit=1", 2)
+    assert cache.make_key(("users",), "/users/", "limit=1", 1) != cache.make_key(("users",), "/users/", "limit=2", 1)
+
+
+def test_redis_backend_stores_entries_with_ttl():
+    client = FakeRedis()
+    cache = ResponseCache(backend=RedisCacheBackend(client=client, ttl=30))
+    key = cache.make_key(("tasks",), "/projects/1/tasks")
+
+    cache.set(key, Response("[]", mimetype="application/json"))
+    cache.invalidate("tasks")
+
+    assert cache.get(key).get_data() == b"[]"
+    assert client.expiries[key] == 30
+    assert client.get("generation:tasks") == b"1"
+    assert cache.make_key(("tasks",), "/projects/1/tasks") != key
+
+
+def test_is_enabled_follows_app_config():
+    cache = ResponseCache(backend=MemoryCacheBackend(maxsize=10, ttl=60))
+    app = Flask(__name__)
+    app.config["RESPONSE_CACHE_ENABLED"] = False
+
+    with app.app_context():
+        assert cache.is_enabled() is False
+
+
+@pytest.mark.parametrize("env, expected", [
+    ({}, False),
+    ({"RESPONSE_CACHE_ENABLED": "true"}, True),
+    ({"RESPONSE_CACHE_URL": "redis://localhost:6379/0"}, True),
+    ({"RESPONSE_CACHE_URL": "redis://localhost:6379/0", "RESPONSE_CACHE_ENABLED": "false"}, False),
+])
+def test_memory_backend_is_opt_in(monkeypatch, env, expected):
+    monkeypatch.delenv("RESPONSE_CACHE_ENABLED", raising=False)
+    monkeypatch.delenv("RESPONSE_CACHE_URL", raising=False)
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+
+    assert enabled_by_default() is expected
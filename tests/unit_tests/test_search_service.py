@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import pytest
+from werkzeug.exceptions import BadRequest
+
+from helpers.pagination import encode_rank_cursor
+from helpers.search import SEARCH_MAX_CANDIDATES, fts5_query, search_terms, tsquery
+from services.search.search_service import SearchService
+
+
+@pytest.fixture
+def service(mock_repository):
+    return SearchService(repository=mock_repository)
+
+
+def result(kind, id, rank):
+    project_id = None if kind == "project" else 1
+    return SimpleNamespace(type=kind, id=id, name=f"{kind} {id}", project_id=project_id, rank=rank)
+
+
+def test_search_terms():
+    assert search_terms("  Design-Review, \"Q4\" déploi*") == ["design", "review", "q4", "déploi"]
+    assert len(search_terms(" ".join(["word"] * 20))) == 8
+
+
+def test_search_terms_without_words():
+    with pytest.raises(BadRequest):
+        search_terms("*&|\"_")
+
+
+def test_full_text_queries():
+    assert tsquery(["design", "rev"]) == "design & rev:*"
+    assert fts5_query(["design", "rev"]) == '"design" "rev"*'
+    assert fts5_query(["rev"]) == '"rev"*'
+    assert tsquery(["design", "r"]) == "design & r"
+    assert fts5_query(["design", "r"]) == '"design" "r"'
+
+
+def test_search_page(service, mock_repository):
+    mock_repository.search.return_value = [result("project", 1, 0.5), result("task", 4, 0.25), result("task", 5, 0.25)]
+
+    page = service.search(q="Design", cursor=None, limit=2)
+
+    assert [item["id"] for item in page["items"]] == [1, 4]
+    assert page["next_cursor"] == encode_rank_cursor(0.25, "task", 4)
+    mock_repository.search.assert_called_once_with(
+        terms=["design"], after=None, limit=3, max_candidates=SEARCH_MAX_CANDIDATES
+    )
+
+
+def test_search_next_page(service, mock_repository):
+    mock_repository.search.return_value = [result("task", 5, 0.25)]
+
+    page = service.search(q="design", cursor=encode_rank_cursor(0.25, "task", 4), limit=2)
+
+    assert page == {
+        "items": [{"type": "task", "id": 5, "name": "task 5", "project_id": 1, "rank": 0.25}],
+        "next_cursor": None,
+    }
+    assert mock_repository.search.call_args.kwargs["after"] == (0.25, "task", 4)
+
+
+def test_search_invalid_cursor(service, mock_repository):
+    with pytest.raises(BadRequest):
+        service.search(q="design", cursor="invalid", limit=None)
+    mock_repository.search.assert_not_called()
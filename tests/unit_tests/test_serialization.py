@@ -0,0 +1,38 @@
+from datetime import datetime
+
+from sqlalchemy import create_engine, text
+
+from helpers.serialization import dump, dump_all, list_adapter
+from models.project import Project
+from resources.response.project_response import ProjectResponse
+from resources.response.task_response import TaskResponse
+
+
+def test_dump_all_matches_dumping_each_row():
+    projects = [
+        Project(id=1, name="First", subject="Subject", start_date=datetime(2025, 1, 1), due_date=None,
+                created_by=1, updated_by=None, task_count=0),
+        Project(id=2, name="Second", subject=None, start_date=None, due_date=datetime(2025, 2, 1),
+                created_by=1, updated_by=2, task_count=3),
+    ]
+
+    assert dump_all(ProjectResponse, projects) == [dump(ProjectResponse, project) for project in projects]
+
+
+def test_dump_all_reads_projected_rows():
+    engine = create_engine("sqlite://")
+    with engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT 7 AS id, 'Task' AS name, 'Description' AS description, "
+            "NULL AS start_date, NULL AS due_date, 1 AS created_by"
+        )).all()
+    engine.dispose()
+
+    assert dump_all(TaskResponse, rows) == [{
+        "id": 7, "name": "Task", "description": "Description", "start_date": None, "due_date": None, "created_by": 1,
+    }]
+
+
+def test_list_adapter_is_built_once_per_model():
+    assert list_adapter(TaskResponse) is list_adapter(TaskResponse)
+    assert list_adapter(TaskResponse) is not list_adapter(ProjectResponse)
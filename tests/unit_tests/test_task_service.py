@@ -1,11 +1,13 @@
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import pytest
 from models.task import Task
 from resources.request.task_request import TaskRequest
 from services.task.task_service import TaskService
-from werkzeug.exceptions import BadRequest
+from werkzeug.exceptions import BadRequest, NotFound
+
+from helpers.pagination import encode_cursor
 
 
 @pytest.fixture
@@ -70,25 +72,15 @@ def test_create_task_invalid_request(task_service, sample_request):
 def test_get_tasks_by_project_success(task_service, mock_repository, sample_task):
     mock_repository.get_all_tasks_by_project.return_value = [sample_task]
 
-    fake_response = Mock()
-    fake_response.model_dump.return_value = {
-        "id": sample_task.id,
-        "name": sample_task.name,
-        "description": sample_task.description,
-        "project_id": sample_task.project_id,
-        "created_at": sample_task.created_at.isoformat(),
-    }
-
-    with patch(
-        "services.task.task_service.TaskResponse.model_validate",
-        return_value=fake_response,
-    ) as mock_from_orm:
-        result = task_service.get_tasks_by_project(project_id=100)
+    result = task_service.get_tasks_by_project(project_id=100)
 
-        assert len(result) == 1
-        assert result[0]["name"] == "Test Task"
-        mock_repository.get_all_tasks_by_project.assert_called_once_with(project_id=100)
-        mock_from_orm.assert_called_once_with(sample_task)
+    assert len(result) == 1
+    assert result[0]["id"] == sample_task.id
+    assert result[0]["name"] == "Test Task"
+    assert result[0]["due_date"] == datetime(2026, 10, 29, 14, 22, 11, 949000)
+    mock_repository.get_all_tasks_by_project.assert_called_once_with(
+        project_id=100, fields=None, filters=None, order_by="id"
+    )
 
 
 def test_get_tasks_by_project_empty(task_service, mock_repository):
@@ -96,3 +88,94 @@ def test_get_tasks_by_project_empty(task_service, mock_repository):
 
     result = task_service.get_tasks_by_project(project_id=999)
     assert result == []
+
+
+def test_get_tasks_by_project_not_found(task_service, mock_repository):
+    mock_repository.get_all_tasks_by_project.return_value = None
+
+    with pytest.raises(NotFound):
+        task_service.get_tasks_by_project(project_id=999)
+
+
+def test_get_tasks_page_by_project_not_found(task_service, mock_repository):
+    mock_repository.get_page_by_project.return_value = None
+
+    with pytest.raises(NotFound):
+        task_service.get_tasks_page_by_project(project_id=999, cursor=None, limit=10)
+
+
+def test_get_tasks_page_by_project_with_next_cursor(task_service, mock_repository, sample_task):
+    next_task = Task(id=2, name="Next", description="Next", project_id=100, created_by=1)
+    mock_repository.get_page_by_project.return_value = [sample_task, next_task]
+
+    result = task_service.get_tasks_page_by_project(project_id=100, cursor=None, limit=1)
+
+    assert [item["id"] for item in result["items"]] == [1]
+    assert result["next_cursor"] == encode_cursor(1)
+    mock_repository.get_page_by_project.assert_called_once_with(
+        project_id=100, after_id=None, after_value=None, limit=2, order_by="id", fields=None, filters=None
+    )
+
+
+def test_create_tasks_reports_failed_items(task_service, mock_repository, sample_task):
+    mock_repository.create_many.return_value = [sample_task]
+    items = [
+        {
+            "name": "Test Task",
+            "description": "Sample description",
+            "start_date": "2025-10-29 14:22:11.949",
+            "due_date": "2026-10-29 14:22:11.949",
+        },
+        {"description": "Missing name"},
+        {"name": "Missing dates", "description": "Sample description"},
+    ]
+
+    with patch("services.task.task_service.current_user") as mock_current_user:
+        mock_current_user.id = 1
+        result = task_service.create_tasks(project_id=100, items=items)
+
+    assert [task["id"] for task in result["created"]] == [1]
+    assert [item["index"] for item in result["failed"]] == [1, 2]
+    assert result["failed"][0]["errors"][0]["field"] == "name"
+    rows = mock_repository.create_many.call_args.args[0]
+    assert len(rows) == 1
+    assert rows[0]["project_id"] == 100
+    assert rows[0]["created_by"] == 1
+
+
+def test_create_tasks_all_invalid_skips_insert(task_service, mock_repository):
+    with patch("services.task.task_service.current_user"):
+        result = task_service.create_tasks(project_id=100, items=[{"name": None}])
+
+    assert result["created"] == []
+    assert len(result["failed"]) == 1
+    mock_repository.create_many.assert_not_called()
+
+
+def test_create_tasks_invalidates_response_cache(task_service, mock_repository, sample_task):
+    mock_repository.create_many.return_value = [sample_task]
+    item = {
+        "name": "Test Task",
+        "description": "Sample description",
+        "start_date": "2025-10-29 14:22:11.949",
+        "due_date": "2026-10-29 14:22:11.949",
+    }
+
+    with patch("services.task.task_service.current_user"), patch(
+        "services.task.task_service.response_cache"
+    ) as mock_response_cache:
+        task_service.create_tasks(project_id=100, items=[item])
+
+    mock_response_cache.invalidate.assert_called_once_with("tasks", "projects")
+
+
+@pytest.mark.parametrize("items", [None, [], {"name": "Not a list"}])
+def test_create_tasks_invalid_batch(task_service, items):
+    with pytest.raises(BadRequest):
+        task_service.create_tasks(project_id=100, items=items)
+
+
+def test_create_tasks_batch_too_large(task_service):
+    with patch("services.task.task_service.MAX_BULK_TASKS", 2):
+        with pytest.raises(BadRequest):
+            task_service.create_tasks(project_id=100, items=[{}, {}, {}])
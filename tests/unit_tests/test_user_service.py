@@ -4,10 +4,13 @@ from unittest.mock import Mock, patch
 import pytest
 from flask import Response
 from models.user import User
+from models.user_type import UserType
 from resources.request.user_request import CreateUserRequest
 from resources.response.user_response import UserResponse
 from resources.response.user_type_response import UserTypeResponse
+from services.user.session_user import SessionUser, session_user_cache
 from services.user.user_service import UserService
+from helpers.pagination import encode_cursor
 from werkzeug.exceptions import (
     BadRequest,
     Conflict,
@@ -38,6 +41,13 @@ def fake_user():
     return user
 
 
+@pytest.fixture(autouse=True)
+def clear_session_user_cache():
+    session_user_cache.clear()
+    yield
+    session_user_cache.clear()
+
+
 @pytest.fixture
 def fake_request():
     return CreateUserRequest(
@@ -62,6 +72,25 @@ def test_get_user_by_id_not_found(service, mock_repository):
         service.get_user_by_id(999)
 
 
+def test_load_session_user_is_cached(service, mock_repository):
+    mock_repository.get_session_fields.return_value = Mock(id=1, user_type=1)
+
+    first = service.load_session_user(user_id=1)
+    second = service.load_session_user(user_id=1)
+
+    assert isinstance(first, SessionUser)
+    assert first is second
+    assert (first.id, first.user_type, first.get_id()) == (1, 1, "1")
+    mock_repository.get_session_fields.assert_called_once_with(id=1)
+
+
+def test_load_session_user_not_found(service, mock_repository):
+    mock_repository.get_session_fields.return_value = None
+
+    assert service.load_session_user(user_id=99) is None
+    assert session_user_cache.get(99) is None
+
+
 def test_get_user_by_email_success(service, mock_repository, fake_user):
     mock_repository.get_by_email.return_value = fake_user
     result = service.get_user_by_email("test@example.com")
@@ -152,29 +181,26 @@ def test_create_user_conflict(mock_invalid, service, fake_user, fake_request):
 
 
 def test_get_users_success(service, mock_repository, fake_user):
-    mock_repository.get_all.return_value = [fake_user]
-    with patch("services.user.user_service.current_user") as mock_current_user:
-        mock_current_user.id = 2
-        with patch(
-            "services.user.user_service.UserResponse.model_validate",
-            return_value=UserResponse.model_validate(
-                {
-                    "id": 1,
-                    "email": fake_user.email,
-                    "name": fake_user.name,
-                    "username": fake_user.username,
-                    "type": UserTypeResponse(id=1, user_type="manager"),
-                    "created_by": 2,
-                    "updated_by": None,
-                }
-            ),
-        ) as mock_response:
-            result = service.get_users()
+    fake_user.type = UserType(id=1, user_type="manager")
+    mock_repository.get_all_rows.return_value = [fake_user]
+
+    result = service.get_users()
+
+    assert len(result) == 1
+    assert result[0]["id"] == 1
+    assert result[0]["type"] == {"id": 1, "user_type": "manager"}
+    mock_repository.get_all_rows.assert_called_once()
 
-            assert len(result) == 1
-            assert result[0]["id"] == 1
-            mock_response.assert_called_once()
-            mock_repository.get_all.assert_called_once()
+
+def test_get_users_page_success(service, mock_repository, fake_user):
+    fake_user.type = UserType(id=1, user_type="manager")
+    mock_repository.get_page.return_value = [fake_user]
+
+    result = service.get_users_page(cursor=encode_cursor(5), limit=1)
+
+    assert result["items"][0]["id"] == 1
+    assert result["next_cursor"] is None
+    mock_repository.get_page.assert_called_once_with(after_id=5, limit=2, fields=None)
 
 
 def test_get_user_success(service, fake_user):
@@ -227,6 +253,19 @@ def test_update_user_success(
             mock_response.assert_called_once()
 
 
+@patch("services.user.user_service.is_invalid_request", return_value=False)
+def test_update_user_invalidates_session_user(mock_invalid, service, mock_repository, fake_user, fake_request):
+    session_user_cache.set(1, SessionUser(id=1, user_type=1))
+    mock_repository.update.return_value = fake_user
+    with patch("services.user.user_service.current_user") as mock_current_user, patch.object(
+        service, "get_user_by_id", return_value=fake_user
+    ), patch("services.user.user_service.UserResponse.model_validate"):
+        mock_current_user.id = 2
+        service.update_user(1, fake_request)
+
+    assert session_user_cache.get(1) is None
+
+
 @patch("services.user.user_service.is_invalid_request", return_value=True)
 def test_update_user_invalid_request(mock_invalid, service, fake_user, fake_request):
     with patch.object(service, "get_user_by_id", return_value=fake_user):
@@ -245,6 +284,17 @@ def test_delete_user_success(service, mock_repository, fake_user):
         mock_repository.delete.assert_called_once_with(fake_user)
 
 
+def test_delete_user_invalidates_session_user(service, fake_user):
+    session_user_cache.set(1, SessionUser(id=1, user_type=1))
+    with patch.object(service, "get_user_by_id", return_value=fake_user), patch(
+        "services.user.user_service.current_user"
+    ) as mock_current_user:
+        mock_current_user.id = 2
+        service.delete_user(1)
+
+    assert session_user_cache.get(1) is None
+
+
 def test_delete_user_self_delete(service, fake_user):
     current_user = Mock(id=1)
     with patch("services.user.user_service.current_user", current_user), patch.object(